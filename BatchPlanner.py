@@ -0,0 +1,110 @@
+# BatchPlanner.py
+#
+# This is a Python module used by the scripts that generate Vensim command scripts.  It is not
+# meant to be run on its own.
+#
+# Before a command script is written, each generator describes the batch it is about to write
+# (how many runs it contains, which output variables are logged, and for which years), and this
+# module estimates how long Vensim will take to perform the batch and how much data it will write.
+# If the estimate exceeds the budget set below, the generator either warns the user or refuses to
+# write the command script.  A generator whose DryRun setting is True reports the estimate without
+# writing a command script at all.
+
+
+# Settings
+# --------
+# SecondsPerRun is the typical time Vensim takes to perform one run on the computer that will perform
+# the batch, including writing its results.  To calibrate it, note the time a batch starts and the time
+# it finishes, and divide the elapsed seconds by the number of runs in the batch.  The time per run
+# depends mostly on the model and the computer, rather than on the policies being run.
+SecondsPerRun = 20
+ScriptStartSeconds = 60 # The time Vensim takes to load the model at the start of each command script
+
+# Budget.  Use 0 for no limit.
+MaxBatchHours = 0 # The longest a batch is expected to take, from start to finish
+MaxOutputMegabytes = 0 # The most data (in megabytes) a batch is expected to write to its output files
+BudgetAction = "Warn" # "Warn" prints a warning and writes the command script anyway.  "Refuse" writes an error instead.
+
+BatchPlanFile = "BatchPlan.txt" # Each estimate is written to this file, as well as shown in the console
+
+# Vensim writes each value in an output file as a number of up to about eleven characters, such as
+# "1.23457e+06", followed by a tab.
+BytesPerValue = 12
+
+
+# Functions
+# ---------
+
+# Returns the output variables listed in an OutputVarsFile.  (Each subscripted variable that is listed
+# without subscripts produces one output row per element, so the number of rows may be larger.)  If the
+# OutputVarsFile does not exist yet, no output variables are returned, and the estimate of the output
+# size will be zero.
+def ReadOutputVars(OutputVarsFile):
+	import os
+	if not os.path.exists(OutputVarsFile):
+		return []
+	VarsFile = open(OutputVarsFile, 'r')
+	OutputVars = [Line.strip() for Line in VarsFile if Line.strip()]
+	VarsFile.close()
+	return OutputVars
+
+# Estimates the size of a batch, writes the estimate to the console and the BatchPlanFile, and checks it
+# against the budget.
+#   OutputScript is the generator's command script, to which an error is written if the batch is refused
+#   Runs is the number of runs in the batch
+#   OutputVarsFile, FirstYear and FinalYear are the generator's settings of the same names
+#   LabelLength is the length of the text each run adds to every row it writes (after the ":" of VDF2TAB)
+#   ParallelScripts is the number of command scripts that will be performed at the same time
+#   CommandScripts is the total number of command scripts in the batch
+#   OutputFiles is the number of files the results are written to, if it differs from CommandScripts
+#   DryRun is the generator's DryRun setting
+# If DryRun is True, or if the batch is refused, the generator stops once the estimate is written.
+def PlanBatch(OutputScript, Runs, OutputVarsFile, FirstYear, FinalYear, LabelLength, ParallelScripts = 1, CommandScripts = 1, OutputFiles = None, DryRun = False):
+
+	OutputVars = ReadOutputVars(OutputVarsFile)
+	Years = int(FinalYear) - int(FirstYear) + 1
+
+	# Each command script loads the model once, and the runs are divided evenly among the command
+	# scripts performed at the same time, so the batch takes as long as the longest of them.
+	RunsPerParallelScript = -(-Runs // ParallelScripts)
+	ScriptsPerParallelScript = -(-CommandScripts // ParallelScripts)
+	BatchSeconds = RunsPerParallelScript * SecondsPerRun + ScriptsPerParallelScript * ScriptStartSeconds
+
+	# Each run writes one row per output variable, containing the variable name, the run's label
+	# columns, and one value per year.  We add one "Time" row per output file.
+	if OutputFiles is None:
+		OutputFiles = CommandScripts
+	BytesPerRun = sum(len(OutputVar) + 1 + LabelLength + 1 + Years * BytesPerValue for OutputVar in OutputVars)
+	OutputBytes = Runs * BytesPerRun + OutputFiles * (5 + LabelLength + Years * 5)
+	OutputMegabytes = OutputBytes / 1000000
+
+	Report = []
+	Report.append("Batch plan for " + OutputScript)
+	Report.append("  Runs: " + str(Runs) + " in " + str(CommandScripts) + " command script(s), " + str(ParallelScripts) + " performed at a time")
+	Report.append("  Expected time: " + str(round(BatchSeconds / 3600, 2)) + " hours (at " + str(SecondsPerRun) + " seconds per run)")
+	Report.append("  Expected output: " + str(round(OutputMegabytes, 2)) + " MB (" + str(len(OutputVars)) + " output variables in " + OutputVarsFile + " from " + str(FirstYear) + " through " + str(FinalYear) + ")")
+
+	OverBudget = []
+	if MaxBatchHours > 0 and BatchSeconds / 3600 > MaxBatchHours:
+		OverBudget.append("Expected time exceeds MaxBatchHours (" + str(MaxBatchHours) + " hours).")
+	if MaxOutputMegabytes > 0 and OutputMegabytes > MaxOutputMegabytes:
+		OverBudget.append("Expected output exceeds MaxOutputMegabytes (" + str(MaxOutputMegabytes) + " MB).")
+	for Problem in OverBudget:
+		Report.append("  Warning: " + Problem)
+
+	f = open(BatchPlanFile, 'w')
+	f.write("\n".join(Report) + "\n")
+	f.close()
+	print("\n".join(Report))
+
+	if OverBudget and BudgetAction == "Refuse" and not DryRun:
+		f = open(OutputScript, 'w')
+		ErrorMessage = "Error: The batch is over budget.  " + "  ".join(OverBudget) + "  See " + BatchPlanFile + " for details."
+		f.write(ErrorMessage)
+		f.close()
+		import sys
+		sys.exit(ErrorMessage)
+
+	if DryRun:
+		import sys
+		sys.exit()
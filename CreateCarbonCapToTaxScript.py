@@ -5,7 +5,9 @@
 # This is a Python script that is used to generate a Vensim command script.
 # The Vensim command script will enable Vensim to produce a series of simulations
 # that allow you to determine the carbon tax rate (lever setting) equivalent
-# to a particular carbon cap policy that you wish to model.
+# to a particular carbon cap policy that you wish to model.  Once Vensim has
+# performed the runs, FindEquivalentCarbonTax.py can find the price that meets
+# the cap in each year from their results.
 #
 # DOCUMENTATION
 # Detailed documentation on how to use this script is available online at:
@@ -94,9 +96,63 @@ Sectors = {
 }
 
 
+
 # Other Settings
 # --------------
 RunName = "MostRecentRun" # The desired name for all runs performed.  Used as the filename for the .vdfx files that Vensim creates.
+DryRun = False # If True, the script estimates the time and output size of the batch (see BatchPlanner.py) without writing the command script
+ScriptMode = "Sweep" # "Sweep" writes a command script with one run for each whole-number price from PriceFloor through PriceCeiling.
+					 # "Solve" performs runs itself, searching for the price that meets a carbon cap (see "Solving for the Price" below).
+					 # "SolveTrajectory" searches for a price in each year that meets a cap in that year (see "Solving for a
+					 # Price Trajectory" below).
+
+
+# Solving for the Price
+# ---------------------
+# Rather than writing a command script that tests every price from the PriceFloor through the PriceCeiling,
+# this script can perform the runs itself (using a simulator backend from SimulatorBackends.py), choosing
+# each price to test based on the results of the runs before it.  The search starts with the PriceFloor and
+# the PriceCeiling, and it stops once the total emissions of the covered sectors in CapYear (as given by
+# "Output Total CO2e Emissions by Sector") are within EmissionsTolerance of CapEmissions, or once the
+# price is known to within PriceTolerance.  The result is usually found in fewer than 10 runs, and it is
+# not limited to whole-number prices.
+#
+# "Bisection" tests the price halfway between the highest price known to be too low and the lowest price
+# known to be high enough.  "Secant" instead estimates the price at which emissions would meet the cap,
+# assuming emissions change in a straight line between those two prices.  (To keep its progress steady
+# when emissions respond to price along a curve, it uses the Illinois variant of this method.)  Both
+# methods assume that a higher carbon tax never increases emissions.
+#
+# Every run is added to the RunResultsFile, and each run's price and covered emissions are written to
+# the SolverLogFile.  To test the search without Vensim, set SimulatorBackend to "Stub".
+SimulatorBackend = "Vensim" # The name of a backend in SimulatorBackends.py
+CapYear = 2030 # The year in which the cap must be met
+CapEmissions = 100 # The total emissions of the covered sectors allowed by the cap in CapYear, in the units of the model's
+				   # output variables (for example, metric tons CO2e)
+EmissionsTolerance = 0.1 # The search stops when covered emissions are at least this close to CapEmissions
+PriceTolerance = 0.01 # The search stops when the price is known at least this precisely
+MaxSolverRuns = 20 # The most runs the search may perform, including the runs at the PriceFloor and PriceCeiling
+SearchMethod = "Secant" # "Secant" or "Bisection"
+SolverScript = "CarbonCapSolverScript.cmd" # The desired filename for the command script of each run performed by the search
+SolverRunResultsFile = "CarbonCapSolverRun.tsv" # The desired filename for the results of each run performed by the search
+SolverOutputVarsFile = "CarbonCapSolverOutputVars.lst" # The desired filename for the list of variables logged by the search (and by each run in "Sweep" mode)
+SolverLogFile = "CarbonCapSolverLog.tsv" # The desired filename for the list of prices tested by the search
+
+# When solving for a price trajectory, CapYear and CapEmissions are not used.  Instead, CapTrajectory gives the cap
+# in each year (in the same units as CapEmissions), and a price is found for each of these years in turn.  The
+# PriceFloor, PriceCeiling, tolerances and SearchMethod apply to each year, and MaxSolverRuns limits the runs for
+# each year.  Unlike in "Sweep" mode, the prices are not adjusted for the policy implementation schedule (see
+# "Solving for a Price Trajectory" below).
+CapTrajectory = {
+	2025: 120,
+	2030: 100,
+	2035: 80
+}
+TrajectoryFile = "CarbonCapTrajectory.cin" # The desired filename for the changes file giving the solved price trajectory
+TrajectoryTableFile = "CarbonCapTrajectory.tsv" # The desired filename for the table of solved prices by year
+SolverTrajectoryFile = "CarbonCapSolverTrajectory.cin" # The desired filename for the changes file of each run performed by the search
+WarmStart = False # If True, start each year's search at the price in the TrajectoryTableFile from the previous solution
+WarmStartStep = 0.1 # When warm starting, the first change from the previous price, as a fraction of that price
 
 
 
@@ -129,35 +185,63 @@ if PriceCeiling <= PriceFloor:
 	sys.exit(ErrorMessage)
 
 
-# Generate Vensim Command Script
-# ------------------------------
-# We begin by creating a new file to serve as the Vensim command script (overwriting
-# any older version at that filename).  We then tell Vensim to load
-# the model file, and we give it a RUNNAME that will be used for all runs.  (It is
-# overwritten each run, and the Vensim command file generated by this script
-# always contains multiple runs.)
-f = open(OutputScript, 'w')
-f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
-f.write("SIMULATE>RUNNAME|" + RunName + "\n")
-
-# The following options may be useful in certain cases, but they may slow Vensim down
-# or increase the odds that Vensim crashes during execution of a batch of runs (though
-# it is hard to tell for sure).  These lines are usually best left commented out.
-# f.write("SPECIAL>NOINTERACTION\n")
-# f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
-f.write("\n")
-
-
-# Only for the first entry in the TSV file, we wish to include the "Time" row and
-# overwrite any existing TSV file of that name.  Other entries append to the TSV file.
-FirstEntryDone = False
-
-
-# We start the price at the price floor, and we will increment by one
-# currency unit with each model run.
-CurrentPrice = PriceFloor
+# Logged Variables
+# ----------------
+# Every run, in every mode, logs the variables in the OutputVarsFile, plus "Output Total CO2e Emissions by Sector"
+# for each covered sector (which may not be in the OutputVarsFile), so we write a list of both to the
+# SolverOutputVarsFile.  The covered emissions are needed to solve for the price, and FindEquivalentCarbonTax.py
+# reads them from the RunResultsFile written in "Sweep" mode.
+def WriteSolverOutputVarsFile():
+	SolverOutputVars = ["Output Total CO2e Emissions by Sector[" + Sector + "]" for Sector in CoveredSectors]
+	VarsFile = open(OutputVarsFile, 'r')
+	for Line in VarsFile:
+		if Line.strip() and Line.strip() not in SolverOutputVars:
+			SolverOutputVars.append(Line.strip())
+	VarsFile.close()
+	VarsFile = open(SolverOutputVarsFile, 'w')
+	VarsFile.write("\n".join(SolverOutputVars) + "\n")
+	VarsFile.close()
+
+WriteSolverOutputVarsFile()
+
+
+# Planning the Batch
+# ------------------
+# The batch contains one run per price from the PriceFloor through the PriceCeiling (or, when solving for
+# the price, no more than MaxSolverRuns runs per year solved).  We estimate its time and output size before writing the
+# command script.  BatchPlanner.py stops the script here if DryRun is True or if the batch is over the
+# budget set in BatchPlanner.py.
+import BatchPlanner
+LongestRunLabel = len("CurrentPrice=\t" + str(PriceCeiling) + "\tCovered sectors=" + ", ".join(CoveredSectors))
+if ScriptMode == "SolveTrajectory":
+	BatchPlanner.PlanBatch(OutputScript, MaxSolverRuns * len(CapTrajectory), SolverOutputVarsFile, FirstYear, FinalYear, LongestRunLabel, CommandScripts = MaxSolverRuns * len(CapTrajectory), OutputFiles = 1, DryRun = DryRun)
+elif ScriptMode == "Solve":
+	BatchPlanner.PlanBatch(OutputScript, MaxSolverRuns, SolverOutputVarsFile, FirstYear, FinalYear, LongestRunLabel, CommandScripts = MaxSolverRuns, OutputFiles = 1, DryRun = DryRun)
+else:
+	BatchPlanner.PlanBatch(OutputScript, int(PriceCeiling - PriceFloor) + 1, SolverOutputVarsFile, FirstYear, FinalYear, LongestRunLabel, DryRun = DryRun)
+
+
+# Writing Runs
+# ------------
+# We define a function that begins a new Vensim command script (overwriting any older version at that
+# filename).  It tells Vensim to load the model file, and we give it a RUNNAME that will be used for all
+# runs.  (It is overwritten each run.)
+def WriteScriptHeader(f):
+	f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
+	f.write("SIMULATE>RUNNAME|" + RunName + "\n")
+
+	# The following options may be useful in certain cases, but they may slow Vensim down
+	# or increase the odds that Vensim crashes during execution of a batch of runs (though
+	# it is hard to tell for sure).  These lines are usually best left commented out.
+	# f.write("SPECIAL>NOINTERACTION\n")
+	# f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
+	f.write("\n")
 
-while CurrentPrice <= PriceCeiling:
+# Next, we define a function that writes a single run at CurrentPrice, logging the variables in
+# ScriptOutputVarsFile to ScriptRunResultsFile.  Only for the first entry in the TSV file do we wish
+# to include the "Time" row and overwrite any existing TSV file of that name.  Other entries append
+# to the TSV file.
+def WriteCarbonTaxRun(f, CurrentPrice, ScriptRunResultsFile, ScriptOutputVarsFile, FirstEntryDone):
 
 	# We have to read in the .cin file for every simulation.
 	# Therefore, we have to override its policy implementation schedule setting
@@ -184,14 +268,12 @@ while CurrentPrice <= PriceCeiling:
 	# to add entries to the spreadsheet showing the current price and which sectors were
 	# enabled for this run.
 	if FirstEntryDone:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
+		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + ScriptRunResultsFile + "|" + ScriptOutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
 	else:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
-		FirstEntryDone = True
+		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + ScriptRunResultsFile + "|" + ScriptOutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
 
-	# Include a column for CurrentPrice in the output file, then increment CurrentPrice
+	# Include a column for CurrentPrice in the output file
 	f.write("CurrentPrice=\t" + str(CurrentPrice))
-	CurrentPrice += 1
 
 	# Adding a column specifying which sectors were enabled for this run
 	NumSectorsRemaining = len(CoveredSectors)
@@ -209,5 +291,300 @@ while CurrentPrice <= PriceCeiling:
 	f.write("FILE>DELETE|" + RunName + ".vdfx")
 	f.write("\n\n")
 
+
+# Solving for the Price
+# ---------------------
+# In "Solve" mode, we do not write a single command script.  Instead, we write a command script with one run,
+# have the simulator backend perform it, read the covered emissions in CapYear from its results, and choose the
+# next price to test, until the price that meets the cap is found.  Each run logs the variables in the
+# SolverOutputVarsFile (see "Logged Variables" above).
+
+import os
+import SimulatorBackends
+
+# Returns the total emissions of the covered sectors in Year from a TSV file written by a single run
+def ReadCoveredEmissions(ScriptRunResultsFile, Year):
+	Results = open(ScriptRunResultsFile, 'r')
+	Years = Results.readline().rstrip("\n").split("\t")
+	YearColumn = len(Years) - 1 - Years[::-1].index(str(Year))
+	SectorEmissions = {}
+	for Line in Results:
+		Columns = Line.rstrip("\n").split("\t")
+		for Sector in CoveredSectors:
+			if Columns[0] == "Output Total CO2e Emissions by Sector[" + Sector + "]":
+				SectorEmissions[Sector] = float(Columns[YearColumn])
+	Results.close()
+	MissingSectors = [Sector for Sector in CoveredSectors if Sector not in SectorEmissions]
+	if MissingSectors:
+		ErrorMessage = "Error: " + ScriptRunResultsFile + " does not contain the emissions of " + ", ".join(MissingSectors) + "."
+		import sys
+		sys.exit(ErrorMessage)
+	return sum(SectorEmissions.values())
+
+# Performs one run, written to the command script by WriteRun, and returns the total emissions of the covered
+# sectors in Year.  Price is the price in Year, which is written to the SolverLogFile.  The run's results are
+# added to the RunResultsFile, which is overwritten by the first run.  Each search may perform no more than
+# MaxSolverRuns runs, counting from the last call to StartSearch().
+SolverRuns = []
+FirstRunOfSearch = 0
+
+def StartSearch():
+	global FirstRunOfSearch
+	FirstRunOfSearch = len(SolverRuns)
+
+def SimulateRun(WriteRun, Price, Year):
+	if len(SolverRuns) - FirstRunOfSearch >= MaxSolverRuns:
+		ErrorMessage = "Error: The search for the price in " + str(Year) + " did not finish within MaxSolverRuns (" + str(MaxSolverRuns) + ") runs.  See " + SolverLogFile + " for the prices tested."
+		import sys
+		sys.exit(ErrorMessage)
+
+	f = open(SolverScript, 'w')
+	WriteScriptHeader(f)
+	WriteRun(f)
+	f.write("MENU>EXIT\n")
+	f.close()
+	SimulatorBackends.Backends[SimulatorBackend](SolverScript)
+
+	CoveredEmissions = ReadCoveredEmissions(SolverRunResultsFile, Year)
+	RunResults = open(SolverRunResultsFile, 'r')
+	if SolverRuns:
+		RunResults.readline()
+		Results = open(RunResultsFile, 'a')
+	else:
+		Results = open(RunResultsFile, 'w')
+	Results.write(RunResults.read())
+	Results.close()
+	RunResults.close()
+
+	SolverRuns.append((Year, Price, CoveredEmissions))
+	SolverLog = open(SolverLogFile, 'w')
+	SolverLog.write("Run\tYear\tPrice\tCovered Emissions\n")
+	for RunNumber, SolverRun in enumerate(SolverRuns, 1):
+		SolverLog.write(str(RunNumber) + "\t" + "\t".join(str(Value) for Value in SolverRun) + "\n")
+	SolverLog.close()
+	print("Run " + str(len(SolverRuns)) + ": price " + str(Price) + " gives covered emissions of " + str(CoveredEmissions) + " in " + str(Year))
+	return CoveredEmissions
+
+# Performs one run with the same price in every year, as in the command script written in "Sweep" mode
+def SimulatePrice(Price, Year):
+	return SimulateRun(lambda f: WriteCarbonTaxRun(f, Price, SolverRunResultsFile, SolverOutputVarsFile, False), Price, Year)
+
+# Returns the lowest price from LowPrice through HighPrice that brings the covered emissions in Year down to
+# Cap (to within the tolerances), and the covered emissions at that price.  Simulate(Price) performs a run
+# and returns the covered emissions in Year.  If the emissions at LowPrice or HighPrice are already known,
+# they can be given, so that those runs are not repeated.  If the cap is met at LowPrice, LowPrice is
+# returned, and if it is not met at HighPrice, HighPrice is returned with a warning.
+def SolveForPrice(Simulate, Year, Cap, LowPrice, HighPrice, LowEmissions = None, HighEmissions = None):
+	if LowEmissions is None:
+		LowEmissions = Simulate(LowPrice)
+	if LowEmissions <= Cap + EmissionsTolerance:
+		return LowPrice, LowEmissions
+	if HighEmissions is None:
+		HighEmissions = Simulate(HighPrice)
+	if HighEmissions > Cap + EmissionsTolerance:
+		print("Warning: Covered emissions in " + str(Year) + " exceed the cap even at a price of " + str(HighPrice) + ".  Raise PriceCeiling to find the price that meets the cap.")
+		return HighPrice, HighEmissions
+
+	# We keep the cap bracketed between a price that is too low (with emissions above the cap) and a price
+	# that is high enough.  The Illinois variant halves the weight of the end of the bracket that has not moved
+	# for two runs in a row, so that the estimate does not approach the price from one side only.
+	LowExcess = LowEmissions - Cap
+	HighExcess = HighEmissions - Cap
+	LastSideMoved = None
+	while HighPrice - LowPrice > PriceTolerance:
+		if SearchMethod == "Bisection" or HighExcess == LowExcess:
+			Price = (LowPrice + HighPrice) / 2
+		else:
+			Price = HighPrice - HighExcess * (HighPrice - LowPrice) / (HighExcess - LowExcess)
+		Emissions = Simulate(Price)
+		if abs(Emissions - Cap) <= EmissionsTolerance:
+			return Price, Emissions
+		if Emissions > Cap:
+			LowPrice, LowExcess = Price, Emissions - Cap
+			if LastSideMoved == "Low":
+				HighExcess /= 2
+			LastSideMoved = "Low"
+		else:
+			HighPrice, HighExcess, HighEmissions = Price, Emissions - Cap, Emissions
+			if LastSideMoved == "High":
+				LowExcess /= 2
+			LastSideMoved = "High"
+	return HighPrice, HighEmissions
+
+if ScriptMode == "Solve":
+	StartSearch()
+	Price, Emissions = SolveForPrice(lambda Price: SimulatePrice(Price, CapYear), CapYear, CapEmissions, PriceFloor, PriceCeiling)
+	print("A price of " + str(Price) + " gives covered emissions of " + str(Emissions) + " in " + str(CapYear) + " (cap: " + str(CapEmissions) + ") after " + str(len(SolverRuns)) + " runs")
+	import sys
+	sys.exit()
+
+
+# Solving for a Price Trajectory
+# ------------------------------
+# In "SolveTrajectory" mode, the price may differ from year to year.  The carbon tax lever is a single number, which
+# the model multiplies by the selected policy implementation schedule in each year, so a price trajectory cannot be
+# given by the lever alone.  Instead, we set the lever of each covered sector to 1 and give the trajectory (in
+# currency units per ton CO2e) as the sector's carbon tax schedule, in a changes file that replaces the lookups
+# "FoPITY Fraction of Policy Implemented This Year[ScheduleN,cross carbon tax X <sector>]" of the selected
+# schedule.  The trajectory is a lookup with one point per year in CapTrajectory, so the price changes in a straight
+# line between those years, holds steady after the last one, and is zero until the year before the first one.
+#
+# The years are solved in order.  When a year is solved, the prices of the years before it are fixed, and the
+# price is varied from that year onward.  Because the model runs forward in time, the prices of later years cannot
+# affect emissions in the years already solved.  When WarmStart is True and the TrajectoryTableFile from a previous
+# solution exists, the search for each year begins at that year's previous price and widens by WarmStartStep until
+# the cap is bracketed, which saves runs when the caps have only changed slightly.
+#
+# The solved trajectory is written to the TrajectoryFile, a changes file that can be read after the
+# ComplementaryPoliciesFile (with a later READCIN instruction) to apply it in other runs.  The price, covered
+# emissions, and cap of each year are written to the TrajectoryTableFile, along with the equivalent setting of
+# each covered sector's carbon tax lever under the selected policy implementation schedule (the price divided by
+# the schedule's value in that year), for use with the policy schedules.
+
+def FoPITYFileName():
+	return os.path.join("InputData", "plcy-schd", "FoPITY", "FoPITY-" + str(PolicySchedule) + ".csv")
+
+# Returns the selected policy implementation schedule of each covered sector's carbon tax, as a dictionary of
+# {year: fraction} dictionaries by sector.
+def ReadCarbonTaxSchedules():
+	CarbonTaxSchedules = {}
+	ScheduleFile = open(FoPITYFileName(), 'r')
+	Years = [int(Year) for Year in ScheduleFile.readline().rstrip("\n").split(",")[4:]]
+	for Line in ScheduleFile:
+		Columns = Line.rstrip("\n").split(",")
+		if Columns[0] == "cross carbon tax" and Columns[1] in CoveredSectors:
+			CarbonTaxSchedules[Columns[1]] = dict(zip(Years, (float(Value) for Value in Columns[4:])))
+	ScheduleFile.close()
+	return CarbonTaxSchedules
+
+# Writes a changes file setting the carbon tax of each covered sector to follow Trajectory (a list of (year, price)
+# points in order of year), and the carbon tax of every other sector to zero
+def WriteTrajectoryFile(ChangesFile, Trajectory):
+	Points = [(Trajectory[0][0] - 1, 0)] + Trajectory
+	Changes = open(ChangesFile, 'w')
+	for Sector in Sectors:
+		if Sectors[Sector]:
+			Changes.write("Additional Carbon Tax Rate[" + Sector + "] = 1\n")
+			Changes.write("FoPITY Fraction of Policy Implemented This Year[Schedule" + str(PolicySchedule) + ",cross carbon tax X " + Sector + "](" + ",".join("(" + str(Year) + "," + str(Price) + ")" for Year, Price in Points) + ")\n")
+		else:
+			Changes.write("Additional Carbon Tax Rate[" + Sector + "] = 0\n")
+	Changes.close()
+
+# Writes a single run with the carbon tax following Trajectory.  The run label gives the price in the year being
+# solved, so the runs in the RunResultsFile have the same columns as in "Sweep" mode.
+def WriteTrajectoryRun(f, Trajectory):
+	WriteTrajectoryFile(SolverTrajectoryFile, Trajectory)
+	f.write("SIMULATE>READCIN|" + ComplementaryPoliciesFile + "\n")
+	f.write("SIMULATE>SETVAL|Policy Implementation Schedule Selector=" + str(PolicySchedule) + "\n")
+	f.write("SIMULATE>READCIN|" + SolverTrajectoryFile + "\n")
+	f.write("MENU>RUN|O\n")
+	f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + SolverRunResultsFile + "|" + SolverOutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
+	f.write("CurrentPrice=\t" + str(Trajectory[-1][1]) + "\tCovered sectors=" + ", ".join(CoveredSectors) + "\n")
+	f.write("FILE>DELETE|" + RunName + ".vdfx")
+	f.write("\n\n")
+
+# Returns the prices of the previous solution by year, or an empty dictionary if there is none
+def ReadPreviousTrajectory():
+	PreviousTrajectory = {}
+	if WarmStart and os.path.exists(TrajectoryTableFile):
+		TrajectoryTable = open(TrajectoryTableFile, 'r')
+		TrajectoryTable.readline()
+		for Line in TrajectoryTable:
+			Columns = Line.rstrip("\n").split("\t")
+			PreviousTrajectory[int(Columns[0])] = float(Columns[2])
+		TrajectoryTable.close()
+	return PreviousTrajectory
+
+# Returns a price bracket (LowPrice, HighPrice, LowEmissions, HighEmissions) around the cap in Year, starting from
+# the previous solution's price and widening the bracket by WarmStartStep (as a fraction of the price, or of the
+# PriceCeiling if the price was zero) after each run, doubling each time.  If the previous price still meets the
+# cap to within EmissionsTolerance, or the bracket reaches the PriceFloor or PriceCeiling, both prices are the same.
+def WarmStartBracket(Simulate, Year, Cap, PreviousPrice):
+	Step = WarmStartStep * (PreviousPrice if PreviousPrice > 0 else PriceCeiling)
+	Emissions = Simulate(PreviousPrice)
+	if abs(Emissions - Cap) <= EmissionsTolerance:
+		return PreviousPrice, PreviousPrice, Emissions, Emissions
+	if Emissions > Cap + EmissionsTolerance:
+		LowPrice, LowEmissions = PreviousPrice, Emissions
+		while LowPrice < PriceCeiling:
+			Price = min(LowPrice + Step, PriceCeiling)
+			Emissions = Simulate(Price)
+			if Emissions <= Cap + EmissionsTolerance:
+				return LowPrice, Price, LowEmissions, Emissions
+			LowPrice, LowEmissions = Price, Emissions
+			Step *= 2
+		return LowPrice, PriceCeiling, LowEmissions, LowEmissions
+	HighPrice, HighEmissions = PreviousPrice, Emissions
+	while HighPrice > PriceFloor:
+		Price = max(HighPrice - Step, PriceFloor)
+		Emissions = Simulate(Price)
+		if Emissions > Cap + EmissionsTolerance:
+			return Price, HighPrice, Emissions, HighEmissions
+		HighPrice, HighEmissions = Price, Emissions
+		Step *= 2
+	return PriceFloor, PriceFloor, HighEmissions, HighEmissions
+
+def SolveForTrajectory():
+	CarbonTaxSchedules = ReadCarbonTaxSchedules()
+	PreviousTrajectory = ReadPreviousTrajectory()
+	Trajectory = []
+	TrajectoryEmissions = []
+	for Year in sorted(CapTrajectory):
+		Cap = CapTrajectory[Year]
+		Simulate = lambda Price: SimulateRun(lambda f: WriteTrajectoryRun(f, Trajectory + [(Year, Price)]), Price, Year)
+		StartSearch()
+		if Year in PreviousTrajectory:
+			LowPrice, HighPrice, LowEmissions, HighEmissions = WarmStartBracket(Simulate, Year, Cap, PreviousTrajectory[Year])
+			if LowPrice == HighPrice:
+				Price, Emissions = LowPrice, LowEmissions
+			else:
+				Price, Emissions = SolveForPrice(Simulate, Year, Cap, LowPrice, HighPrice, LowEmissions, HighEmissions)
+		else:
+			Price, Emissions = SolveForPrice(Simulate, Year, Cap, PriceFloor, PriceCeiling)
+		Trajectory.append((Year, Price))
+		TrajectoryEmissions.append(Emissions)
+		print("A price of " + str(Price) + " gives covered emissions of " + str(Emissions) + " in " + str(Year) + " (cap: " + str(Cap) + ")")
+
+	WriteTrajectoryFile(TrajectoryFile, Trajectory)
+	TrajectoryTable = open(TrajectoryTableFile, 'w')
+	TrajectoryTable.write("Year\tCap\tPrice\tCovered Emissions\t" + "\t".join("Lever Equivalent[" + Sector + "]" for Sector in CoveredSectors) + "\n")
+	for (Year, Price), Emissions in zip(Trajectory, TrajectoryEmissions):
+		LeverEquivalents = []
+		for Sector in CoveredSectors:
+			ScheduleFraction = CarbonTaxSchedules.get(Sector, {}).get(Year, 0)
+			LeverEquivalents.append(str(Price / ScheduleFraction) if ScheduleFraction > 0 else "")
+		TrajectoryTable.write(str(Year) + "\t" + str(CapTrajectory[Year]) + "\t" + str(Price) + "\t" + str(Emissions) + "\t" + "\t".join(LeverEquivalents) + "\n")
+	TrajectoryTable.close()
+	print("Wrote the price trajectory to " + TrajectoryFile + " and " + TrajectoryTableFile + " after " + str(len(SolverRuns)) + " runs")
+
+if ScriptMode == "SolveTrajectory":
+	SolveForTrajectory()
+	import sys
+	sys.exit()
+
+
+# Generate Vensim Command Script
+# ------------------------------
+# We begin by creating a new file to serve as the Vensim command script (overwriting
+# any older version at that filename), and we write each run to it.  The Vensim command
+# file generated by this script always contains multiple runs.
+f = open(OutputScript, 'w')
+WriteScriptHeader(f)
+
+
+# Only for the first entry in the TSV file, we wish to include the "Time" row and
+# overwrite any existing TSV file of that name.  Other entries append to the TSV file.
+FirstEntryDone = False
+
+
+# We start the price at the price floor, and we will increment by one
+# currency unit with each model run.
+CurrentPrice = PriceFloor
+
+while CurrentPrice <= PriceCeiling:
+	WriteCarbonTaxRun(f, CurrentPrice, RunResultsFile, SolverOutputVarsFile, FirstEntryDone)
+	FirstEntryDone = True
+	CurrentPrice += 1
+
 # We are done writing the Vensim command script and therefore close the file.
 f.close()
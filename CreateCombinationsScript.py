@@ -21,6 +21,11 @@ OutputScript = "GeneratedCombinationsScript.cmd" # The desired filename of the V
 RunResultsFile = "RunResults.tsv" # The desired filename for TSV file containing model run results
 OutputVarsFile = "OutputVarsToExport.lst" # The name of the file containing a list of variables to be included in the RunResultsFile
                                           # May optionally also be used as a SAVELIST for Vensim (see below)
+RunManifestFile = "RunManifest.tsv" # The desired filename for a TSV file listing the policy settings used in each run
+ResumeScript = "GeneratedCombinationsScript-Resume.cmd" # The desired filename of the Vensim command script written in "Resume" mode
+InputDataFolder = "InputData" # The name of the folder containing the model's input data (used by the run cache)
+RunCacheFolder = "RunCache" # The name of the folder in which results are stored by the run cache
+RunCacheListFile = "RunCacheList.tsv" # The desired filename for the list of runs that were found in or will be added to the run cache
 
 # Other Settings
 # --------------
@@ -31,541 +36,395 @@ MinPolicyCols = 0 # At least this many columns for policy settings will be added
 				  # easier to append various RunResultsFiles together, when they use different numbers of enabled policies,
 				  # and still have the columns line up correctly.
 PolicySchedule = 1 # The number of the policy implementation schedule file to be used (in InputData/plcy-schd/FoPITY)
-
-
-# Index definitions
-# -----------------
-# Each policy is a Python list.  The numbers below are a key to the meaning of the four entries
-# that compose each policy, so we can refer to them by meaningful names in the code.
-# Note that the fourth entry in each policy, Settings, is itself a list that contains various
-# setting values.  Do not change any names or numbers in this section.
-Enabled = 0
-LongName = 1
-ShortName = 2
-Settings = 3
-Group = 4 # Groups are not used in this script, but they exist here so the policy
-		  # list has the same format as the one in CreateContributionTestScript.py
-		  # It would be difficult to support groups here because policies can have
-		  # an arbitrary number of settings, so different policies within a group may
-		  # have different numbers of settings, and it's not clear how to test a group
-		  # as a single entity under all possible user-defined setting combinations.
+ScriptMode = "Generate" # "Generate" writes the Vensim command script(s).
+						# "Validate" checks previously generated command script(s) (see "Run Order" below).
+						# "MergeShards" combines shard RunResultsFiles (see "Parallel Runs" below).
+						# "Resume" writes a command script containing only the runs missing from the RunResultsFile
+						# (see "Resuming an Interrupted Batch" below).
+						# "UpdateFromRunCache" updates the run cache and the RunResultsFile (see "Run Cache" below).
+ValidationLogFile = "CombinationsScriptValidation.txt" # The file to which "Validate" mode writes its findings
+DryRun = False # If True, "Generate" mode estimates the time and output size of the batch (see BatchPlanner.py)
+			   # without writing the command script(s)
+
+
+# Run Order
+# ---------
+# By default ("Standard" order), the setting of the last enabled policy changes fastest from one run to the next,
+# then the setting of the policy before it, and so on, so a single step can change the settings of many policies.
+# In "GrayCode" order, the same runs are performed, but consecutive runs always differ in the setting of exactly
+# one policy.
+#
+# Vensim clears any values given by SETVAL instructions after each run, so every run must repeat the SETVAL
+# instructions for all of its non-zero settings.  However, a policy that is disabled and a policy with a setting of
+# zero produce identical results, so a SETVAL instruction setting a policy to zero can be left out.  With many
+# enabled policies, this can greatly shrink the command script and reduce the time Vensim spends reading it.
+# To confirm that a command script sets every policy as described in its RunResultsFile columns, set ScriptMode
+# to "Validate" and run this script again with the same settings.
+RunOrder = "Standard" # "Standard" or "GrayCode"
+OmitZeroSetVals = False # If True, SETVAL instructions are written only for policies with non-zero settings
+
+
+# Sampling
+# --------
+# By default ("FullFactorial"), every combination of the enabled policies' settings is run, so the number of runs
+# multiplies with each policy enabled.  Instead, you may perform a fixed number of runs (the RunBudget) whose settings
+# are spread evenly across the range of possible settings, which covers many policies with far fewer runs.
+# "LatinHypercube" divides each policy's range of settings into RunBudget equal slices and uses each slice in exactly
+# one run, with the slices of different policies paired at random.  "Sobol" uses a scrambled Sobol sequence, which
+# spreads the runs evenly across all combinations of policies at once (it requires the SciPy package and works best
+# when RunBudget is a power of two, such as 512 or 1024).  With "Discrete" settings, each run uses one of the values
+# in each policy's Settings list.  With "Continuous" settings, each run may use any value between the smallest and
+# largest values in each policy's Settings list.  The sampled runs are written in the same format as other runs, so
+# the RunResultsFile can be analyzed in the same way.  RunOrder has no effect when sampling.
+SamplingMethod = "FullFactorial" # "FullFactorial", "LatinHypercube", or "Sobol"
+RunBudget = 1024 # The number of runs to perform when using "LatinHypercube" or "Sobol" sampling
+SettingsType = "Discrete" # "Discrete" or "Continuous"
+RandomSeed = 1 # Sampling with the same RandomSeed and settings always produces the same runs
+
+
+# Run Cache
+# ---------
+# The run cache keeps the results of every run performed with it enabled, so that later batches (including batches
+# generated by CreateContributionTestScript.py) can reuse them instead of repeating the run.  A cached run is reused
+# only if the model file, every input data file Vensim reads, the OutputVarsFile, FirstYear, FinalYear, PolicySchedule,
+# and all non-zero policy settings are the same as when it was performed.  When UseRunCache is True, runs found in
+# the cache are left out of the command script(s).  Once Vensim has finished (and, if you were using shards, once
+# the shard results have been merged), set ScriptMode to "UpdateFromRunCache" and run this script again.  This
+# stores the new results in the cache and adds the results of the runs that were left out to the RunResultsFile.
+# The runs added from the cache are placed at the end of the RunResultsFile, after the runs performed by Vensim.
+# If Vensim stops partway through the batch, resume it (see below) before updating from the run cache.
+UseRunCache = False
+
+
+# Resuming an Interrupted Batch
+# -----------------------------
+# Whenever command scripts are generated, the run number and policy settings of every run are also written to
+# the RunManifestFile.  If Vensim stops partway through a batch (for example, because it crashed), set ScriptMode
+# to "Resume" and run this script again.  It reads the RunResultsFile to find which runs were completed, and it
+# writes the ResumeScript, which performs only the runs listed in the RunManifestFile that are missing from the
+# RunResultsFile.  These runs keep their original run numbers and are appended to the existing RunResultsFile.
+# If you were using shards, first merge the shard RunResultsFiles (see "Parallel Runs" below).  The enabled
+# policies must be the same as when the RunManifestFile was written.  If the batch used the run cache and the
+# RunResultsFile has not yet been updated from it, the runs found in the cache are not resumed (they are added
+# when the RunResultsFile is updated), and the resumed runs keep the run labels recorded in the RunCacheListFile,
+# so their results are stored in the cache.
+
+
+# Parallel Runs
+# -------------
+# Vensim performs the runs in a command script one at a time.  To make use of a computer with several processor
+# cores, you may split the runs among several command scripts (called "shards" here) and run each shard in its own
+# copy of Vensim at the same time.  Each shard uses its own RunName, .vdfx file and RunResultsFile, named by adding
+# "-ShardN" to the names above (for example, "GeneratedCombinationsScript-Shard2.cmd" and "RunResults-Shard2.tsv"),
+# so the copies of Vensim do not overwrite each other's files.  Runs are numbered consecutively across all shards.
+# Once every shard has finished, set ScriptMode to "MergeShards" and run this script again (with the same
+# ShardCount) to combine the shard RunResultsFiles into a single RunResultsFile.  If a shard stopped before
+# writing any results (for example, because Vensim crashed during its first run), set AllowPartialMerge to True to
+# merge the other shards' results, then use "Resume" mode to perform the missing runs.
+ShardCount = 1 # The number of command scripts to split the runs among.  Use 1 to write a single command script.
+AllowPartialMerge = False # If True, "MergeShards" mode skips any shard whose RunResultsFile was not found
 
 
 # Policy Options
 # --------------
-# This section specifies which policies should be included in the Vensim command script
-# (called here "enabled" policies) and what setting values for those policies should
-# be included.  Unless you have enabled "IndividualPoliciesOnly" mode, all non-repeating
-# combinations of the settings for enabled policies will
-# be included in the Vensim command script, so do not enable too many policies at once, or
-# Vensim will be unable to complete the necessary runs in a reasonable amount of time.
-# Each policy is on a single line.  You may change the first entry of each policy to
-# "True" to enable the policy or "False" to disable it.
-# The fourth entry in each policy is a list of setting values enclosed with square brackets.
-# You may change these values, add more values (separated by commas), and delete values.
-# Any enabled policy must have a minimum of one setting value.  A policy that is disabled
-# and a policy with a setting of zero produce identical results.
-
-PotentialPolicies = (
-
-	# Transportation Sector Policies
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,VOC]","Conventional Pollutant Standards - LDVs VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,CO]","Conventional Pollutant Standards - LDVs CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,NOx]","Conventional Pollutant Standards - LDVs NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,PM10]","Conventional Pollutant Standards - LDVs PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,PM25]","Conventional Pollutant Standards - LDVs PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,SOx]","Conventional Pollutant Standards - LDVs SOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,BC]","Conventional Pollutant Standards - LDVs BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[LDVs,OC]","Conventional Pollutant Standards - LDVs OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,VOC]","Conventional Pollutant Standards - HDVs VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,CO]","Conventional Pollutant Standards - HDVs CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,NOx]","Conventional Pollutant Standards - HDVs NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,PM10]","Conventional Pollutant Standards - HDVs PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,PM25]","Conventional Pollutant Standards - HDVs PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,SOx]","Conventional Pollutant Standards - HDVs SOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,BC]","Conventional Pollutant Standards - HDVs BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[HDVs,OC]","Conventional Pollutant Standards - HDVs OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[aircraft,VOC]","Conventional Pollutant Standards - aircraft VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[aircraft,NOx]","Conventional Pollutant Standards - aircraft NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,VOC]","Conventional Pollutant Standards - rail VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,CO]","Conventional Pollutant Standards - rail CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,NOx]","Conventional Pollutant Standards - rail NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,PM10]","Conventional Pollutant Standards - rail PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,PM25]","Conventional Pollutant Standards - rail PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,BC]","Conventional Pollutant Standards - rail BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[rail,OC]","Conventional Pollutant Standards - rail OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,VOC]","Conventional Pollutant Standards - ships VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,CO]","Conventional Pollutant Standards - ships CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,NOx]","Conventional Pollutant Standards - ships NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,PM10]","Conventional Pollutant Standards - ships PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,PM25]","Conventional Pollutant Standards - ships PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,BC]","Conventional Pollutant Standards - ships BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[ships,OC]","Conventional Pollutant Standards - ships OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,VOC]","Conventional Pollutant Standards - motorbikes VOCs",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,CO]","Conventional Pollutant Standards - motorbikes CO",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,NOx]","Conventional Pollutant Standards - motorbikes NOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,PM10]","Conventional Pollutant Standards - motorbikes PM10",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,PM25]","Conventional Pollutant Standards - motorbikes PM2.5",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,SOx]","Conventional Pollutant Standards - motorbikes SOx",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,BC]","Conventional Pollutant Standards - motorbikes BC",[0,1],"Conventional Pollutant Standard"),
-	(False,"Percentage Reduction of Separately Regulated Pollutants[motorbikes,OC]","Conventional Pollutant Standards - motorbikes OC",[0,1],"Conventional Pollutant Standard"),
-	(False,"EV Charger Deployment","Electric Vehicle Charger Deployment",[0,300],"EV Charger Deployment"),
-	(False,"Reduce EV Range Anxiety and Charging Time","Electric Vehicle Range n Charging Time",[0,1],"EV Range n Charging Time"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,LDVs]","Electric Vehicle Sales Mandate - Passenger LDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,LDVs]","Electric Vehicle Sales Mandate - Freight LDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,HDVs]","Electric Vehicle Sales Mandate - Passenger HDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,HDVs]","Electric Vehicle Sales Mandate - Freight HDVs",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,aircraft]","Electric Vehicle Sales Mandate - Passenger Aircraft",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,aircraft]","Electric Vehicle Sales Mandate - Freight Aircraft",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,rail]","Electric Vehicle Sales Mandate - Passenger Rail",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,rail]","Electric Vehicle Sales Mandate - Freight Rail",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,ships]","Electric Vehicle Sales Mandate - Passenger Ships",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[freight,ships]","Electric Vehicle Sales Mandate - Freight Ships",[0,1],"EV Sales Mandate"),
-	(False,"Additional Minimum Required EV Sales Percentage[passenger,motorbikes]","Electric Vehicle Sales Mandate - Passenger Motorbikes",[0,1],"EV Sales Mandate"),
-	(False,"Additional EV Subsidy Percentage[passenger,LDVs]","Electric Vehicle Subsidy - Passenger LDVs",[0,0.5],"EV Subsidy"),
-	(False,"LDVs Feebate Rate","Feebate",[0,1],"Feebate"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,LDVs]","Fuel Economy Standard - Passenger LDVs",[0,1],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,LDVs]","Fuel Economy Standard - Freight LDVs",[0,1],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,HDVs]","Fuel Economy Standard - Passenger HDVs",[0,0.66],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,HDVs]","Fuel Economy Standard - Freight HDVs",[0,0.66],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,aircraft]","Fuel Economy Standard - Passenger Aircraft",[0,0.54],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,aircraft]","Fuel Economy Standard - Freight Aircraft",[0,0.54],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,rail]","Fuel Economy Standard - Passenger Rail",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,rail]","Fuel Economy Standard - Freight Rail",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,ships]","Fuel Economy Standard - Passenger Ships",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[freight,ships]","Fuel Economy Standard - Freight Ships",[0,0.2],"Vehicle Fuel Economy Standards"),
-	(False,"Percentage Additional Improvement of Fuel Economy Std[passenger,motorbikes]","Fuel Economy Standard - Passenger Motorbikes",[0,0.74],"Vehicle Fuel Economy Standards"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,LDVs]","Hydrogen Vehicle Sales Mandate - Passenger LDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,LDVs]","Hydrogen Vehicle Sales Mandate - Freight LDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,HDVs]","Hydrogen Vehicle Sales Mandate - Passenger HDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,HDVs]","Hydrogen Vehicle Sales Mandate - Freight HDVs",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,aircraft]","Hydrogen Vehicle Sales Mandate - Passenger Aircraft",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,aircraft]","Hydrogen Vehicle Sales Mandate - Freight Aircraft",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,rail]","Hydrogen Vehicle Sales Mandate - Passenger Rail",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,rail]","Hydrogen Vehicle Sales Mandate - Freight Rail",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[passenger,ships]","Hydrogen Vehicle Sales Mandate - Passenger Ships",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Minimum Required Hydrogen Vehicle Sales Percentage[freight,ships]","Hydrogen Vehicle Sales Mandate - Freight Ships",[0,1],"Hydrogen Veh Sales Mandate"),
-	(False,"Additional LCFS Percentage","Low Carbon Fuel Standard",[0,0.2],"Low Carbon Fuel Standard"),
-	(False,"Fraction of TDM Package Implemented[passenger]","Transportation Demand Management - Passengers",[0,1],"Transportation Demand Management"),
-	(False,"Fraction of TDM Package Implemented[freight]","Transportation Demand Management - Freight",[0,1],"Transportation Demand Management"),
-
-	# Buildings Sector Policies
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[heating,urban residential]","Building Component Electrification - Urban Residential Heating",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[appliances,urban residential]","Building Component Electrification - Urban Residential Appliances",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[other component,urban residential]","Building Component Electrification - Urban Residential Other Components",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[heating,rural residential]","Building Component Electrification - Rural Residential Heating",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[appliances,rural residential]","Building Component Electrification - Rural Residential Appliances",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[other component,rural residential]","Building Component Electrification - Rural Residential Other Components",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[heating,commercial]","Building Component Electrification - Commercial Heating",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[appliances,commercial]","Building Component Electrification - Commercial Appliances",[0,1],"Building Component Electrification"),
-	(False,"Fraction of New Bldg Components Shifted to Other Fuels[other component,commercial]","Building Component Electrification - Commercial Other Components",[0,1],"Building Component Electrification"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[heating,urban residential]","Building Energy Efficiency Standards - Urban Residential Heating",[0,0.22],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[cooling and ventilation,urban residential]","Building Energy Efficiency Standards - Urban Residential Cooling and Ventilation",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[envelope,urban residential]","Building Energy Efficiency Standards - Urban Residential Envelope",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[lighting,urban residential]","Building Energy Efficiency Standards - Urban Residential Lighting",[0,0.4],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[appliances,urban residential]","Building Energy Efficiency Standards - Urban Residential Appliances",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[other component,urban residential]","Building Energy Efficiency Standards - Urban Residential Other Components",[0,0.11],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[heating,rural residential]","Building Energy Efficiency Standards - Rural Residential Heating",[0,0.22],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[cooling and ventilation,rural residential]","Building Energy Efficiency Standards - Rural Residential Cooling and Ventilation",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[envelope,rural residential]","Building Energy Efficiency Standards - Rural Residential Envelope",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[lighting,rural residential]","Building Energy Efficiency Standards - Rural Residential Lighting",[0,0.4],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[appliances,rural residential]","Building Energy Efficiency Standards - Rural Residential Appliances",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[other component,rural residential]","Building Energy Efficiency Standards - Rural Residential Other Components",[0,0.11],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[heating,commercial]","Building Energy Efficiency Standards - Commercial Heating",[0,0.22],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[cooling and ventilation,commercial]","Building Energy Efficiency Standards - Commercial Cooling and Ventilation",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[envelope,commercial]","Building Energy Efficiency Standards - Commercial Envelope",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[lighting,commercial]","Building Energy Efficiency Standards - Commercial Lighting",[0,0.4],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[appliances,commercial]","Building Energy Efficiency Standards - Commercial Appliances",[0,0.38],"Building Energy Efficiency Standards"),
-	(False,"Reduction in E Use Allowed by Component Eff Std[other component,commercial]","Building Energy Efficiency Standards - Commercial Other Components",[0,0.11],"Building Energy Efficiency Standards"),
-	(False,"Boolean Improved Contractor Edu and Training","Contractor Training",[0,1],"Contractor Training"),
-	(False,"Min Fraction of Total Elec Demand to be Met by Distributed Solar PV","Distributed Solar Carve-Out",[0,0.24],"Distributed Solar Promotion"),
-	(False,"Perc Subsidy for Distributed Solar PV Capacity","Distributed Solar Subsidy",[0,0.5],"Distributed Solar Promotion"),
-	(False,"Boolean Improved Device Labeling","Improved Labeling",[0,1],"Improved Labeling"),
-	(False,"Share of Preexisting Buildings Subject to Retrofitting[urban residential]","Retrofit Existing Buildings - Urban Residential",[0,0.5],"Increased Retrofitting"),
-	(False,"Share of Preexisting Buildings Subject to Retrofitting[rural residential]","Retrofit Existing Buildings - Rural Residential",[0,0.5],"Increased Retrofitting"),
-	(False,"Share of Preexisting Buildings Subject to Retrofitting[commercial]","Retrofit Existing Buildings - Commercial",[0,0.5],"Increased Retrofitting"),
-	(False,"Boolean Rebate Program for Efficient Components[heating]","Rebate for Efficient Products - Heating",[0,1],"Rebate for Efficient Products"),
-	(False,"Boolean Rebate Program for Efficient Components[cooling and ventilation]","Rebate for Efficient Products - Cooling and Ventilation",[0,1],"Rebate for Efficient Products"),
-	(False,"Boolean Rebate Program for Efficient Components[appliances]","Rebate for Efficient Products - Appliances",[0,1],"Rebate for Efficient Products"),
-
-	# Electricity Sector Policies
-	(False,"Boolean Ban New Power Plants[hard coal es]","Ban New Power Plants - Hard Coal",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[natural gas nonpeaker es]","Ban New Power Plants - Natural Gas Nonpeaker",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[nuclear es]","Ban New Power Plants - Nuclear",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[hydro es]","Ban New Power Plants - Hydro",[0,1],"Ban New Power Plants"),
-	(False,"Boolean Ban New Power Plants[lignite es]","Ban New Power Plants - Lignite",[0,1],"Ban New Power Plants"),
-	(False,"Renewable Portfolio Std Percentage","Carbon-free Electricity Standard",[0,1],"Carbon-free Electricity Standard"),
-	(False,"Percent Change in Electricity Exports","Change Electricity Exports",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[hard coal es]","Change Electricity Imports - Hard Coal",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[natural gas nonpeaker es]","Change Electricity Imports - Natural Gas Nonpeaker",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[nuclear es]","Change Electricity Imports - Nuclear",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[hydro es]","Change Electricity Imports - Hydro",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[onshore wind es]","Change Electricity Imports - Onshore Wind",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[solar PV es]","Change Electricity Imports - Solar PV",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[biomass es]","Change Electricity Imports - Biomass",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Percent Change in Electricity Imports[petroleum es]","Change Electricity Imports - Petroleum",[-0.5,1],"Electricity Imports and Exports"),
-	(False,"Fraction of Additional Demand Response Potential Achieved","Demand Response",[0,1],"Demand Response"),
-	(False,"Annual Additional Capacity Retired due to Early Retirement Policy[hard coal es]","Early Retirement of Power Plants - Hard Coal",[0,10000],"Early Retirement of Power Plants"),
-	(False,"Annual Additional Capacity Retired due to Early Retirement Policy[nuclear es]","Early Retirement of Power Plants - Nuclear",[0,10000],"Early Retirement of Power Plants"),
-	(False,"Additional Battery Storage Annual Growth Percentage","Grid-Scale Electricity Storage",[0,0.16],"Grid-Scale Electricity Storage"),
-	(False,"Percentage Increase in Transmission Capacity vs BAU","Increase Transmission",[0,1.13],"Increase Transmission"),
-	(False,"Percentage Reduction in Plant Downtime[natural gas nonpeaker es,preexisting retiring]","Reduce Plant Downtime - Preexisting Natural Gas Nonpeaker",[0,0.6],"Reduce Plant Downtime"),
-	(False,"Percentage Reduction in Plant Downtime[onshore wind es,newly built]","Reduce Plant Downtime - New Onshore Wind",[0,0.25],"Reduce Plant Downtime"),
-	(False,"Percentage Reduction in Plant Downtime[solar PV es,newly built]","Reduce Plant Downtime - New Solar PV",[0,0.3],"Reduce Plant Downtime"),
-	(False,"Percentage Reduction in Plant Downtime[offshore wind es,newly built]","Reduce Plant Downtime - New Offshore Wind",[0,0.25],"Reduce Plant Downtime"),
-	(False,"Percent Reduction in Soft Costs of Capacity Construction[onshore wind es]","Reduce Soft Costs - Onshore Wind",[0,0.9],"Reduce Soft Costs"),
-	(False,"Percent Reduction in Soft Costs of Capacity Construction[solar PV es]","Reduce Soft Costs - Solar PV",[0,0.9],"Reduce Soft Costs"),
-	(False,"Percent Reduction in Soft Costs of Capacity Construction[offshore wind es]","Reduce Soft Costs - Offshore Wind",[0,0.9],"Reduce Soft Costs"),
-	(False,"Percentage TnD Losses Avoided","Reduce Transmission n Distribution Losses",[0,0.4],"Reduce TnD Losses"),
-	(False,"Perc Subsidy for Elec Capacity Construction[nuclear es]","Subsidy for Capacity Construction - Nuclear",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[onshore wind es]","Subsidy for Capacity Construction - Onshore Wind",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[solar PV es]","Subsidy for Capacity Construction - Solar PV",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[solar thermal es]","Subsidy for Capacity Construction - Solar Thermal",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[biomass es]","Subsidy for Capacity Construction - Biomass",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Perc Subsidy for Elec Capacity Construction[offshore wind es]","Subsidy for Capacity Construction - Offshore Wind",[0,1],"Subsidy for Capacity Construction"),
-	(False,"Subsidy for Elec Production by Fuel[nuclear es]","Subsidy for Electricity Production - Nuclear",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[onshore wind es]","Subsidy for Electricity Production - Onshore Wind",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[solar PV es]","Subsidy for Electricity Production - Solar PV",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[solar thermal es]","Subsidy for Electricity Production - Solar Thermal",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[biomass es]","Subsidy for Electricity Production - Biomass",[0,60],"Subsidy for Electricity Production"),
-	(False,"Subsidy for Elec Production by Fuel[offshore wind es]","Subsidy for Electricity Production - Offshore Wind",[0,60],"Subsidy for Electricity Production"),
-
-	# Industry Sector Policies
-	(False,"Fraction of Cement Measures Achieved","Cement Clinker Substitution",[0,1],"Cement Clinker Substitution"),
-	(False,"Fraction of Potential Cogeneration and Waste Heat Recovery Adopted","Cogeneration and Waste Heat Recovery",[0,1],"Cogeneration and Waste Heat Recovery"),
-	(False,"Fraction of Energy Savings from Early Facility Retirement Achieved","Early Retirement of Industrial Facilities",[0,1],"Early Retirement of Industrial Facilities"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[cement and other carbonates]","Industry Energy Efficiency Standards - Cement Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[natural gas and petroleum systems]","Industry Energy Efficiency Standards - Natural Gas and Petroleum Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[iron and steel]","Industry Energy Efficiency Standards - Iron and Steel Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[chemicals]","Industry Energy Efficiency Standards - Chemicals Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[coal mining]","Industry Energy Efficiency Standards - Coal Mining Industry",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[waste management]","Industry Energy Efficiency Standards - Water n Waste",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[agriculture]","Industry Energy Efficiency Standards - Agriculture",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Percentage Improvement in Eqpt Efficiency Standards above BAU[other industries]","Industry Energy Efficiency Standards - Other Industries",[0,0.33],"Industry Energy Efficiency Standards"),
-	(False,"Fraction of Installation and System Integration Issues Remedied","Improved System Design",[0,1],"Improved System Design"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,hard coal if]","Electrification + Hydrogen - Cement Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,natural gas if]","Electrification + Hydrogen - Cement Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,biomass if]","Electrification + Hydrogen - Cement Industry Biomass Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,petroleum diesel if]","Electrification + Hydrogen - Cement Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,heavy or residual fuel oil if]","Electrification + Hydrogen - Cement Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[cement and other carbonates,LPG propane or butane if]","Electrification + Hydrogen - Cement Industry LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,hard coal if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,natural gas if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,biomass if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Biomass Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[natural gas and petroleum systems,crude oil if]","Electrification + Hydrogen - Natural Gas and Petroleum Industry Crude Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,hard coal if]","Electrification + Hydrogen - Iron and Steel Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,natural gas if]","Electrification + Hydrogen - Iron and Steel Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,petroleum diesel if]","Electrification + Hydrogen - Iron and Steel Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,heavy or residual fuel oil if]","Electrification + Hydrogen - Iron and Steel Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[iron and steel,LPG propane or butane if]","Electrification + Hydrogen - Iron and Steel Industry LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,hard coal if]","Electrification + Hydrogen - Chemicals Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,natural gas if]","Electrification + Hydrogen - Chemicals Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,petroleum diesel if]","Electrification + Hydrogen - Chemicals Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,heavy or residual fuel oil if]","Electrification + Hydrogen - Chemicals Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[chemicals,LPG propane or butane if]","Electrification + Hydrogen - Chemicals Industry LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,hard coal if]","Electrification + Hydrogen - Coal Mining Industry Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,natural gas if]","Electrification + Hydrogen - Coal Mining Industry Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,petroleum diesel if]","Electrification + Hydrogen - Coal Mining Industry Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[coal mining,heavy or residual fuel oil if]","Electrification + Hydrogen - Coal Mining Industry Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,natural gas if]","Electrification + Hydrogen - Agriculture Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,petroleum diesel if]","Electrification + Hydrogen - Agriculture Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,heavy or residual fuel oil if]","Electrification + Hydrogen - Agriculture Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[agriculture,LPG propane or butane if]","Electrification + Hydrogen - Agriculture LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,hard coal if]","Electrification + Hydrogen - Other Industries Coal Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,natural gas if]","Electrification + Hydrogen - Other Industries Natural Gas Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,petroleum diesel if]","Electrification + Hydrogen - Other Industries Petroleum Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,heavy or residual fuel oil if]","Electrification + Hydrogen - Other Industries Heavy or Residual Fuel Oil Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of Industrial Fuel Use Shifted to Other Fuels[other industries,LPG propane or butane if]","Electrification + Hydrogen - Other Industries LPG Propane or Butane Use",[0,1],"Electrification + Hydrogen"),
-	(False,"Fraction of F Gas Substitution Achieved","F-Gas Substitution",[0,1],"F-gas Measures"),
-	(False,"Fraction of F Gas Destruction Achieved","F-Gas Destruction",[0,1],"F-gas Measures"),
-	(False,"Fraction of F Gas Recovery Achieved","F-Gas Recovery",[0,1],"F-gas Measures"),
-	(False,"Fraction of F Gas Inspct Maint Retrofit Achieved","F-Gas Eqpt. Maintenance n Retrofits",[0,1],"F-gas Measures"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[cement and other carbonates]","Material Efficiency, Longevity, n Re-Use - Cement Industry",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[iron and steel]","Material Efficiency, Longevity, n Re-Use - Iron and Steel Industry",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[chemicals]","Material Efficiency, Longevity, n Re-Use - Chemicals Industry",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[waste management]","Material Efficiency, Longevity, n Re-Use - Water n Waste",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Percent Reduction in Nonenergy Nonagriculture Industry Product Demand[other industries]","Material Efficiency, Longevity, n Re-Use - Other Industries",[0,1],"Material Efficiency, Longevity, n Re-Use"),
-	(False,"Fraction of Methane Capture Opportunities Achieved[natural gas and petroleum systems]","Methane Capture - Natural Gas and Petroleum Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Capture Opportunities Achieved[coal mining]","Methane Capture - Coal Mining Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Capture Opportunities Achieved[waste management]","Methane Capture - Water n Waste",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Destruction Opportunities Achieved[natural gas and petroleum systems]","Methane Destruction - Natural Gas and Petroleum Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Destruction Opportunities Achieved[coal mining]","Methane Destruction - Coal Mining Industry",[0,1],"Methane Capture and Destruction"),
-	(False,"Fraction of Methane Destruction Opportunities Achieved[waste management]","Methane Destruction - Water n Waste",[0,1],"Methane Capture and Destruction"),
-	(False,"Percent Reduction in Fossil Fuel Exports[hard coal]","Reduce Fossil Fuel Exports - Hard Coal",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[natural gas]","Reduce Fossil Fuel Exports - Natural Gas",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[petroleum gasoline]","Reduce Fossil Fuel Exports - Petroleum Gasoline",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[petroleum diesel]","Reduce Fossil Fuel Exports - Petroleum Diesel",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[jet fuel or kerosene]","Reduce Fossil Fuel Exports - Jet Fuel/Kerosene",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[crude oil]","Reduce Fossil Fuel Exports - Crude Oil",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[heavy or residual fuel oil]","Reduce Fossil Fuel Exports - Heavy/Residual Fuel Oil",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-	(False,"Percent Reduction in Fossil Fuel Exports[LPG propane or butane]","Reduce Fossil Fuel Exports - LPG/Propane/Butane",[0,1],"Percent Reduction in Fossil Fuel Exports"),
-
-	# Agriculture, Land Use, and Forestry Policies
-	(False,"Fraction of Afforestation and Reforestation Achieved","Afforestation and Reforestation",[0,1],"Afforestation and Reforestation"),
-	(False,"Fraction of Forest Set Asides Achieved","Forest Set-Asides",[0,1],"Forest Set-Asides"),
-	(False,"Fraction of Cropland and Rice Measures Achieved","Cropland and Rice Measures",[0,1],"Cropland and Rice Measures"),
-	(False,"Fraction of Improved Forest Management Achieved","Improved Forest Management",[0,1],"Improved Forest Management"),
-	(False,"Fraction of Livestock Measures Achieved","Livestock Measures",[0,1],"Livestock Measures"),
-	(False,"Percent Animal Products Shifted to Nonanimal Products","Shift to Non-Animal Products",[0,1],"Shift to Non-Animal Products"),
-
-	# District Heat and Hydrogen Sector Policies
-	(False,"Fraction of Non CHP Heat Production Converted to CHP","Use CHP for District Heat",[0,1],"District Heat CHP"),
-	(False,"Fraction of District Heat Fuel Use Shifted to Other Fuels","Produce District Heat with Hydrogen",[0,1],"District Heat Fuel Switching"),
-	(False,"Fraction of Hydrogen Production Pathways Shifted","Shift Hydrogen Production to Electrolysis",[0,1],"Hydrogen Electrolysis"),
-
-	# Cross-Sector Policies
-	(False,"Fraction of Potential Additional CCS Achieved[electricity sector]","Carbon Capture and Sequestration - Electricity Sector",[0,0.3],"Carbon Capture and Sequestration"),
-	(False,"Fraction of Potential Additional CCS Achieved[industry sector]","Carbon Capture and Sequestration - Industry Sector",[0,0.3],"Carbon Capture and Sequestration"),
-	(False,"Additional Carbon Tax Rate[transportation sector]","Carbon Tax - Transportation Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[electricity sector]","Carbon Tax - Electricity Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[residential buildings sector]","Carbon Tax - Residential Bldg Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[commercial buildings sector]","Carbon Tax - Commercial Bldg Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[industry sector]","Carbon Tax - Industry Sector",[0,300],"Carbon Tax"),
-	(False,"Additional Carbon Tax Rate[district heat and hydrogen sector]","Carbon Tax - District Heat n Hydrogen Sector",[0,300],"Carbon Tax"),
-	(False,"Toggle Whether Carbon Tax Affects Process Emissions","Carbon Tax Applies to Process Emissions",[0,1],"Carbon Tax on Process Emissions"),
-	(False,"Percent Reduction in BAU Subsidies[hard coal]","End Existing Subsidies - Hard Coal",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[natural gas]","End Existing Subsidies - Natural Gas",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[nuclear]","End Existing Subsidies - Nuclear",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[solar]","End Existing Subsidies - Solar",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[petroleum gasoline]","End Existing Subsidies - Petroleum Gasoline",[0,1],"End Existing Subsidies"),
-	(False,"Percent Reduction in BAU Subsidies[petroleum diesel]","End Existing Subsidies - Petroleum Diesel",[0,1],"End Existing Subsidies"),
-	(False,"Additional Fuel Tax Rate by Fuel[electricity]","Fuel Taxes - Electricity",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[hard coal]","Fuel Taxes - Hard Coal",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[natural gas]","Fuel Taxes - Natural Gas",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[petroleum gasoline]","Fuel Taxes - Petroleum Gasoline",[0,0.2],"Fuel Taxes"),
-	(False,"Additional Fuel Tax Rate by Fuel[petroleum diesel]","Fuel Taxes - Petroleum Diesel",[0,0.2],"Fuel Taxes"),
-
-	# Research & Development Levers
-	(False,"RnD Building Capital Cost Perc Reduction[heating]","Capital Cost Reduction - Buildings: Heating",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[cooling and ventilation]","Capital Cost Reduction - Buildings: Cooling and Ventilation",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[envelope]","Capital Cost Reduction - Buildings: Envelope",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[lighting]","Capital Cost Reduction - Buildings: Lighting",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[appliances]","Capital Cost Reduction - Buildings: Appliances",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Building Capital Cost Perc Reduction[other component]","Capital Cost Reduction - Buildings: Other Components",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD CCS Capital Cost Perc Reduction","Capital Cost Reduction",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[hard coal es]","Capital Cost Reduction - Electricity: Hard Coal",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[natural gas nonpeaker es]","Capital Cost Reduction - Electricity: Natural Gas Nonpeaker",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[nuclear es]","Capital Cost Reduction - Electricity: Nuclear",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[hydro es]","Capital Cost Reduction - Electricity: Hydro",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[onshore wind es]","Capital Cost Reduction - Electricity: Onshore Wind",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[solar PV es]","Capital Cost Reduction - Electricity: Solar PV",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[solar thermal es]","Capital Cost Reduction - Electricity: Solar Thermal",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[biomass es]","Capital Cost Reduction - Electricity: Biomass",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[natural gas peaker es]","Capital Cost Reduction - Electricity: Natural Gas Peaker",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[lignite es]","Capital Cost Reduction - Electricity: Lignite",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Electricity Capital Cost Perc Reduction[offshore wind es]","Capital Cost Reduction - Electricity: Offshore Wind",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[cement and other carbonates]","Capital Cost Reduction - Industry: Cement",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[natural gas and petroleum systems]","Capital Cost Reduction - Industry: Natural Gas and Petroleum",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[iron and steel]","Capital Cost Reduction - Industry: Iron and Steel",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[chemicals]","Capital Cost Reduction - Industry: Chemicals",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[coal mining]","Capital Cost Reduction - Industry: Mining",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[waste management]","Capital Cost Reduction - Industry: Water n Waste",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[agriculture]","Capital Cost Reduction - Industry: Agriculture",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Industry Capital Cost Perc Reduction[other industries]","Capital Cost Reduction - Industry: Other Industries",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[battery electric vehicle]","Capital Cost Reduction - Vehicles: Battery Electric",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[natural gas vehicle]","Capital Cost Reduction - Vehicles: Natural Gas",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[gasoline vehicle]","Capital Cost Reduction - Vehicles: Gasoline Engine",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[diesel vehicle]","Capital Cost Reduction - Vehicles: Diesel Engine",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[plugin hybrid vehicle]","Capital Cost Reduction - Vehicles: Plug-in Hybrid",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[LPG vehicle]","Capital Cost Reduction - Vehicles: LPG",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"RnD Transportation Capital Cost Perc Reduction[hydrogen vehicle]","Capital Cost Reduction - Vehicles: Hydrogen",[0,0.4],"RnD Capital Cost Reductions"),
-	(False,"Fraction of Direct Air Capture Potential Achieved","Direct Air Capture",[0,1],"Direct Air Capture"),
-	(False,"RnD Building Fuel Use Perc Reduction[heating]","Fuel Use Reduction - Buildings: Heating",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[cooling and ventilation]","Fuel Use Reduction - Buildings: Cooling and Ventilation",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[lighting]","Fuel Use Reduction - Buildings: Lighting",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[appliances]","Fuel Use Reduction - Buildings: Appliances",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Building Fuel Use Perc Reduction[other component]","Fuel Use Reduction - Buildings: Other Components",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD CCS Fuel Use Perc Reduction","Fuel Use Reduction",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[hard coal es]","Fuel Use Reduction - Electricity: Hard Coal",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[natural gas nonpeaker es]","Fuel Use Reduction - Electricity: Natural Gas Nonpeaker",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[nuclear es]","Fuel Use Reduction - Electricity: Nuclear",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[biomass es]","Fuel Use Reduction - Electricity: Biomass",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[natural gas peaker es]","Fuel Use Reduction - Electricity: Natural Gas Peaker",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Electricity Fuel Use Perc Reduction[lignite es]","Fuel Use Reduction - Electricity: Lignite",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[cement and other carbonates]","Fuel Use Reduction - Industry: Cement",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[natural gas and petroleum systems]","Fuel Use Reduction - Industry: Natural Gas and Petroleum",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[iron and steel]","Fuel Use Reduction - Industry: Iron and Steel",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[chemicals]","Fuel Use Reduction - Industry: Chemicals",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[coal mining]","Fuel Use Reduction - Industry: Mining",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[waste management]","Fuel Use Reduction - Industry: Water n Waste",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[agriculture]","Fuel Use Reduction - Industry: Agriculture",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Industry Fuel Use Perc Reduction[other industries]","Fuel Use Reduction - Industry: Other Industries",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[battery electric vehicle]","Fuel Use Reduction - Vehicles: Battery Electric",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[natural gas vehicle]","Fuel Use Reduction - Vehicles: Natural Gas",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[gasoline vehicle]","Fuel Use Reduction - Vehicles: Gasoline Engine",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[diesel vehicle]","Fuel Use Reduction - Vehicles: Diesel Engine",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[plugin hybrid vehicle]","Fuel Use Reduction - Vehicles: Plug-in Hybrid",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[LPG vehicle]","Fuel Use Reduction - Vehicles: LPG",[0,0.4],"RnD Fuel Use Reductions"),
-	(False,"RnD Transportation Fuel Use Perc Reduction[hydrogen vehicle]","Fuel Use Reduction - Vehicles: Hydrogen",[0,0.4],"RnD Fuel Use Reductions"),
-
-	# Control Settings
-	(False,"GDPGR Alternative Base Case GDP Growth Rate","COVID-19 Recession",[-0.1,0.02],""),
-	(False,"GRA for Carbon Tax Revenue[regular spending]","Carbon Tax Revenue - Regular Spending",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[deficit spending]","Carbon Tax Revenue - Deficit Spending",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[household taxes]","Carbon Tax Revenue - Household Taxes",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[payroll taxes]","Carbon Tax Revenue - Payroll Taxes",[0,10],""),
-	(False,"GRA for Carbon Tax Revenue[corporate taxes]","Carbon Tax Revenue - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[regular spending]","Fuel Tax Revenue - Regular Spending",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[deficit spending]","Fuel Tax Revenue - Deficit Spending",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[household taxes]","Fuel Tax Revenue - Household Taxes",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[payroll taxes]","Fuel Tax Revenue - Payroll Taxes",[0,10],""),
-	(False,"GRA for Fuel Tax Revenue[corporate taxes]","Fuel Tax Revenue - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for EV Subsidy[regular spending]","EV Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for EV Subsidy[deficit spending]","EV Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for EV Subsidy[household taxes]","EV Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for EV Subsidy[payroll taxes]","EV Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for EV Subsidy[corporate taxes]","EV Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[regular spending]","Electricity Generation Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[deficit spending]","Electricity Generation Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[household taxes]","Electricity Generation Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[payroll taxes]","Electricity Generation Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Electricity Generation Subsidies[corporate taxes]","Electricity Generation Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[regular spending]","Electricity Capacity Construction Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[deficit spending]","Electricity Capacity Construction Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[household taxes]","Electricity Capacity Construction Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[payroll taxes]","Electricity Capacity Construction Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Electricity Capacity Construction Subsidies[corporate taxes]","Electricity Capacity Construction Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[regular spending]","Distributed Solar Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[deficit spending]","Distributed Solar Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[household taxes]","Distributed Solar Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[payroll taxes]","Distributed Solar Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Distributed Solar Subsidy[corporate taxes]","Distributed Solar Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Fuel Subsidies[regular spending]","Fuel Subsidy - Regular Spending",[0,10],""),
-	(False,"GRA for Fuel Subsidies[deficit spending]","Fuel Subsidy - Deficit Spending",[0,10],""),
-	(False,"GRA for Fuel Subsidies[household taxes]","Fuel Subsidy - Household Taxes",[0,10],""),
-	(False,"GRA for Fuel Subsidies[payroll taxes]","Fuel Subsidy - Payroll Taxes",[0,10],""),
-	(False,"GRA for Fuel Subsidies[corporate taxes]","Fuel Subsidy - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for National Debt Interest[regular spending]","National Debt Interest - Regular Spending",[0,10],""),
-	(False,"GRA for National Debt Interest[deficit spending]","National Debt Interest - Deficit Spending",[0,10],""),
-	(False,"GRA for National Debt Interest[household taxes]","National Debt Interest - Household Taxes",[0,10],""),
-	(False,"GRA for National Debt Interest[payroll taxes]","National Debt Interest - Payroll Taxes",[0,10],""),
-	(False,"GRA for National Debt Interest[corporate taxes]","National Debt Interest - Corporate Income Taxes",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[regular spending]","Remaining Government Cash Flows - Regular Spending",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[deficit spending]","Remaining Government Cash Flows - Deficit Spending",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[household taxes]","Remaining Government Cash Flows - Household Taxes",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[payroll taxes]","Remaining Government Cash Flows - Payroll Taxes",[0,10],""),
-	(False,"GRA for Remaining Government Cash Flow Changes[corporate taxes]","Remaining Government Cash Flows - Corporate Income Taxes",[0,10],"")
-
-)
+# The policies that can be included in the Vensim command script, which of them are enabled, and what
+# setting values they use are specified in PolicyRegistry.py, which is shared with CreateContributionTestScript.py.
+# Edit PolicyRegistry.py to enable policies and change their settings before running this script.
+# Policies in PolicyRegistry.py also have groups, which are not used in this script.  It would be
+# difficult to support groups here because policies can have an arbitrary number of settings, so
+# different policies within a group may have different numbers of settings, and it's not clear how
+# to test a group as a single entity under all possible user-defined setting combinations.
+
+import PolicyRegistry
+from PolicyRegistry import LongName, ShortName, Settings, Group
+
 
 # Building the Policy List
 # ------------------------
-# Every policy, whether enabled or not, appears in a tuple called "PotentialPolicies" that was constructed above.
-# Now we construct the actual list of policies to be included (named "Policies") by
-# checking which of the policies have been enabled.
+# We load the list of enabled policies (named "Policies") from the policy registry.  For each enabled
+# policy, we also look up the text that begins its SETVAL instruction and its column in the RunResultsFile,
+# which the registry prepares once, so that we only need to add the setting value for each run.
+
+Policies = PolicyRegistry.EnabledPolicies()
+PolicySetValPrefixes = [PolicyRegistry.SetValPrefixes[Policy[LongName]] for Policy in Policies]
+PolicyColumnPrefixes = [PolicyRegistry.ColumnPrefixes[Policy[LongName]] for Policy in Policies]
 
-Policies = []
-for PotentialPolicy in PotentialPolicies:
-	if PotentialPolicy[Enabled]:
-		Policies.append(PotentialPolicy)
 
 		
-# Next, we define two functions that build lists of policy settings.  One builds a list of all combinations
-# of settings.  The other builds a list of each setting of each enabled policy tested individually (plus
-# the BAU case).  Which function will be called is determined by the user's setting for the
-# "IndividualPoliciesOnly" variable above.
-
-def BuildPolicyCombinationsSettingsList():
-
-	# We need to use unusual syntax to generate our list of non-repeating policy setting combinations
-	# (see below).  To make a statement whose syntax works for an arbitrary number of policies, I
-	# found it clearest and easiest to build the required statement as a string (so that I can
-	# append to it using for loops), then execute the string as code at the end.  This next segment
-	# constructs the string we plan to execute.  An example of what it should look like when it's
-	# done appears in a comment below.
-	
-	ExpressionToBuildList = "PolicySettingCombinations = [ ("
+# Next, we define two functions that describe the set of policy setting combinations.  One generates
+# the combinations themselves, and the other counts them.  Neither function builds a list of all the
+# combinations, because with more than a handful of enabled policies, such a list can contain millions
+# of entries and exhaust the available memory.
+
+import itertools
+
+def GeneratePolicySettingCombinations():
+
+	if SamplingMethod == "LatinHypercube":
+		return GenerateSampledPolicySettingCombinations(GenerateLatinHypercubeSamples())
+	if SamplingMethod == "Sobol":
+		return GenerateSampledPolicySettingCombinations(GenerateSobolSamples())
+	if RunOrder == "GrayCode":
+		return GenerateGrayCodePolicySettingCombinations()
+
+	# itertools.product() produces one combination at a time, on request, rather than building all of
+	# them at once.  Each combination is a tuple containing one setting value for each enabled policy,
+	# in the same order as the "Policies" list.  For example, if three policies are enabled, with
+	# settings [0,1], [0,1], and [0,5,10], the combinations are produced in the following order:
+	# (0, 0, 0), (0, 0, 5), (0, 0, 10), (0, 1, 0), (0, 1, 5)... (1, 1, 10)
+	return itertools.product(*[Policy[Settings] for Policy in Policies])
+
+def GenerateGrayCodePolicySettingCombinations():
+
+	# We walk through the combinations in reflected Gray code order.  We track the position of each
+	# policy within its Settings list and the direction in which that position is currently moving.
+	# To find the next combination, we try to move the last policy one step in its direction.  If it
+	# is already at the end of its Settings list in that direction, we reverse its direction and try
+	# the policy before it instead, and so on.  Exactly one policy changes at each step, and the walk
+	# ends when no policy can move.  For example, with settings [0,1], [0,1], and [0,5,10], the
+	# combinations are produced in the following order:
+	# (0, 0, 0), (0, 0, 5), (0, 0, 10), (0, 1, 10), (0, 1, 5), (0, 1, 0), (1, 1, 0)... (1, 0, 0)
+	Positions = [0] * len(Policies)
+	Directions = [1] * len(Policies)
+	while True:
+		yield tuple(Policies[ActivePolicy][Settings][Positions[ActivePolicy]] for ActivePolicy in range(len(Policies)))
+		ActivePolicy = len(Policies) - 1
+		while ActivePolicy >= 0:
+			NewPosition = Positions[ActivePolicy] + Directions[ActivePolicy]
+			if 0 <= NewPosition < len(Policies[ActivePolicy][Settings]):
+				Positions[ActivePolicy] = NewPosition
+				break
+			Directions[ActivePolicy] = -Directions[ActivePolicy]
+			ActivePolicy -= 1
+		if ActivePolicy < 0:
+			return
+
+# When sampling, each sample is a tuple containing one number from 0 up to (but not including) 1 for each
+# enabled policy, describing where that policy's setting falls within its range of settings.
+
+import random
+
+def GenerateLatinHypercubeSamples():
+
+	# For each policy, we shuffle the numbers of the RunBudget slices, so that run number N uses slice
+	# SliceOrders[Policy][N] of that policy's range, then pick a random point within that slice.
+	Generator = random.Random(RandomSeed)
+	SliceOrders = []
 	for Policy in Policies:
-		ExpressionToBuildList += ("P" + str(Policies.index(Policy)) + ", ")
-	ExpressionToBuildList = ExpressionToBuildList[:-2]
-	ExpressionToBuildList += ") "
+		SliceOrder = list(range(RunBudget))
+		Generator.shuffle(SliceOrder)
+		SliceOrders.append(SliceOrder)
+	for Run in range(RunBudget):
+		yield tuple((SliceOrder[Run] + Generator.random()) / RunBudget for SliceOrder in SliceOrders)
+
+def GenerateSobolSamples():
+
+	from scipy.stats import qmc
+	Sampler = qmc.Sobol(d=len(Policies), scramble=True, seed=RandomSeed)
+	for Sample in Sampler.random(RunBudget):
+		yield tuple(float(Value) for Value in Sample)
+
+def GenerateSampledPolicySettingCombinations(Samples):
+
+	# We convert each sample to setting values.  For discrete settings, we divide the range from 0 to 1
+	# into one equal part per entry in the policy's Settings list.  For continuous settings, we scale
+	# the sample to the span between the policy's smallest and largest settings.
+	for Sample in Samples:
+		PolicySettingCombination = []
+		for ActivePolicy in range(len(Policies)):
+			PolicySettings = Policies[ActivePolicy][Settings]
+			if SettingsType == "Continuous":
+				PolicySettingCombination.append(min(PolicySettings) + Sample[ActivePolicy] * (max(PolicySettings) - min(PolicySettings)))
+			else:
+				PolicySettingCombination.append(PolicySettings[min(int(Sample[ActivePolicy] * len(PolicySettings)), len(PolicySettings) - 1)])
+		yield tuple(PolicySettingCombination)
+
+def CountPolicySettingCombinations():
+
+	if SamplingMethod != "FullFactorial":
+		return RunBudget
+
+	# The number of combinations is the product of the number of settings of each enabled policy,
+	# so we can calculate it without generating any of the combinations.
+	RunCount = 1
 	for Policy in Policies:
-		ExpressionToBuildList += ("for P" + str(Policies.index(Policy)) + " in range(len(Policies[" + str(Policies.index(Policy)) + "][Settings])) ")
-	ExpressionToBuildList += "]"
-	
-	# At this point, ExpressionToBuildList contains a command similar to the following example (which assumes
-	# only three policies are enabled):
-	# PolicySettingCombinations = [ (P0, P1, P2) for P0 in range(len(Policies[0][Settings])) for P1 in range(len(Policies[1][Settings])) for P2 in range(len(Policies[2][Settings])) ]
+		RunCount *= len(Policy[Settings])
+	return RunCount
+
+
+# Shard File Names
+# ----------------
+# Each shard's file names are formed by adding "-ShardN" to the file names chosen above, ahead of
+# any file extension.  When only one shard is used, the file names are used unchanged.
+
+import os
+
+def ShardFileName(FileName, ShardNumber):
+	if ShardCount == 1:
+		return FileName
+	FileNameRoot, FileNameExtension = os.path.splitext(FileName)
+	return FileNameRoot + "-Shard" + str(ShardNumber) + FileNameExtension
+
+
+# Merge Shard Results
+# -------------------
+# In "MergeShards" mode, we do not write any command scripts.  Instead, we combine the RunResultsFiles
+# written by each shard into a single RunResultsFile.  The runs were numbered consecutively across all
+# shards when the command scripts were generated, so the CurrentRunNumber values are already consistent
+# and we only need to copy the rows in shard order.  Each shard's RunResultsFile begins with its own
+# "Time" row, so we keep the "Time" row from the first shard and skip it in the others.  We copy one
+# line at a time, so the RunResultsFiles never need to fit in memory.
+
+def MergeShardResults():
+
+	# Give error and exit if any shard's RunResultsFile is missing (unless AllowPartialMerge is True), before
+	# writing anything.  (When the run cache is used, a shard may contain no runs, in which case Vensim does not
+	# write a RunResultsFile for it.)  The error is only written to the console, since writing it to the
+	# RunResultsFile would overwrite the results of an earlier merge, which "Resume" mode needs.
+	ShardsWithResults = []
+	MissingShardFiles = []
+	for ShardNumber in range(1, ShardCount + 1):
+		if os.path.exists(ShardFileName(RunResultsFile, ShardNumber)):
+			ShardsWithResults.append(ShardNumber)
+			continue
+		ShardScript = open(ShardFileName(OutputScript, ShardNumber), 'r')
+		ShardHasRuns = any(Line.startswith("MENU>RUN|") for Line in ShardScript)
+		ShardScript.close()
+		if ShardHasRuns:
+			MissingShardFiles.append(ShardFileName(RunResultsFile, ShardNumber))
+	if MissingShardFiles and not AllowPartialMerge:
+		ErrorMessage = "Error: " + ", ".join(MissingShardFiles) + " not found.  All shard command scripts must finish before their results can be merged.  To merge the other shards' results and perform the missing runs in \"Resume\" mode, set AllowPartialMerge to True."
+		import sys
+		sys.exit(ErrorMessage)
+	if MissingShardFiles:
+		print("Skipped " + ", ".join(MissingShardFiles) + " (not found).  Use \"Resume\" mode to perform the missing runs.")
+
+	f = open(RunResultsFile, 'w')
+	for ShardNumber in ShardsWithResults:
+		ShardResults = open(ShardFileName(RunResultsFile, ShardNumber), 'r')
+		for Line in ShardResults:
+			if ShardNumber != ShardsWithResults[0] and Line.startswith("Time\t"):
+				continue
+			f.write(Line)
+		ShardResults.close()
+	f.close()
 
+if ScriptMode == "MergeShards":
+	if ShardCount > 1:
+		MergeShardResults()
+	import sys
+	sys.exit()
 
-	# Now we execute the expression, which generates a list containing non-repeating combinations of
-	# our policy settings for each enabled policy.  Since we are inside a function, we need to give the
-	# resulting variable global scope, so we pass globals() as the second argument to exec().  See the
-	# Python 3 documentation for more details.
-	exec(ExpressionToBuildList, globals())
 
-	# Now we have created a list called "PolicySettingCombinations" which contains values such as
-	# (if three policies, which each have three possible settings, are enabled):
-	# [(0, 0, 0), (0, 0, 1), (0, 0, 2), (0, 1, 0), (0, 1, 1), (0, 1, 2), (0, 2, 0)... (2, 2, 2)]
-	
-	return PolicySettingCombinations
+# Update From Run Cache
+# ---------------------
+# In "UpdateFromRunCache" mode, we do not write any command scripts.  Instead, we store the results of the
+# runs performed by Vensim in the run cache and add the results of the runs that were left out of the
+# command script(s) to the RunResultsFile.  (See RunCache.py for details.)
+
+import RunCache
+
+if ScriptMode == "UpdateFromRunCache":
+	if not os.path.exists(RunCacheListFile):
+		ErrorMessage = "Error: " + RunCacheListFile + " was not found.  It is written when command scripts are generated with UseRunCache set to True, and it is removed once the RunResultsFile has been updated."
+		import sys
+		sys.exit(ErrorMessage)
+	RunsStored, RunsFilled = RunCache.UpdateRunResultsFromCache(RunResultsFile, RunCacheListFile, RunCacheFolder, FirstYear, FinalYear)
+	print("Stored " + str(RunsStored) + " runs in the run cache and added " + str(RunsFilled) + " cached runs to " + RunResultsFile)
+	import sys
+	sys.exit()
 
 
-# We invoke the function that builds the list of policy setting combinations.
-# If fewer than two policies were enabled, we instead produce an error
-# and exit.  (We write the error to the text file, because many users won't
-# be using a console and won't see the message produced by sys.exit().
-# Note that the function BuildPolicyCombinationsSettingList() fails if there
-# is only one enabled policy, so we do not invoke it unless there are at
-# least two enabled policies.
+# If no policies were enabled, we produce an error and exit.  (We write the error to the text file,
+# because many users won't be using a console and won't see the message produced by sys.exit().)
 
 if len(Policies) < 1:
 	f = open(OutputScript, 'w')
-	ErrorMessage = "Error: No policies were enabled in the Python script.  Before running the script, you must enable at least two policies."
+	ErrorMessage = "Error: No policies were enabled in the Python script.  Before running the script, you must enable at least one policy."
 	f.write(ErrorMessage)
 	f.close()
 	import sys
 	sys.exit(ErrorMessage)
-elif len(Policies) == 1:
+
+# Give error and exit if Sobol sampling was selected but SciPy is not installed
+if SamplingMethod == "Sobol":
+	try:
+		from scipy.stats import qmc
+	except ImportError:
+		f = open(OutputScript, 'w')
+		ErrorMessage = "Error: Sobol sampling requires the SciPy package.  Install SciPy or select \"LatinHypercube\" sampling."
+		f.write(ErrorMessage)
+		f.close()
+		import sys
+		sys.exit(ErrorMessage)
+
+# Give error and exit if ShardCount would leave any shard without runs
+if ShardCount < 1 or ShardCount > CountPolicySettingCombinations():
 	f = open(OutputScript, 'w')
-	ErrorMessage = "Error: Only one policy was enabled in the Python script.  Before running the script, you must enable at least two policies."
+	ErrorMessage = "Error: ShardCount must be at least 1 and no greater than the number of runs (" + str(CountPolicySettingCombinations()) + ")."
 	f.write(ErrorMessage)
 	f.close()
 	import sys
 	sys.exit(ErrorMessage)
-else:
-	PolicySettingCombinations = BuildPolicyCombinationsSettingsList()
+
+TotalRuns = CountPolicySettingCombinations()
+import BatchPlanner
+
+# When the run cache is used, we calculate the part of each run's key that is shared by all runs once.
+if UseRunCache:
+	EnvironmentHash = RunCache.HashModelEnvironment(ModelFile, InputDataFolder, OutputVarsFile, FirstYear, FinalYear)
 
 
 # Generate Vensim Command Script
 # ------------------------------
-# We begin by creating a new file to serve as the Vensim command script (overwriting
-# any older version at that filename).  We then tell Vensim to load
-# the model file, and we give it a RUNNAME that will be used for all runs.  (It is
-# overwritten each run, and the Vensim command file generated by this script
-# always contains multiple runs, unless you only have one enabled policy and one
-# setting value for that policy.)
-f = open(OutputScript, 'w')
-f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
-f.write("SIMULATE>RUNNAME|" + RunName + "\n")
-
-# The following options may be useful in certain cases, but they may slow Vensim down
-# or increase the odds that Vensim crashes during execution of a batch of runs (though
-# it is hard to tell for sure).  These lines are usually best left commented out.
-# f.write("SPECIAL>NOINTERACTION\n")
-# f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
-f.write("\n")
-
-# Only for the first entry in the TSV file, we wish to include the "Time" row and
-# overwrite any existing TSV file of that name.  Other entries append to the TSV file.
-FirstEntryDone = False
-
-# We track a run number, so that we can number the runs in the output file (because
-# each run will have multiple rows- one for each output variable).
-CurrentRunNumber = 1
-
-# We need a single run of Vensim for each PolicySettingCombination.  We start by clearing
-# any policy changes from old runs by reading the NoPolicies.cin file.
-# Then, each run must have one SIMULATE>SETVAL instruction for each enabled policy.
-# The most complex details here are the bits that look up the values of the settings
-# for each policy.  We next array references- for example, "Policies[ActivePolicy]"
-# refers to a single policy, which is itself a list.  Therefore, to reference an element
-# of that list, we add another bracketed clause to the right, such as "[LongName]" if
-# we want the long name text string for that policy.
-for PolicySettingCombination in PolicySettingCombinations:
-	
-	for ActivePolicy in range(len(Policies)):	
-		f.write("SIMULATE>SETVAL|" + Policies[ActivePolicy][LongName] + "=" + str(Policies[ActivePolicy][Settings][PolicySettingCombination[ActivePolicy]]) + "\n")
+# We define a function that begins a new Vensim command script (overwriting any older version at
+# that filename).  It tells Vensim to load the model file, and gives it a RUNNAME that will be used
+# for all runs in that command script.  (It is overwritten each run, and the Vensim command file
+# generated by this script always contains multiple runs, unless you only have one enabled policy
+# and one setting value for that policy.)
+def WriteScriptHeader(f, ScriptRunName):
+	f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n')
+	f.write("SIMULATE>RUNNAME|" + ScriptRunName + "\n")
+
+	# The following options may be useful in certain cases, but they may slow Vensim down
+	# or increase the odds that Vensim crashes during execution of a batch of runs (though
+	# it is hard to tell for sure).  These lines are usually best left commented out.
+	# f.write("SPECIAL>NOINTERACTION\n")
+	# f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
+	f.write("\n")
+
+# The text following the ":" in a VDF2TAB instruction is added to every row of the RunResultsFile for
+# that run.  It consists of the RunName, the run number, and one column per policy, followed by blank
+# columns if we haven't added enough policy columns to satisfy the MinPolicyCols setting.
+def RunLabel(ScriptRunName, CurrentRunNumber, PolicySettingCombination):
+	LabelColumns = [ScriptRunName, "CurrentRunNumber=" + str(CurrentRunNumber)]
+	for ColumnPrefix, Setting in zip(PolicyColumnPrefixes, PolicySettingCombination):
+		LabelColumns.append(ColumnPrefix + str(Setting))
+	ExtraCols = max(0, MinPolicyCols - len(Policies))
+	for Cols in range(0, ExtraCols):
+		LabelColumns.append("-")
+	return "\t".join(LabelColumns)
+
+# Next, we define a function that writes a single run of Vensim for one PolicySettingCombination.
+# Each run must have one SIMULATE>SETVAL instruction for each enabled policy (or for each enabled
+# policy with a non-zero setting, if OmitZeroSetVals is True).  Each
+# PolicySettingCombination holds the setting values themselves, in the same order as the "Policies"
+# list, so the setting for "Policies[ActivePolicy]" is "PolicySettingCombination[ActivePolicy]".
+# Only for the first entry in each TSV file do we wish to include the "Time" row and overwrite
+# any existing TSV file of that name.  Other entries append to the TSV file.  We track a run
+# number, so that we can number the runs in the output file (because each run will have multiple
+# rows- one for each output variable).  The run is labeled with LabelRunName in the RunResultsFile, if it is
+# given, or with ScriptRunName otherwise.
+def WriteRun(f, ScriptRunName, ScriptRunResultsFile, PolicySettingCombination, CurrentRunNumber, FirstEntryDone, LabelRunName = None):
+
+	# We collect the SETVAL instructions in a list and write them all at once, which is faster than
+	# writing each piece of each instruction separately.
+	SetValLines = []
+	for SetValPrefix, Setting in zip(PolicySetValPrefixes, PolicySettingCombination):
+		if OmitZeroSetVals and Setting == 0:
+			continue
+		SetValLines.append(SetValPrefix + str(Setting) + "\n")
+	f.write("".join(SetValLines))
 	
 	# We include a SETVAL instruction to select the correct policy implementation schedule file
 	f.write("SIMULATE>SETVAL|Policy Implementation Schedule Selector=" + str(PolicySchedule) + "\n")
@@ -579,30 +438,311 @@ for PolicySettingCombination in PolicySettingCombinations:
 	# manual for details.  But the general idea is that at the end (after the series of
 	# vertical bars), we can add columns for arbitrary text, and we use this functionality
 	# to add entries to the spreadsheet showing what policy settings were used for this run.
-	# Then we add blank columns if we haven't added enough policy columns to satisfy the
-	# MinPolicyCols setting.
 	if FirstEntryDone:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
+		f.write("MENU>VDF2TAB|" + ScriptRunName + ".vdfx|" + ScriptRunResultsFile + "|" + OutputVarsFile + "|+!||" + FirstYear + "|" + FinalYear + "|:")
 	else:
-		f.write("MENU>VDF2TAB|" + RunName + ".vdfx|" + RunResultsFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
-		FirstEntryDone = True
-	f.write(RunName)
-	f.write("\tCurrentRunNumber=" + str(CurrentRunNumber))
-	CurrentRunNumber += 1
-	PolicyCols = 0
-	for Policy in Policies:
-		f.write("\t" + Policy[ShortName] + "=" + str(Policy[Settings][PolicySettingCombination[Policies.index(Policy)]]))
-		PolicyCols += 1
-	ExtraCols = max(0, MinPolicyCols - PolicyCols)
-	for Cols in range(0, ExtraCols):
-		f.write("\t-")
+		f.write("MENU>VDF2TAB|" + ScriptRunName + ".vdfx|" + ScriptRunResultsFile + "|" + OutputVarsFile + "|||" + FirstYear + "|" + FinalYear + "|:")
+	f.write(RunLabel(LabelRunName or ScriptRunName, CurrentRunNumber, PolicySettingCombination))
 	f.write("\n")
 
 	# We instruct Vensim to delete the .vdfx file, to prevent it from getting picked up by
 	# sync software, such as DropBox or Google Drive.  If sync software locks the file,
 	# Vensim won't be able to overwrite it on the next model run, ruining the batch.
-	f.write("FILE>DELETE|" + RunName + ".vdfx")
+	f.write("FILE>DELETE|" + ScriptRunName + ".vdfx")
 	f.write("\n\n")
 
-# We are done writing the Vensim command script and therefore close the file.
-f.close()
+# When the run cache is used, we leave out of the command script(s) every run whose results are
+# already cached, as well as any run with the same key as an earlier run in this batch (since its
+# results will be cached once the earlier run is done).  The following function generates the runs
+# that must be performed, with their run numbers and keys.  If a RunCacheList is given, it also
+# records every run in that list, and it writes every run (whether performed or not) to the
+# RunManifestFile, if one is given.  When the run cache is not used, every run is performed.
+def GenerateRunsToPerform(RunManifest, RunCacheList):
+
+	if UseRunCache:
+		KeysToPerform = set()
+
+	for CurrentRunNumber, PolicySettingCombination in enumerate(GeneratePolicySettingCombinations(), 1):
+
+		if RunManifest is not None:
+			RunManifest.write(str(CurrentRunNumber) + "\t" + "\t".join(str(Setting) for Setting in PolicySettingCombination) + "\n")
+
+		Key = None
+		if UseRunCache:
+			Key = RunCache.RunKey(EnvironmentHash, PolicySchedule, zip([Policy[LongName] for Policy in Policies], PolicySettingCombination))
+			if Key in KeysToPerform or RunCache.IsCached(RunCacheFolder, Key):
+				if RunCacheList is not None:
+					RunCache.RecordRun(RunCacheList, "Hit", Key, RunLabel(RunName, CurrentRunNumber, PolicySettingCombination))
+				continue
+			KeysToPerform.add(Key)
+
+		yield CurrentRunNumber, PolicySettingCombination, Key
+
+# We divide the runs among the shards as evenly as possible: every shard receives the same number
+# of runs, except that the first few shards receive one extra run each when the runs cannot be
+# divided evenly.  Each shard takes the next consecutive runs from a single generator of policy
+# setting combinations, so each combination is generated once and no more than one combination is
+# held in memory at a time, and run numbers continue from one shard to the next.
+def WriteCommandScripts():
+
+	# When the run cache is used, we first count the runs that must be performed, so we can divide
+	# them among the shards.  This requires a separate pass through the runs, because we never hold
+	# all of them in memory.
+	RunsToPerform = TotalRuns
+	if UseRunCache:
+		RunsToPerform = sum(1 for Run in GenerateRunsToPerform(None, None))
+
+	# We estimate the time and output size of the batch before writing it, assuming the shards are performed
+	# at the same time.  Every run label is assumed to be as long as the label of the last run with the longest
+	# setting of each policy.  BatchPlanner.py stops the script here if DryRun is True or if the batch is over
+	# the budget set in BatchPlanner.py.
+	LongestSettings = tuple(max(Policy[Settings], key = lambda Setting: len(str(Setting))) for Policy in Policies)
+	LongestRunLabel = len(RunLabel(ShardFileName(RunName, ShardCount), TotalRuns, LongestSettings))
+	BatchPlanner.PlanBatch(ShardFileName(OutputScript, 1), RunsToPerform, OutputVarsFile, FirstYear, FinalYear, LongestRunLabel, ParallelScripts = ShardCount, CommandScripts = ShardCount, DryRun = DryRun)
+
+	# We report the number of runs the command script(s) will contain before writing them, so the user can
+	# stop the script if that number is too large for Vensim to complete in a reasonable amount of time.
+	RunCacheList = None
+	if UseRunCache:
+		RunCacheList = open(RunCacheListFile, 'w')
+		print(str(TotalRuns - RunsToPerform) + " of " + str(TotalRuns) + " runs were found in the run cache")
+	print("Writing " + str(RunsToPerform) + " runs to " + str(ShardCount) + " command script(s)")
+
+	# We write a header row for the RunManifestFile, with a column for each enabled policy
+	RunManifest = open(RunManifestFile, 'w')
+	RunManifest.write("CurrentRunNumber\t" + "\t".join(Policy[ShortName] for Policy in Policies) + "\n")
+
+	Runs = GenerateRunsToPerform(RunManifest, RunCacheList)
+
+	for ShardNumber in range(1, ShardCount + 1):
+
+		ShardRuns = RunsToPerform // ShardCount
+		if ShardNumber <= RunsToPerform % ShardCount:
+			ShardRuns += 1
+
+		ShardRunName = ShardFileName(RunName, ShardNumber)
+		ShardRunResultsFile = ShardFileName(RunResultsFile, ShardNumber)
+
+		f = open(ShardFileName(OutputScript, ShardNumber), 'w')
+		WriteScriptHeader(f, ShardRunName)
+
+		FirstEntryDone = False
+		for CurrentRunNumber, PolicySettingCombination, Key in itertools.islice(Runs, ShardRuns):
+			WriteRun(f, ShardRunName, ShardRunResultsFile, PolicySettingCombination, CurrentRunNumber, FirstEntryDone)
+			if RunCacheList is not None:
+				RunCache.RecordRun(RunCacheList, "Miss", Key, RunLabel(ShardRunName, CurrentRunNumber, PolicySettingCombination))
+			FirstEntryDone = True
+
+		# We are done writing this Vensim command script and therefore close the file.
+		f.close()
+
+		# A shard without runs (which is possible when the run cache is used) does not write a RunResultsFile, so we
+		# remove any RunResultsFile left by an earlier batch, which would otherwise be merged with this batch's results.
+		if ShardRuns == 0 and os.path.exists(ShardRunResultsFile):
+			os.remove(ShardRunResultsFile)
+
+	# Any runs after the last one performed were found in the run cache, but they must still be
+	# written to the RunManifestFile and RunCacheListFile.
+	for Run in Runs:
+		pass
+
+	RunManifest.close()
+	if RunCacheList is not None:
+		RunCacheList.close()
+
+
+# Validate Vensim Command Script
+# ------------------------------
+# In "Validate" mode, we read back the command script(s) written with the current settings and replay
+# them the way Vensim does: every enabled policy starts each run at zero (its disabled value), and the
+# SETVAL instructions that precede a RUN instruction change the settings for that run only.  For each
+# run, we compare the resulting (effective) settings to the settings recorded in the RunResultsFile
+# columns by its VDF2TAB instruction, which are the values a script with a SETVAL instruction for every
+# policy would have used.  We also check that the runs appear in the expected order with consecutive run
+# numbers, that each run selects the correct policy implementation schedule, and in "GrayCode" order,
+# that consecutive runs differ in the setting of exactly one policy.  (When the run cache is used, the
+# runs found in the cache are expected to be missing, so consecutive runs may differ in more than one
+# policy.  The run cache must not be updated between generating and validating the command scripts.)
+# Every problem found is written to the ValidationLogFile.  We read one line at a time, so the command scripts never need to fit in memory.
+
+def ValidateCommandScripts():
+
+	PolicyIndexByLongName = {}
+	PolicyIndexByShortName = {}
+	for ActivePolicy in range(len(Policies)):
+		PolicyIndexByLongName[Policies[ActivePolicy][LongName]] = ActivePolicy
+		PolicyIndexByShortName[Policies[ActivePolicy][ShortName]] = ActivePolicy
+
+	ErrorsFound = 0
+	ValidationLog = open(ValidationLogFile, 'w')
+	ExpectedRuns = GenerateRunsToPerform(None, None)
+	RunsFound = 0
+	PreviousSettings = None
+
+	for ShardNumber in range(1, ShardCount + 1):
+
+		ScriptFileName = ShardFileName(OutputScript, ShardNumber)
+		if not os.path.exists(ScriptFileName):
+			ValidationLog.write(ScriptFileName + " was not found.\n")
+			ErrorsFound += 1
+			continue
+
+		EffectiveSettings = [0] * len(Policies)
+		EffectiveSchedule = None
+		Script = open(ScriptFileName, 'r')
+		for LineNumber, Line in enumerate(Script, 1):
+			Line = Line.rstrip("\n")
+			Location = ScriptFileName + " line " + str(LineNumber) + ": "
+
+			if Line.startswith("SIMULATE>SETVAL|"):
+				VariableName, _, Value = Line[len("SIMULATE>SETVAL|"):].rpartition("=")
+				if VariableName == "Policy Implementation Schedule Selector":
+					EffectiveSchedule = Value
+				elif VariableName in PolicyIndexByLongName:
+					EffectiveSettings[PolicyIndexByLongName[VariableName]] = float(Value)
+				else:
+					ValidationLog.write(Location + "SETVAL for " + VariableName + ", which is not an enabled policy.\n")
+					ErrorsFound += 1
+
+			elif Line.startswith("MENU>VDF2TAB|"):
+
+				# The columns following the ":" are the RunName, the run number, and one column per policy
+				RecordedColumns = Line.partition("|:")[2].split("\t")
+				RecordedRunNumber = RecordedColumns[1].partition("CurrentRunNumber=")[2]
+				ExpectedRunNumber, ExpectedSettings, Key = next(ExpectedRuns, (None, None, None))
+				if RecordedRunNumber != str(ExpectedRunNumber):
+					ValidationLog.write(Location + "run number " + RecordedRunNumber + " found where run number " + str(ExpectedRunNumber) + " was expected.\n")
+					ErrorsFound += 1
+				RecordedSettings = [0] * len(Policies)
+				for RecordedColumn in RecordedColumns[2:]:
+					if RecordedColumn == "-":
+						continue
+					PolicyShortName, _, Value = RecordedColumn.rpartition("=")
+					RecordedSettings[PolicyIndexByShortName[PolicyShortName]] = float(Value)
+
+				if EffectiveSettings != RecordedSettings:
+					for ActivePolicy in range(len(Policies)):
+						if EffectiveSettings[ActivePolicy] != RecordedSettings[ActivePolicy]:
+							ValidationLog.write(Location + "run " + RecordedRunNumber + " sets " + Policies[ActivePolicy][ShortName] + " to " + str(EffectiveSettings[ActivePolicy]) + " but records it as " + str(RecordedSettings[ActivePolicy]) + ".\n")
+							ErrorsFound += 1
+				if EffectiveSchedule != str(PolicySchedule):
+					ValidationLog.write(Location + "run " + RecordedRunNumber + " selects policy implementation schedule " + str(EffectiveSchedule) + " instead of " + str(PolicySchedule) + ".\n")
+					ErrorsFound += 1
+
+				if ExpectedSettings is None or RecordedSettings != [float(Setting) for Setting in ExpectedSettings]:
+					ValidationLog.write(Location + "run " + RecordedRunNumber + " does not have the settings expected for run " + str(ExpectedRunNumber) + ".\n")
+					ErrorsFound += 1
+				if SamplingMethod == "FullFactorial" and RunOrder == "GrayCode" and not UseRunCache and PreviousSettings is not None:
+					ChangedPolicies = sum(1 for ActivePolicy in range(len(Policies)) if RecordedSettings[ActivePolicy] != PreviousSettings[ActivePolicy])
+					if ChangedPolicies != 1:
+						ValidationLog.write(Location + "run " + RecordedRunNumber + " changes the settings of " + str(ChangedPolicies) + " policies from the previous run.\n")
+						ErrorsFound += 1
+				PreviousSettings = RecordedSettings
+				RunsFound += 1
+
+				# Vensim clears SETVAL values once the run is complete, so the next run starts from zero
+				EffectiveSettings = [0] * len(Policies)
+				EffectiveSchedule = None
+
+		Script.close()
+
+	RunsMissing = sum(1 for Run in ExpectedRuns)
+	if RunsMissing > 0:
+		ValidationLog.write("Found " + str(RunsFound) + " runs, but the current settings produce " + str(RunsFound + RunsMissing) + " runs.\n")
+		ErrorsFound += 1
+
+	if ErrorsFound == 0:
+		ValidationLog.write("No errors found in " + str(RunsFound) + " runs.\n")
+	ValidationLog.close()
+	print(str(ErrorsFound) + " error(s) found.  See " + ValidationLogFile + " for details.")
+
+
+# Resume an Interrupted Batch
+# ---------------------------
+# In "Resume" mode, we first collect the run numbers that appear in the RunResultsFile.  Vensim writes
+# all of a run's rows at once, so any run number found there belongs to a completed run.  (We skip the
+# "Time" row, which carries the columns of the first run but is not itself a result.)  Then we read the
+# RunManifestFile one line at a time and write a run to the ResumeScript for each run number that was
+# not found.  Setting values are read back with ast.literal_eval(), which restores the exact numbers
+# that were written, so the policy columns match those of the original command script.  If the
+# RunCacheListFile is found, the batch used the run cache and has not yet been updated from it, so we
+# also skip the run numbers recorded as a "Hit", and we label each resumed run with the RunName
+# recorded for it (the shard's RunName, if shards were used), which is how the update finds its results.
+
+import ast
+
+def WriteResumeScript():
+
+	# Give error and exit if the RunManifestFile is missing or was written for different enabled policies
+	ErrorMessage = None
+	if not os.path.exists(RunManifestFile):
+		ErrorMessage = "Error: " + RunManifestFile + " was not found.  A run manifest is written when command scripts are generated."
+	else:
+		RunManifest = open(RunManifestFile, 'r')
+		ManifestPolicies = RunManifest.readline().rstrip("\n").split("\t")[1:]
+		if ManifestPolicies != [Policy[ShortName] for Policy in Policies]:
+			ErrorMessage = "Error: The policies enabled in the Python script do not match the policies in " + RunManifestFile + "."
+			RunManifest.close()
+	if ErrorMessage is not None:
+		f = open(ResumeScript, 'w')
+		f.write(ErrorMessage)
+		f.close()
+		import sys
+		sys.exit(ErrorMessage)
+
+	CompletedRunNumbers = set()
+	if os.path.exists(RunResultsFile):
+		Results = open(RunResultsFile, 'r')
+		for Line in Results:
+			if Line.startswith("Time\t"):
+				continue
+			for Column in Line.split("\t"):
+				if Column.startswith("CurrentRunNumber="):
+					CompletedRunNumbers.add(int(Column[len("CurrentRunNumber="):]))
+					break
+		Results.close()
+
+	CachedRunNumbers = set()
+	RecordedRunNames = {}
+	if os.path.exists(RunCacheListFile):
+		RunCacheList = open(RunCacheListFile, 'r')
+		for Line in RunCacheList:
+			Status, Key, RecordedRunLabel = Line.rstrip("\n").split("\t", 2)
+			LabelColumns = RecordedRunLabel.split("\t")
+			RecordedRunNumber = int(LabelColumns[1][len("CurrentRunNumber="):])
+			if Status == "Hit":
+				CachedRunNumbers.add(RecordedRunNumber)
+			else:
+				RecordedRunNames[RecordedRunNumber] = LabelColumns[0]
+		RunCacheList.close()
+
+	f = open(ResumeScript, 'w')
+	WriteScriptHeader(f, RunName)
+
+	# If no runs were completed, the first resumed run starts a new RunResultsFile with a "Time" row
+	FirstEntryDone = len(CompletedRunNumbers) > 0
+	MissingRuns = 0
+	for Line in RunManifest:
+		ManifestColumns = Line.rstrip("\n").split("\t")
+		CurrentRunNumber = int(ManifestColumns[0])
+		if CurrentRunNumber in CompletedRunNumbers or CurrentRunNumber in CachedRunNumbers:
+			continue
+		PolicySettingCombination = tuple(ast.literal_eval(Setting) for Setting in ManifestColumns[1:])
+		WriteRun(f, RunName, RunResultsFile, PolicySettingCombination, CurrentRunNumber, FirstEntryDone, RecordedRunNames.get(CurrentRunNumber))
+		FirstEntryDone = True
+		MissingRuns += 1
+
+	RunManifest.close()
+	f.close()
+	print("Writing " + str(MissingRuns) + " missing runs to " + ResumeScript)
+
+
+# Main Program
+# ------------
+
+if ScriptMode == "Validate":
+	ValidateCommandScripts()
+elif ScriptMode == "Resume":
+	WriteResumeScript()
+else:
+	WriteCommandScripts()
@@ -16,41 +16,174 @@ FirstYear = "2021" # The first year you wish to include in the output file (cann
 FinalYear = "2050" # The last year you wish to include in the output file (cannot be later than last simulated year)
 OutputScript = "GeneratedDataLoggingScript.cmd" # The desired filename of the Vensim command script to be generated
 OutputVarsFile = "OutputVarsToExport.lst" # The name of the file containing a list of variables to be included in the RunResultsFile
+InputDataFolder = "InputData" # The name of the folder containing the model's input data (used to detect changed inputs)
+ScenarioHashesFile = "DataLoggingScenarioHashes.tsv" # The desired filename for the list of the inputs of each scenario last run
 SettingsFiles = [""]
 	# This is the list of settings files to be tested, with .cin extensions.
 	# Include a blank entry (e.g. "") to include BAU case.
+DryRun = False # If True, the script estimates the time and output size of the batch (see BatchPlanner.py) without writing the command script
+ScriptMode = "Generate" # "Generate" writes the Vensim command script(s).
+						# "Consolidate" gathers the results of every scenario into a results store (see "Results Store" below).
 
-	
-# Generate Vensim Command Script
-# ------------------------------
-# We use a SAVELIST to reduce the size of the output files, since we are generating one per run.
-f = open(OutputScript, 'w')
-f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n\n')
-f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
 
-for SettingsFile in SettingsFiles:
+# Parallel Runs
+# -------------
+# Vensim performs the runs in a command script one at a time.  To make use of a computer with several processor
+# cores, set WorkerCount to a number greater than 1.  The settings files are then divided as evenly as possible
+# among that many command scripts (or "workers"), and each can be performed by a separate copy of Vensim at the
+# same time.  Each worker's command script is named by adding "-WorkerN" to the OutputScript (for example,
+# "GeneratedDataLoggingScript-Worker1.cmd").  Each scenario is run under its own RunName, so the .vdfx and TSV
+# files written by different workers never share a name.
+WorkerCount = 1 # The number of command scripts to divide the settings files among
+
+
+# Skipping Unchanged Scenarios
+# ----------------------------
+# When SkipUnchangedScenarios is True, we calculate a hash of each scenario's inputs: its settings file, the model
+# file, the OutputVarsFile, every input data file Vensim reads, and FirstYear and FinalYear (see RunCache.py).  The
+# hashes are kept in the ScenarioHashesFile.  A scenario is left out of the command script(s) if its hash has not
+# changed since it was last written to a command script and its RunResultsFile already contains results, so the
+# RunResultsFile is left as it is.  (If Vensim did not finish a scenario, its RunResultsFile holds only the "Time"
+# row, so the scenario is run again.)  When SkipUnchangedScenarios is False, every scenario is run.
+SkipUnchangedScenarios = False
+
+
+# Results Store
+# -------------
+# Once every scenario has been run, set ScriptMode to "Consolidate" and run this script again (with the same
+# SettingsFiles) to gather the TSV files of all scenarios into a results store in the ResultsStoreFolder: a single
+# array on disk with one entry per scenario, variable and year, plus an index of the scenarios, variables and years.
+# See ResultsStore.py for details.  Consolidating requires NumPy.
+ResultsStoreFolder = "DataLoggingResults" # The desired name of the folder for the results store
+
 
-	# The RunName is the name of the SettingsFile without the .cin extension.  It is used as the filename for the .vdfx file
-	# that Vensim creates (or "NoSettings"), and it is included in a column in the RunResultsFile.
+# Run Names
+# ---------
+# The RunName of each scenario is the name of its SettingsFile without the .cin extension (or "NoSettings").
+# It is used as the filename for the .vdfx file that Vensim creates and for the scenario's RunResultsFile, and
+# it is included in a column in the RunResultsFile.
+def ScenarioRunName(SettingsFile):
 	SettingsFileNameLen = len(SettingsFile)
 	if SettingsFileNameLen < 5:
-		RunName = "NoSettings"
+		return "NoSettings"
 	else:
-		RunName = SettingsFile[:SettingsFileNameLen - 4]
+		return SettingsFile[:SettingsFileNameLen - 4]
+
+RunNames = [ScenarioRunName(SettingsFile) for SettingsFile in SettingsFiles]
+
+# Give error and exit if two settings files would share a RunName, since their results would overwrite each other
+DuplicateRunNames = sorted(set(RunName for RunName in RunNames if RunNames.count(RunName) > 1))
+if DuplicateRunNames:
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: More than one settings file has the RunName " + ", ".join(DuplicateRunNames) + ".  Each settings file may only be listed once, and only one blank entry may be included."
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
+
+# Give error and exit if WorkerCount would leave any worker without runs
+if WorkerCount < 1 or WorkerCount > len(SettingsFiles):
+	f = open(OutputScript, 'w')
+	ErrorMessage = "Error: WorkerCount must be at least 1 and no greater than the number of settings files (" + str(len(SettingsFiles)) + ")."
+	f.write(ErrorMessage)
+	f.close()
+	import sys
+	sys.exit(ErrorMessage)
+
+
+# Consolidating Results
+# ---------------------
+# In "Consolidate" mode, we do not write any command scripts.  Instead, we write the results store from the
+# RunResultsFile of each scenario.
+import os
+
+if ScriptMode == "Consolidate":
+	import sys
+	MissingResultsFiles = [RunName + ".tsv" for RunName in RunNames if not os.path.exists(RunName + ".tsv")]
+	if MissingResultsFiles:
+		sys.exit("Error: The results of some scenarios were not found: " + ", ".join(MissingResultsFiles) + ".  Perform the command script(s) before consolidating.")
+	try:
+		import ResultsStore
+	except ImportError:
+		sys.exit("Error: Consolidating results requires NumPy.  Install it (for example, with \"pip install numpy\") and run the script again.")
+	Index = ResultsStore.WriteResultsStore(ResultsStoreFolder, {RunName: RunName + ".tsv" for RunName in RunNames}, FirstYear, FinalYear)
+	print("Wrote " + str(len(Index["Scenarios"])) + " scenarios, " + str(len(Index["Variables"])) + " variables and " + str(len(Index["Years"])) + " years to " + ResultsStoreFolder)
+	sys.exit()
+
+
+# Finding Changed Scenarios
+# -------------------------
+# We read the hashes of the scenarios last written to a command script, and we compare them to the hashes of
+# their current inputs.  The hashes of the scenarios that are left out are kept, and the hashes of the others
+# are replaced, so the ScenarioHashesFile always describes the results in each scenario's RunResultsFile (once
+# Vensim has finished).  The ScenarioHashesFile is only written after the command script(s), so a dry run
+# does not change it.
+
+import RunCache
+import hashlib
+
+def HasResults(RunResultsFile):
+	if not os.path.exists(RunResultsFile):
+		return False
+	Results = open(RunResultsFile, 'r')
+	Results.readline()
+	ResultsFound = Results.readline() != ""
+	Results.close()
+	return ResultsFound
+
+ScenariosToRun = list(zip(SettingsFiles, RunNames))
+if SkipUnchangedScenarios:
+	EnvironmentHash = RunCache.HashModelEnvironment(ModelFile, InputDataFolder, OutputVarsFile, FirstYear, FinalYear)
+	ScenarioHashes = {}
+	if os.path.exists(ScenarioHashesFile):
+		HashesFile = open(ScenarioHashesFile, 'r')
+		for Line in HashesFile:
+			RunName, ScenarioHash = Line.rstrip("\n").split("\t")
+			ScenarioHashes[RunName] = ScenarioHash
+		HashesFile.close()
+
+	ScenariosToRun = []
+	for SettingsFile, RunName in zip(SettingsFiles, RunNames):
+		Hash = hashlib.sha256(EnvironmentHash.encode("utf-8"))
+		Hash.update(("|" + SettingsFile + "|").encode("utf-8"))
+		if SettingsFile:
+			RunCache.HashFile(Hash, SettingsFile)
+		ScenarioHash = Hash.hexdigest()
+		if ScenarioHashes.get(RunName) != ScenarioHash or not HasResults(RunName + ".tsv"):
+			ScenariosToRun.append((SettingsFile, RunName))
+			ScenarioHashes[RunName] = ScenarioHash
+	print(str(len(SettingsFiles) - len(ScenariosToRun)) + " of " + str(len(SettingsFiles)) + " scenarios are unchanged and will not be run")
+
+
+# Planning the Batch
+# ------------------
+# The batch contains one run per settings file to be run, and each run writes its own output file.  We estimate its
+# time and output size before writing the command script (or any output files), assuming the workers are
+# performed at the same time.  BatchPlanner.py stops the script here if DryRun is True or if the batch is
+# over the budget set in BatchPlanner.py.
+import BatchPlanner
+LongestRunLabel = max(len(RunName) for RunName in RunNames)
+BatchPlanner.PlanBatch(OutputScript, len(ScenariosToRun), OutputVarsFile, FirstYear, FinalYear, LongestRunLabel, ParallelScripts = WorkerCount, CommandScripts = WorkerCount, OutputFiles = len(ScenariosToRun), DryRun = DryRun)
+
+	
+# Generate Vensim Command Script
+# ------------------------------
+# Each worker's file names are formed by adding "-WorkerN" to the file name chosen above, ahead of its
+# extension.  When there is only one worker, the file name is used unchanged.
+def WorkerFileName(FileName, WorkerNumber):
+	if WorkerCount == 1:
+		return FileName
+	Root, Extension = os.path.splitext(FileName)
+	return Root + "-Worker" + str(WorkerNumber) + Extension
+
+# We write one scenario's run to the command script f.  We also generate an empty output file for the scenario
+# with a time row, to work around bug where Vensim includes multiple Time rows if you don't suppress all time
+# rows.  We overwrite any output file that may exist at this filename.
+def WriteScenarioRun(f, SettingsFile, RunName):
 	RunResultsFile = RunName + ".tsv" # The desired filename for the file containing model run results
 	
-	# Generate an empty output file with a time row, to work around bug where Vensim includes multiple Time rows if you
-	# don't suppress all time rows.  We overwrite any output file that may exist at this filename.
 	tsv = open(RunResultsFile, 'w')
-	tsv.write("Time\t" + RunName + "\t")
-	YearToWrite = FirstYear
-	while(YearToWrite <= FinalYear):
-		tsv.write(YearToWrite)
-		if(YearToWrite != FinalYear):
-			tsv.write("\t")
-		else:
-			tsv.write("\n")
-		YearToWrite = str(int(YearToWrite)+1)
+	tsv.write("Time\t" + RunName + "\t" + "\t".join(str(Year) for Year in range(int(FirstYear), int(FinalYear) + 1)) + "\n")
 	tsv.close()
 
 	# Write directions to set the run name, read the settings, run the simulation, and append the results to the RunResultsFile.
@@ -67,9 +200,36 @@ for SettingsFile in SettingsFiles:
 	f.write("FILE>DELETE|" + RunName + ".vdfx")
 	f.write("\n\n")
 
-# Since Vensim fails to clear the savelist entry in the program after script execution, we need to do it here
-# before the script exits.
-f.write("SIMULATE>SAVELIST|\n")
+# We divide the settings files to be run among the workers as evenly as possible: every worker receives the same
+# number, except that the first few workers receive one extra settings file each when they cannot be divided evenly.
+# (When unchanged scenarios are skipped, some workers may have no runs.)
+# We use a SAVELIST in every command script to reduce the size of the output files, since we are generating
+# one per run.
+NextScenario = 0
+for WorkerNumber in range(1, WorkerCount + 1):
+
+	WorkerScenarios = len(ScenariosToRun) // WorkerCount
+	if WorkerNumber <= len(ScenariosToRun) % WorkerCount:
+		WorkerScenarios += 1
+
+	f = open(WorkerFileName(OutputScript, WorkerNumber), 'w')
+	f.write('SPECIAL>LOADMODEL|"' + ModelFile + '"\n\n')
+	f.write("SIMULATE>SAVELIST|" + OutputVarsFile + "\n")
+
+	for SettingsFile, RunName in ScenariosToRun[NextScenario:NextScenario + WorkerScenarios]:
+		WriteScenarioRun(f, SettingsFile, RunName)
+	NextScenario += WorkerScenarios
+
+	# Since Vensim fails to clear the savelist entry in the program after script execution, we need to do it here
+	# before the script exits.
+	f.write("SIMULATE>SAVELIST|\n")
+
+	# We are done writing this Vensim command script and therefore close the file.
+	f.close()
 
-# We are done writing the Vensim command script and therefore close the file.
-f.close()
\ No newline at end of file
+# We record the hashes of the scenarios now in the command script(s), along with those of the scenarios left out
+if SkipUnchangedScenarios:
+	HashesFile = open(ScenarioHashesFile, 'w')
+	for RunName, ScenarioHash in ScenarioHashes.items():
+		HashesFile.write(RunName + "\t" + ScenarioHash + "\n")
+	HashesFile.close()
@@ -0,0 +1,154 @@
+# FindEquivalentCarbonTax.py
+#
+# This is a Python script that reads the results of the Vensim command script
+# generated by CreateCarbonCapToTaxScript.py (in "Sweep" mode) and finds, for
+# each year, the carbon tax rate (lever setting) at which the emissions of the
+# covered sectors equal a carbon cap.
+#
+# The RunResultsFile contains one row per output variable per price tested.
+# We read it one line at a time into a NumPy array with one entry per price,
+# year and variable, so that even sweeps with many thousands of prices can be
+# processed quickly.  This script requires NumPy.
+
+
+# File Names
+# ----------
+# Rather than including input and output file names in the code below, we assign all the file
+# names to variables in this section.  This allows the names to be easily changed if desired.
+RunResultsFile = "RunResults.tsv" # The name of the TSV file written by the command script from CreateCarbonCapToTaxScript.py
+EquivalentCarbonTaxFile = "EquivalentCarbonTax.tsv" # The desired filename for the carbon tax rate found in each year
+
+
+# Carbon Cap
+# ----------
+# Enter the total emissions of the covered sectors allowed by the cap in each year, in the units of the
+# model's output variables (for example, metric tons CO2e).  The cap in years between those listed is
+# found by drawing a straight line between the years before and after.  The covered sectors are read from
+# the "Covered sectors=" column of the RunResultsFile, and their emissions are read from the rows of
+# "Output Total CO2e Emissions by Sector" for those sectors.
+CapTrajectory = {
+	2025: 120,
+	2030: 100,
+	2035: 80
+}
+
+# The RunResultsFile is read this many rows at a time.  Larger numbers are faster but use more memory.
+RowsPerChunk = 10000
+
+
+# Reading the Results
+# -------------------
+# Each row of the RunResultsFile holds a variable name, the run label columns, and one value per year.
+# The label columns are "CurrentPrice=", the price, and the covered sectors.  We collect the text of the
+# values of up to RowsPerChunk rows at a time and convert them to numbers together, then place the whole
+# chunk in the array at once, using the price and variable number of each row.
+
+import sys
+
+try:
+	import numpy as np
+except ImportError:
+	sys.exit("Error: This script requires NumPy.  Install it (for example, with \"pip install numpy\") and run the script again.")
+
+# Returns the prices (in increasing order), the years, the variable names, the covered sectors, and an
+# array of results with one entry per price, year and variable.
+def ReadRunResults(ResultsFileName):
+	Results = open(ResultsFileName, 'r')
+	TimeRow = Results.readline().rstrip("\n").split("\t")
+	YearCount = 0
+	while YearCount < len(TimeRow) - 1 and TimeRow[-YearCount - 1].isdigit():
+		YearCount += 1
+	Years = np.array([int(Year) for Year in TimeRow[-YearCount:]])
+
+	PriceNumbers = {}
+	VariableNumbers = {}
+	CoveredSectors = []
+	Chunks = []
+	RowPrices, RowVariables, RowValues = [], [], []
+
+	def StoreChunk():
+		if RowValues:
+			Chunks.append((np.array(RowPrices), np.array(RowVariables), np.array(RowValues, dtype = float)))
+			del RowPrices[:], RowVariables[:], RowValues[:]
+
+	for Line in Results:
+		if Line.startswith("Time\t"):
+			continue
+		Columns = Line.rstrip("\n").split("\t")
+		LabelColumns = Columns[1:-YearCount]
+		Price = float(LabelColumns[LabelColumns.index("CurrentPrice=") + 1])
+		if not CoveredSectors:
+			for LabelColumn in LabelColumns:
+				if LabelColumn.startswith("Covered sectors="):
+					CoveredSectors = LabelColumn[len("Covered sectors="):].split(", ")
+		RowPrices.append(PriceNumbers.setdefault(Price, len(PriceNumbers)))
+		RowVariables.append(VariableNumbers.setdefault(Columns[0], len(VariableNumbers)))
+		RowValues.append(Columns[-YearCount:])
+		if len(RowValues) >= RowsPerChunk:
+			StoreChunk()
+	StoreChunk()
+	Results.close()
+
+	RunResults = np.full((len(PriceNumbers), YearCount, len(VariableNumbers)), np.nan)
+	for ChunkPrices, ChunkVariables, ChunkValues in Chunks:
+		RunResults[ChunkPrices, :, ChunkVariables] = ChunkValues
+
+	# We sort the prices in increasing order, since the runs may not have been performed in that order
+	Prices = np.array(list(PriceNumbers))
+	PriceOrder = np.argsort(Prices)
+	return Prices[PriceOrder], Years, list(VariableNumbers), CoveredSectors, RunResults[PriceOrder]
+
+
+# Finding the Price
+# -----------------
+# For each year, we find the lowest price at which emissions are no more than the cap.  Emissions should
+# fall as the price rises, but small increases can occur (for example, due to rounding), so we first
+# replace the emissions at each price with the lowest emissions at that price or any lower price.  This
+# makes emissions decrease steadily with price, so there is a single crossing in each year, and drawing
+# straight lines between prices keeps that property.  We then find the first price at which emissions
+# are within the cap in every year at once, and interpolate between it and the price before it.
+# Years in which the cap is met at the lowest price are given the lowest price, and years in which it is
+# not met at the highest price (or that have no cap) are given NaN.
+def FindCapPrices(Prices, CoveredEmissions, Caps):
+	MonotoneEmissions = np.minimum.accumulate(CoveredEmissions, axis = 0)
+	WithinCap = MonotoneEmissions <= Caps
+	CapMet = WithinCap.any(axis = 0)
+	Upper = np.argmax(WithinCap, axis = 0)
+	Lower = np.maximum(Upper - 1, 0)
+	YearNumbers = np.arange(len(Caps))
+	UpperEmissions = MonotoneEmissions[Upper, YearNumbers]
+	LowerEmissions = MonotoneEmissions[Lower, YearNumbers]
+	Drop = LowerEmissions - UpperEmissions
+	with np.errstate(divide = 'ignore', invalid = 'ignore'):
+		Fraction = np.where(Drop > 0, (LowerEmissions - Caps) / Drop, 1.0)
+	CapPrices = Prices[Lower] + np.clip(Fraction, 0, 1) * (Prices[Upper] - Prices[Lower])
+	return np.where(CapMet, CapPrices, np.nan), np.where(CapMet, LowerEmissions - np.clip(Fraction, 0, 1) * Drop, np.nan)
+
+
+# Main Program
+# ------------
+Prices, Years, Variables, CoveredSectors, RunResults = ReadRunResults(RunResultsFile)
+
+CoveredVariables = ["Output Total CO2e Emissions by Sector[" + Sector + "]" for Sector in CoveredSectors]
+MissingVariables = [Variable for Variable in CoveredVariables if Variable not in Variables]
+if not CoveredSectors or MissingVariables:
+	sys.exit("Error: " + RunResultsFile + " does not contain the emissions of every covered sector.  Add " + ", ".join(MissingVariables or ["Output Total CO2e Emissions by Sector"]) + " to the OutputVarsFile and perform the runs again.")
+CoveredEmissions = RunResults[:, :, [Variables.index(Variable) for Variable in CoveredVariables]].sum(axis = 2)
+
+# Years outside the CapTrajectory have no cap, so no price is found for them
+CapYears = sorted(CapTrajectory)
+Caps = np.interp(Years, CapYears, [CapTrajectory[Year] for Year in CapYears])
+Caps[(Years < CapYears[0]) | (Years > CapYears[-1])] = np.nan
+CapPrices, CapEmissions = FindCapPrices(Prices, CoveredEmissions, Caps)
+
+Output = open(EquivalentCarbonTaxFile, 'w')
+Output.write("Year\tCap\tCarbon Tax Rate\tCovered Emissions\n")
+for Year, Cap, CapPrice, Emissions in zip(Years, Caps, CapPrices, CapEmissions):
+	if not np.isnan(Cap):
+		Output.write(str(Year) + "\t" + str(Cap) + "\t" + str(CapPrice) + "\t" + str(Emissions) + "\n")
+Output.close()
+
+UnmetYears = [str(Year) for Year, Cap, CapPrice in zip(Years, Caps, CapPrices) if not np.isnan(Cap) and np.isnan(CapPrice)]
+if UnmetYears:
+	print("Warning: The cap is not met at the highest price tested (" + str(Prices[-1]) + ") in " + ", ".join(UnmetYears) + ".  Raise PriceCeiling and perform the runs again.")
+print("Wrote the carbon tax rate that meets the cap in each year to " + EquivalentCarbonTaxFile)
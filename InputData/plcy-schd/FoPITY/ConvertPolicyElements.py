@@ -0,0 +1,44 @@
+# ConvertPolicyElements.py
+#
+# This script converts the policy implementation schedules from the format used by older versions of
+# FractionOfPolicyImplementedThisYear.py, in which they were written in the script itself as a
+# "PolicyElements = (...)" tuple, to the schedules file now read by that script (see
+# PolicyScheduleData.py).  It only needs to be run once, on a copy of the older script.
+#
+# The converted schedules are read back and compared to the original tuple before the script finishes,
+# so any difference is reported rather than silently written.
+
+
+# File Names
+# ----------
+InputFileName = "FractionOfPolicyImplementedThisYear-Old.py" # An older version of FractionOfPolicyImplementedThisYear.py
+OutputFileName = "PolicyImplementationSchedules.csv"
+MaxSubscripts = 3
+
+
+# Main Program
+# ------------
+
+import ast
+import sys
+
+import PolicyScheduleData
+
+# We find the assignment to PolicyElements in the older script and evaluate the tuple without running the script
+InputFile = open(InputFileName, 'r')
+Module = ast.parse(InputFile.read())
+InputFile.close()
+
+PolicyElements = None
+for Statement in Module.body:
+  if isinstance(Statement, ast.Assign) and any(isinstance(Target, ast.Name) and Target.id == "PolicyElements" for Target in Statement.targets):
+    PolicyElements = ast.literal_eval(Statement.value)
+if PolicyElements is None:
+  sys.exit("Error: No PolicyElements tuple found in "+InputFileName+".")
+
+PolicyScheduleData.WritePolicyElements(OutputFileName, PolicyElements, MaxSubscripts)
+
+if PolicyScheduleData.ReadPolicyElements(OutputFileName) != tuple(PolicyElements):
+  sys.exit("Error: The schedules read back from "+OutputFileName+" do not match those in "+InputFileName+".  Check for policy elements with the same names listed next to each other.")
+
+print("Wrote "+str(len(PolicyElements))+" policy elements to "+OutputFileName)
@@ -0,0 +1,275 @@
+# DiffSchedules.py
+#
+# This script compares two policy implementation schedule files, such as FoPITY-2 and FoPITY-3, or
+# one schedule file as it is now and as it was in an earlier git revision of the schedules.  Rather
+# than comparing the text of the .csv files, it resolves each policy element's schedule (falling back
+# to the element's first listed schedule, as FractionOfPolicyImplementedThisYear.py does) and
+# interpolates it to get the implementation fraction in every year, then compares those fractions.
+#
+# It writes two files:
+# - The DiffFileName lists every changed (policy element, year) cell, with the old and new
+#   implementation fractions and the change.  Policy elements found on only one side have an empty
+#   old or new fraction.
+# - The ImpactFileName lists, for each policy with changed cells, the number of changed elements and
+#   cells, the years changed, the largest change, the variables in EPS.mdl that use the policy's
+#   schedule, the policy levers that those variables scale, the policies in PolicyRegistry.py that
+#   set those levers, and the scenario (.cin) files that set any of those levers to a non-zero value.
+#   Only these policies and scenarios need to be run again to see the effect of the change.
+#
+# The schedules to compare may be given on the command line as "OLD NEW", where each is a schedule
+# number, optionally preceded by a git revision and a colon.  For example:
+#
+#   python DiffSchedules.py 2 3
+#   python DiffSchedules.py HEAD~1:3 3
+#
+# compares schedule 2 to schedule 3 in the current schedules file, or schedule 3 in the previous
+# commit to schedule 3 now.  Revisions from before the schedules were moved into the schedules file
+# are read from the PolicyElements tuple in FractionOfPolicyImplementedThisYear.py.
+#
+# This script requires NumPy and git (for comparing revisions).
+
+
+# Schedules to Compare
+# --------------------
+# A revision of None uses the schedules file as it is now, including any uncommitted changes.
+OldRevision = None
+OldSchedule = 2
+NewRevision = None
+NewSchedule = 3
+
+
+# File Names and Global Constants
+# -------------------------------
+# The schedules are compared over the years set in PolicyScheduleData.py.
+ScheduleDataFileName = "PolicyImplementationSchedules.csv"
+OlderScriptFileName = "FractionOfPolicyImplementedThisYear.py" # Holds the schedules in revisions before ScheduleDataFileName existed
+DiffFileName = "FoPITY-Diff.tsv"
+ImpactFileName = "FoPITY-Diff-Impact.tsv"
+ModelFolder = "../../.." # The folder holding EPS.mdl, ModelGraph.py, PolicyRegistry.py and the scenario .cin files
+ModelFileName = "EPS.mdl"
+RoundingDigits = 3 # Fractions are compared after rounding, as written to the FoPITY .csv files, so smaller changes are ignored
+LeverSearchDepth = 2 # How many equations away from a schedule's variable to look for the levers it scales
+
+
+# Functions
+# ---------
+
+import ast
+import glob
+import os
+import re
+import subprocess
+import sys
+
+try:
+  import numpy as np
+except ImportError:
+  sys.exit("Error: This script requires NumPy.  Install it (for example, with \"pip install numpy\") and run the script again.")
+
+import PolicyScheduleData
+from PolicyScheduleData import FirstYear, FinalYear, ScheduleNumber, PolicyElementSubscript
+
+sys.path.insert(0, ModelFolder)
+import ModelGraph
+import PolicyRegistry
+from ModelGraph import NormalName
+
+# Returns the policy name at the start of a policy element's Vensim subscript name
+def PolicyName(ElementSubscript):
+  return (ElementSubscript+" ").split(" X ")[0]
+
+# Returns the text of a file in a git revision, or None if the file is not in that revision
+def FileAtRevision(Revision, FileName):
+  Result = subprocess.run(["git","show",Revision+":./"+FileName], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+  if Result.returncode != 0:
+    return None
+  return Result.stdout.decode("utf-8")
+
+# Returns the policy elements in a git revision (or in the working tree if Revision is None)
+def LoadPolicyElements(Revision):
+  if Revision is None:
+    return PolicyScheduleData.ReadPolicyElements(ScheduleDataFileName)
+  ScheduleText = FileAtRevision(Revision, ScheduleDataFileName)
+  if ScheduleText is not None:
+    return PolicyScheduleData.ReadPolicyElementsText(ScheduleText)
+  # Older revisions hold the schedules in a "PolicyElements = (...)" tuple in the script itself
+  ScriptText = FileAtRevision(Revision, OlderScriptFileName)
+  if ScriptText is not None:
+    for Statement in ast.parse(ScriptText).body:
+      if isinstance(Statement, ast.Assign) and any(isinstance(Target, ast.Name) and Target.id == "PolicyElements" for Target in Statement.targets):
+        return ast.literal_eval(Statement.value)
+  sys.exit("Error: No policy implementation schedules found in revision "+Revision+".")
+
+# Returns the implementation fraction of a schedule (a list of ordered pairs) in each of Years, rounded to
+# RoundingDigits.  This uses the same arithmetic and rounding as FractionOfPolicyImplementedThisYear.py, so the
+# fractions match those in the FoPITY .csv files exactly: each year is interpolated between the last pair at or
+# before it and the first pair at or after it, and years outside the pairs use the first or last pair.
+def InterpolateSchedule(ActiveSchedule, Years):
+  PairYears = np.array([OrderedPair[0] for OrderedPair in ActiveSchedule], dtype=float)
+  PairFractions = np.array([OrderedPair[1] for OrderedPair in ActiveSchedule], dtype=float)
+  PairBelow = np.maximum(np.searchsorted(PairYears, Years, side='right')-1, 0)
+  PairAbove = np.minimum(np.searchsorted(PairYears, Years, side='left'), len(ActiveSchedule)-1)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    FractionBetweenYears = (Years-PairYears[PairBelow])/(PairYears[PairAbove]-PairYears[PairBelow])
+    Fractions = np.where(PairBelow == PairAbove, PairFractions[PairBelow], PairFractions[PairBelow]+FractionBetweenYears*(PairFractions[PairAbove]-PairFractions[PairBelow]))
+  return np.array([round(Fraction, RoundingDigits) for Fraction in Fractions.tolist()])
+
+# Returns a dictionary of the implementation fraction in each year (an array, rounded to RoundingDigits) of every
+# policy element in a schedule file, by the policy element's Vensim subscript name.  Each element uses its schedule
+# with the given number, or its first listed schedule if it has none.  Each distinct schedule is only interpolated once.
+def ResolvedFractions(PolicyElements, Schedule):
+  Years = np.arange(FirstYear,FinalYear+1)
+  DistinctFractions = {}
+  Fractions = {}
+  for PolicyElement in PolicyElements:
+    ActiveSchedule = PolicyElement[1][1:]
+    for ScheduleRow in PolicyElement[1:]:
+      if ScheduleNumber(ScheduleRow[0]) == Schedule:
+        ActiveSchedule = ScheduleRow[1:]
+        break
+    if ActiveSchedule not in DistinctFractions:
+      DistinctFractions[ActiveSchedule] = InterpolateSchedule(ActiveSchedule, Years)
+    Fractions[PolicyElementSubscript(PolicyElement[0])] = DistinctFractions[ActiveSchedule]
+  return Fractions
+
+# Returns the changed cells between two dictionaries from ResolvedFractions(), as a list of (element, year, old
+# fraction, new fraction) tuples in the order of the elements (old elements first, then any added elements), using
+# None for the fraction of an element that is missing on one side.  All the elements are compared at once.
+def ChangedCells(OldFractions, NewFractions):
+  Elements = list(OldFractions)+[Element for Element in NewFractions if Element not in OldFractions]
+  Missing = np.full(FinalYear-FirstYear+1, np.nan)
+  OldArray = np.array([OldFractions.get(Element, Missing) for Element in Elements])
+  NewArray = np.array([NewFractions.get(Element, Missing) for Element in Elements])
+  Changed = (OldArray != NewArray) & ~(np.isnan(OldArray) & np.isnan(NewArray))
+  Cells = []
+  for ElementNum, YearNum in zip(*np.nonzero(Changed)):
+    OldFraction = None if np.isnan(OldArray[ElementNum,YearNum]) else OldArray[ElementNum,YearNum].item()
+    NewFraction = None if np.isnan(NewArray[ElementNum,YearNum]) else NewArray[ElementNum,YearNum].item()
+    Cells.append((Elements[ElementNum], FirstYear+int(YearNum), OldFraction, NewFraction))
+  return Cells
+
+# Returns a number as written to the output files: rounded to RoundingDigits, without a trailing ".0" for whole numbers
+def FormatFraction(Fraction):
+  if Fraction is None:
+    return ""
+  Fraction = round(Fraction, RoundingDigits)
+  if Fraction == int(Fraction):
+    Fraction = int(Fraction)
+  return str(Fraction)
+
+# Returns the variables in the model graph (see ModelGraph.py) that use each policy's schedule and the levers each of
+# them scales.  A lever is a variable whose equations hold only numbers written in the model (the values that the
+# policy scenarios change) found within LeverSearchDepth equations of the variable using the schedule.  Returns two
+# dictionaries: one of the variable names using each policy's schedule, by policy name, and one of the levers of
+# each variable.
+def ReadScheduleVariables(Graph):
+  Variables = Graph["Variables"]
+  ScheduleVariables = {}
+  for Name, Variable in Variables.items():
+    for Equation in Variable["Equations"]:
+      for ElementSubscript in re.findall(r"Selected Policy Implementation Schedule\[([^\]]*)\]", Equation["Formula"], re.I):
+        ScheduleVariables.setdefault(PolicyName(ElementSubscript.strip()), set()).add(Name)
+
+  VariableLevers = {}
+  for Names in ScheduleVariables.values():
+    for Name in Names:
+      Levers = []
+      Searched = {Name}
+      Frontier = [Name]
+      for Depth in range(LeverSearchDepth):
+        NextFrontier = []
+        for Variable in Frontier:
+          for Dependency in Variables[Variable]["Dependencies"]:
+            if Dependency in Searched:
+              continue
+            Searched.add(Dependency)
+            if Variables[Dependency]["Kind"] == "Constant" and not any(Equation["Files"] for Equation in Variables[Dependency]["Equations"]):
+              Levers.append(Dependency)
+            elif Dependency != "Selected Policy Implementation Schedule":
+              NextFrontier.append(Dependency)
+        Frontier = NextFrontier
+      VariableLevers[Name] = Levers
+
+  return {Policy: sorted(Names) for Policy, Names in ScheduleVariables.items()}, VariableLevers
+
+# Returns a dictionary of the short names of the policies in PolicyRegistry.py that set each lever, by lever name
+def RegistryPoliciesByLever():
+  Policies = {}
+  for Policy in PolicyRegistry.PotentialPolicies:
+    Policies.setdefault(NormalName(Policy[PolicyRegistry.LongName].split("[")[0]), []).append(Policy[PolicyRegistry.ShortName])
+  return Policies
+
+# Returns a dictionary of the scenario (.cin) files in the ModelFolder that set each lever to a non-zero value, by
+# lever name
+def ScenariosByLever():
+  Scenarios = {}
+  for ScenarioFileName in sorted(glob.glob(os.path.join(ModelFolder, "*.cin"))):
+    ScenarioFile = open(ScenarioFileName, 'r')
+    for Line in ScenarioFile:
+      Lever, Separator, Value = Line.partition("=")
+      if Separator and Value.strip() not in ("0","0.0",""):
+        LeverScenarios = Scenarios.setdefault(NormalName(Lever.split("[")[0]), [])
+        if os.path.basename(ScenarioFileName) not in LeverScenarios:
+          LeverScenarios.append(os.path.basename(ScenarioFileName))
+    ScenarioFile.close()
+  return Scenarios
+
+
+# Main Program
+# ------------
+
+if len(sys.argv) == 3:
+  Sides = []
+  for Argument in sys.argv[1:]:
+    Revision, Separator, Schedule = Argument.rpartition(":")
+    Sides.append((Revision or None, int(Schedule)))
+  (OldRevision, OldSchedule), (NewRevision, NewSchedule) = Sides
+elif len(sys.argv) != 1:
+  sys.exit("Usage: python DiffSchedules.py [[OLDREVISION:]OLDSCHEDULE [NEWREVISION:]NEWSCHEDULE]")
+
+OldFractions = ResolvedFractions(LoadPolicyElements(OldRevision), OldSchedule)
+NewFractions = ResolvedFractions(LoadPolicyElements(NewRevision), NewSchedule)
+Cells = ChangedCells(OldFractions, NewFractions)
+
+DiffFile = open(DiffFileName, 'w')
+DiffFile.write("Policy Element\tYear\tOld\tNew\tChange\n")
+for Element, Year, OldFraction, NewFraction in Cells:
+  Change = None if OldFraction is None or NewFraction is None else NewFraction-OldFraction
+  DiffFile.write(Element+"\t"+str(Year)+"\t"+FormatFraction(OldFraction)+"\t"+FormatFraction(NewFraction)+"\t"+FormatFraction(Change)+"\n")
+DiffFile.close()
+
+# Summarize the changed cells by policy, then find the variables, levers, registry policies and scenarios affected
+PolicySummaries = {}
+for Element, Year, OldFraction, NewFraction in Cells:
+  Summary = PolicySummaries.setdefault(PolicyName(Element), {"Elements": set(), "Cells": 0, "Years": [], "LargestChange": 0})
+  Summary["Elements"].add(Element)
+  Summary["Cells"] += 1
+  Summary["Years"].append(Year)
+  if OldFraction is not None and NewFraction is not None and abs(NewFraction-OldFraction) > abs(Summary["LargestChange"]):
+    Summary["LargestChange"] = NewFraction-OldFraction
+
+ScheduleVariables, VariableLevers = ReadScheduleVariables(ModelGraph.LoadModelGraph(os.path.join(ModelFolder, ModelFileName)))
+RegistryPolicies = RegistryPoliciesByLever()
+LeverScenarios = ScenariosByLever()
+
+ImpactFile = open(ImpactFileName, 'w')
+ImpactFile.write("Policy\tChanged Elements\tChanged Cells\tFirst Year Changed\tLast Year Changed\tLargest Change\tModel Variables\tLevers\tRegistry Policies\tScenarios\n")
+AffectedScenarios = []
+for Policy, Summary in PolicySummaries.items():
+  Variables = ScheduleVariables.get(Policy, [])
+  Levers = []
+  for Variable in Variables:
+    Levers += [Lever for Lever in VariableLevers[Variable] if Lever not in Levers]
+  Policies = [ShortName for Lever in Levers for ShortName in RegistryPolicies.get(NormalName(Lever), [])]
+  Scenarios = []
+  for Lever in Levers:
+    Scenarios += [Scenario for Scenario in LeverScenarios.get(NormalName(Lever), []) if Scenario not in Scenarios]
+  AffectedScenarios += [Scenario for Scenario in Scenarios if Scenario not in AffectedScenarios]
+  ImpactFile.write(Policy+"\t"+str(len(Summary["Elements"]))+"\t"+str(Summary["Cells"])+"\t"+str(min(Summary["Years"]))+"\t"+str(max(Summary["Years"]))+"\t"+FormatFraction(Summary["LargestChange"])+"\t"+"; ".join(Variables)+"\t"+"; ".join(Levers)+"\t"+"; ".join(Policies)+"\t"+"; ".join(Scenarios)+"\n")
+ImpactFile.close()
+
+OldName = (OldRevision+":" if OldRevision else "")+"FoPITY-"+str(OldSchedule)
+NewName = (NewRevision+":" if NewRevision else "")+"FoPITY-"+str(NewSchedule)
+print(str(len(Cells))+" changed cell(s) in "+str(len(PolicySummaries))+" policy(ies) between "+OldName+" and "+NewName+".  See "+DiffFileName+" and "+ImpactFileName+".")
+if AffectedScenarios:
+  print("Scenarios affected: "+", ".join(AffectedScenarios))
@@ -1,140 +1,75 @@
 # EditScheduleTool.py
 #
-# This script is used to modify FractionOfPolicyImplementedThisYear.py
-# in various ways, depending on the edit mode setting below.
-
-# Edit Mode
-# ---------
-# Select the edit mode corresponding to the type of edit you wish to make.
-# 1 = delete a schedule
-# 2 = copy a schedule to a new schedule number, unless there is an existing schedule using that number
-# 3 = copy a schedule to a new schedule number, overwriting any existing schedule using that number
-
-EditMode = 2
-
-
-# Schedule Selection
-# ------------------
-
-# Enter the number of the schedule you wish to delete or copy
-ExistingScheduleNumber = 7
-
-# Enter the number you wish to use for the new, duplicate schedule (only relevant when copying a schedule)
-NewScheduleNumber = 8
+# This script is used to modify the policy implementation schedules file read by
+# FractionOfPolicyImplementedThisYear.py, by applying a list of edits (see ScheduleEdits.py).
+#
+# The edits are listed below, or they may be read from a .csv file named on the command line
+# (for example, "python EditScheduleTool.py MyEdits.csv").  The .csv file has a header row and one
+# edit per row, with the columns Operation, Schedule, Value, Year and Element, for example:
+#
+#   Operation,Schedule,Value,Year,Element
+#   copy,2,8,,
+#   scale,8,0.5,,trans fuel economy standards
+#   set point,8,1,2035,trans fuel economy standards X passenger X LDVs
+#
+# The schedules file is read once, all of the edits are applied in order, and the output file is
+# written once.  If any edit cannot be made, the errors are written to the error log and the output
+# file is not written.
+
+# Edits
+# -----
+# Each edit is a tuple of (Operation, Schedule, Value, Year, Element), where the last items may be left out
+# if they are not needed.  The operations are:
+# ("delete", Schedule) = delete a schedule
+# ("copy", Schedule, NewSchedule) = copy a schedule to a new schedule number, unless there is an existing schedule using that number
+# ("copy overwrite", Schedule, NewSchedule) = copy a schedule to a new schedule number, overwriting any existing schedule using that number
+# ("rename", Schedule, NewSchedule) = change a schedule's number
+# ("scale", Schedule, Factor) = multiply a schedule's implementation fractions by Factor
+# ("shift years", Schedule, Years) = add Years (which may be negative) to a schedule's years
+# ("set point", Schedule, Fraction, Year) = set a schedule's implementation fraction in Year
+# Use None for a Value or Year that is not needed when giving an Element.
+
+Edits = [
+  ("copy", 7, 8),
+]
 
 
 # Other Global Constants
 # ----------------------
-InputFileName = "FractionOfPolicyImplementedThisYear.py"
-OutputFileName = "FractionOfPolicyImplementedThisYear-Modified.py"
+InputFileName = "PolicyImplementationSchedules.csv"
+OutputFileName = "PolicyImplementationSchedules-Modified.csv"
 ErrorLogFileName = "EditScheduleTool-Error-Log.txt"
-ValidScheduleNumbers = (1,2,3,4,5,6,7,8,9)
-
-
-# Functions
-# ---------
-
-def CheckForErrors():
-  ErrorFound = 0
-  ErrorLog = open(ErrorLogFileName, 'w')
-
-  # Open the InputFile and load the lines it contains
-  InputFile = open(InputFileName, "r")
-  OldLines = InputFile.readlines()
-
-  # Ensure input file and output file have different filenames
-  if InputFileName == OutputFileName:
-    ErrorLog.write("InputFileName and OutputFileName must not be the same.\n")
-    ErrorFound = 1
-
-  # Ensure schedule numbers are valid
-  if ExistingScheduleNumber not in ValidScheduleNumbers:
-    ErrorLog.write("ExistingScheduleNumber must be an integer 1 through 9.\n")
-    ErrorFound = 1
-  if NewScheduleNumber not in ValidScheduleNumbers:
-    ErrorLog.write("NewScheduleNumber must be an integer 1 through 9.\n")
-    ErrorFound = 1
-
-  # Ensure the schedule to be copied or deleted appears somewhere in the file
-  SearchString = '("Schedule '+str(ExistingScheduleNumber)
-  SearchStringFound = 0
-  for Line in OldLines:
-    if SearchString in Line:
-      SearchStringFound = 1
-  if SearchStringFound == 0:
-    ErrorLog.write("Existing schedule number "+str(ExistingScheduleNumber)+" not found.\n")
-    ErrorFound = 1
-
-  # If copying without overwriting, ensure no schedule with that number already exists
-  if EditMode == 2:
-    ReplacementString = '("Schedule '+str(NewScheduleNumber)
-    ReplacementStringFound = 0
-    for Line in OldLines:
-      if ReplacementString in Line:
-        ReplacementStringFound = 1
-    if ReplacementStringFound == 1:
-      ErrorLog.write("New schedule number "+str(NewScheduleNumber)+" already exists in the input file.\n")
-      ErrorFound = 1
-
-  # Each policy schedule must be specified on a single line
-  SplitScheduleFound = 0
-  for Line in OldLines:
-    if Line.startswith("    (2"):
-      SplitScheduleFound = 1
-  if SplitScheduleFound == 1:
-    ErrorLog.write("Each policy schedule in the input file must be specified on a single line, not split across lines.\n")
-    ErrorFound = 1
-
-  ErrorLog.close()
-  return(ErrorFound)
+MaxSubscripts = 3
 
 
 # Main Program
 # ------------
 
-if CheckForErrors() == 0:
+import os
+import sys
 
-  import os
-  if os.path.exists(ErrorLogFileName):
-    os.remove(ErrorLogFileName)
+import PolicyScheduleData
+import ScheduleEdits
 
-  # Prepare files for reading and writing
-  InputFile = open(InputFileName, "r")
-  OuputFile = open(OutputFileName, 'w')
+if len(sys.argv) > 1:
+  Edits = ScheduleEdits.ReadEditsFile(sys.argv[1])
 
-  # Format the search string and replacement string
-  SearchString = '("Schedule '+str(ExistingScheduleNumber)
-  ReplacementString = '("Schedule '+str(NewScheduleNumber)
+Errors = []
 
-  # Load all the lines in the InputFile
-  OldLines = InputFile.readlines()
+# Ensure input file and output file have different filenames
+if InputFileName == OutputFileName:
+  Errors.append("InputFileName and OutputFileName must not be the same.")
+else:
+  EditedElements, Errors = ScheduleEdits.ApplyEdits(PolicyScheduleData.ReadPolicyElements(InputFileName), Edits)
 
-  # Create an empty list to hold the lines for the output file
-  NewLines = []
-
-  # If EditMode is delete, we remove any lines containing the SearchString from OldLines
-  for Line in OldLines:
-    if EditMode == 1 and SearchString in Line:
-      OldLines.remove(Line)
-  
-  # If EditMode is copy with overwriting, we remove any lines containing the ReplacementString from OldLines
-  for Line in OldLines:
-    if EditMode == 3 and ReplacementString in Line:
-      OldLines.remove(Line)
-
-  # We copy OldLines to NewLines, duplicating the schedule to be copied (if in one of the copy EditModes)
-  for Line in OldLines:
-
-    # We copy every line, whether or not it includes the search string
-    NewLines.append(Line)
-
-    # Then, unless EditMode is delete, if the line includes the search string, we update the schedule number and add it to NewLines
-    if EditMode != 1 and SearchString in Line:
-      UpdatedLine = Line.replace(SearchString, ReplacementString)
-      NewLines.append(UpdatedLine)
+if Errors:
+  ErrorLog = open(ErrorLogFileName, 'w')
+  ErrorLog.write("".join(Error+"\n" for Error in Errors))
+  ErrorLog.close()
+  sys.exit(str(len(Errors))+" error(s) found.  No edits were made.  See "+ErrorLogFileName+".")
 
-  # We write the set of NewLines to the output file
-  OuputFile.writelines(NewLines)
+if os.path.exists(ErrorLogFileName):
+  os.remove(ErrorLogFileName)
 
-  InputFile.close()
-  OuputFile.close()
+PolicyScheduleData.WritePolicyElements(OutputFileName, EditedElements, MaxSubscripts)
+print("Applied "+str(len(Edits))+" edit(s) and wrote "+OutputFileName)
@@ -4,8 +4,9 @@
 # It creates schedules in the formats expected by Vensim and by the web app.  It also creates the
 # Policy Elements file required to populate the relevant subscript in Vensim.
 #
-# At least one schedule must be defined for every policy element.  Each schedule has a schedule number
-# ahead of its data indicating which schedule file should use those data.  The script will produce
+# The schedules are stored in a separate .csv file, named below.  At least one schedule must be defined
+# for every policy element.  Each schedule has a schedule number ("Schedule X") in every row of its data
+# indicating which schedule file should use those data.  The script will produce
 # files for a number of schedules defined by "MaxSchedules".  All the policy elements do not need to have
 # the same number of schedules defined.  If you leave a particular schedule for a
 # particular element undefined, the script will use the that policy element's first listed schedule.
@@ -17,7750 +18,154 @@
 
 # Global Constants
 # ----------------
-FirstYear = 2021 # Update this based on the first simulated year of the model run.
-FinalYear = 2100 # This should be the final year supported by EPS.mdl (i.e., 2100), not the final year actually used in a given region.
+# FirstYear and FinalYear, the years covered by the schedule files, are set in PolicyScheduleData.py.
 MaxSchedules = 9
 MaxSubscripts = 3
 RoundingDigits = 3
 
 
-# Policy Implementation Schedules
-# -------------------------------
-
-PolicyElements = (
-
-  (("trans fuel economy standards","passenger","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2035,1),(2050,1)),
-  ),
-  (("trans fuel economy standards","passenger","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2027,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","passenger","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","passenger","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","passenger","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","passenger","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","freight","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2027,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","freight","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2027,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","freight","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","freight","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","freight","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("trans fuel economy standards","freight","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans LDVs feebate"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","passenger","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","passenger","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","passenger","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","passenger","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","passenger","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","passenger","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","freight","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","freight","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","freight","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","freight","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,.11),(2026,.14),(2027,.18),(2028,.23),(2029,.27),(2030,.29),(2032,.29),(2033,.3),(2036,.3),(2037,.31),(2040,.31),(2041,.32),(2050,.32)),
-  ),
-  (("trans mode shifting","freight","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans mode shifting","freight","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","LDVs","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.071),(2027,0.2765),(2028,0.2687),(2029,0.2603),(2030,0.2513),(2031,0.2448),(2032,0.2385),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.926474760464775),(2027,0.710457359765766),(2028,0.720360935506558),(2029,0.730872130609115),(2030,0.741932204405449),(2031,0.75033618230903),(2032,0.75838922400446),(2033,0),(2050,0)),
-  ),
-  (("trans psgr subsidy","LDVs","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","LDVs","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","LDVs","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","LDVs","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.0549),(2027,0.1077),(2028,0.1304),(2029,0.1524),(2030,0.1737),(2031,0.1949),(2032,0.2155),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.944104779601134),(2027,0.890311980032037),(2028,0.867804666443664),(2029,0.845974833024489),(2030,0.824798237882514),(2031,0.803829015355104),(2032,0.783375627765244),(2033,0),(2050,0)),
-  ),
-  (("trans psgr subsidy","LDVs","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),  
-  (("trans psgr subsidy","LDVs","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.071),(2027,0.2765),(2028,0.2687),(2029,0.2603),(2030,0.2513),(2031,0.2448),(2032,0.2385),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.926474760464775),(2027,0.710457359765766),(2028,0.720360935506558),(2029,0.730872130609115),(2030,0.741932204405449),(2031,0.75033618230903),(2032,0.75838922400446),(2033,0),(2050,0)),
-  ),
-  (("trans psgr subsidy","HDVs","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.0291),(2027,0.0574),(2028,0.0849),(2029,0.1115),(2030,0.1374),(2031,0.1625),(2032,0.1869),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.970873786407767),(2027,0.942595909133754),(2028,0.91514165935316),(2029,0.888487047915689),(2030,0.862608784384164),(2031,0.837484256683654),(2032,0.813091511343354),(2033,0),(2050,0)),
-  ),
-  (("trans psgr subsidy","HDVs","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","HDVs","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","HDVs","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","HDVs","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.0291),(2027,0.0574),(2028,0.0849),(2029,0.1115),(2030,0.1374),(2031,0.1625),(2032,0.1869),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.970873786407767),(2027,0.942595909133754),(2028,0.91514165935316),(2029,0.888487047915689),(2030,0.862608784384164),(2031,0.837484256683654),(2032,0.813091511343354),(2033,0),(2050,0)),
-  ),
-  (("trans psgr subsidy","HDVs","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","HDVs","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0),(2027,0),(2028,0),(2029,0),(2030,0),(2031,0),(2032,0),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.970873786407767),(2027,0.942595909133754),(2028,0.91514165935316),(2029,0.888487047915689),(2030,0.862608784384164),(2031,0.837484256683654),(2032,0.813091511343354),(2033,0),(2050,0)),
-  ),
-  (("trans psgr subsidy","aircraft","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","aircraft","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","aircraft","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","aircraft","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","aircraft","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","aircraft","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","aircraft","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","rail","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","rail","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","rail","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","rail","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","rail","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","rail","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","rail","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","ships","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","ships","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","ships","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","ships","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","ships","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","ships","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","ships","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ), 
-  (("trans psgr subsidy","motorbikes","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","motorbikes","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","motorbikes","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","motorbikes","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","motorbikes","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","motorbikes","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans psgr subsidy","motorbikes","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","LDVs","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.0217),(2027,0.0369),(2028,0.0575),(2029,0.0847),(2030,0.1165),(2031,0.1458),(2032,0.1684),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.978279378002495),(2027,0.963073674344668),(2028,0.942458844744462),(2029,0.915264303194245),(2030,0.883505160145525),(2031,0.854244325349431),(2032,0.831618331887171),(2033,0),(2050,0)),
-  ),
-  (("trans frgt subsidy","LDVs","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","LDVs","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","LDVs","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","LDVs","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.0217),(2027,0.0369),(2028,0.0575),(2029,0.0847),(2030,0.1165),(2031,0.1458),(2032,0.1684),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.978279378002495),(2027,0.963073674344668),(2028,0.942458844744462),(2029,0.915264303194245),(2030,0.883505160145525),(2031,0.854244325349431),(2032,0.831618331887171),(2033,0),(2050,0)),
-  ),
-  (("trans frgt subsidy","LDVs","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),  
-  (("trans frgt subsidy","LDVs","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0),(2027,0),(2028,0),(2029,0),(2030,0),(2031,0),(2032,0),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.978279378002495),(2027,0.963073674344668),(2028,0.942458844744462),(2029,0.915264303194245),(2030,0.883505160145525),(2031,0.854244325349431),(2032,0.831618331887171),(2033,0),(2050,0)),
-  ),
-  (("trans frgt subsidy","HDVs","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.0291),(2027,0.0574),(2028,0.0849),(2029,0.1115),(2030,0.1374),(2031,0.1625),(2032,0.1869),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.970873786407767),(2027,0.942595909133754),(2028,0.91514165935316),(2029,0.888487047915689),(2030,0.862608784384164),(2031,0.837484256683654),(2032,0.813091511343354),(2033,0),(2050,0)),
-  ),
-  (("trans frgt subsidy","HDVs","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","HDVs","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","HDVs","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","HDVs","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0.0291),(2027,0.0574),(2028,0.0849),(2029,0.1115),(2030,0.1374),(2031,0.1625),(2032,0.1869),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.970873786407767),(2027,0.942595909133754),(2028,0.91514165935316),(2029,0.888487047915689),(2030,0.862608784384164),(2031,0.837484256683654),(2032,0.813091511343354),(2033,0),(2050,0)),
-  ),
-  (("trans frgt subsidy","HDVs","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","HDVs","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2025,0),(2026,0),(2027,0),(2028,0),(2029,0),(2030,0),(2031,0),(2032,0),(2033,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.970873786407767),(2027,0.942595909133754),(2028,0.91514165935316),(2029,0.888487047915689),(2030,0.862608784384164),(2031,0.837484256683654),(2032,0.813091511343354),(2033,0),(2050,0)),
-  ),
-  (("trans frgt subsidy","aircraft","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","aircraft","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","aircraft","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","aircraft","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","aircraft","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","aircraft","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","aircraft","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","rail","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","rail","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","rail","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","rail","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","rail","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","rail","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","rail","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","ships","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","ships","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","ships","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","ships","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","ships","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","ships","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","ships","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ), 
-  (("trans frgt subsidy","motorbikes","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","motorbikes","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","motorbikes","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","motorbikes","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","motorbikes","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","motorbikes","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans frgt subsidy","motorbikes","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),   
-  (("trans ZEV minimum","passenger","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2027,0.0873),(2028,0.1158),(2029,0.0893),(2030,0.1027),(2031,0.0974),(2032,0.0727),(2033,0.1464),(2034,0.2277),(2035,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2026,0),(2027,0.429508196721312),(2028,0.491803278688525),(2029,0.649180327868852),(2030,0.745901639344262),(2031,0.868852459016394),(2032,1),(2033,0.950819672131147),(2034,0.901639344262295),(2035,0),(2050,0)),
-  ),
-  (("trans ZEV minimum","passenger","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2026,0),(2030,1),(2031,0.7936),(2032,0.6123),(2033,0.6123),(2034,0.6123),(2035,0.6311),(2050,0.6311)),
-    ("Schedule 3",(2021,0),(2026,0),(2027,0),(2028,0),(2029,0),(2030,0),(2031,0),(2032,0),(2033,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","passenger","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","passenger","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","passenger","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","passenger","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","freight","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2027,0.5364),(2028,0.5672),(2029,0.6554),(2030,0.7543),(2031,0.6484),(2032,0.538),(2033,0.6594),(2034,0.7371),(2035,0.8667),(2036,0.9442),(2037,0.9554),(2038,0.9775),(2039,0.9887),(2040,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2026,0),(2027,0.288770053475936),(2028,0.361853832442068),(2029,0.433155080213904),(2030,0.50445632798574),(2031,0.768270944741533),(2032,1),(2033,1),(2034,1),(2035,0.975935828877005),(2050,0.975935828877005)),
-  ),
-  (("trans ZEV minimum","freight","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2027,0.2965),(2028,0.4405),(2029,0.5885),(2030,0.6777),(2031,0.6583),(2032,0.5604),(2033,0.662),(2034,0.7499),(2035,0.8325),(2036,0.9135),(2037,0.9347),(2038,0.9563),(2039,0.9779),(2040,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2026,0),(2027,0),(2028,0),(2029,0),(2030,0.123161764705882),(2031,0.459558823529412),(2032,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","freight","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","freight","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","freight","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans ZEV minimum","freight","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2035,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV vehicle definitions"),
-    ("Schedule 1",(2021,0),(2024,0),(2034,0),(2035,1),(2050,1)),
-  ),  
-  (("trans reduce EV range anxiety and charging time"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans EV charger deployment"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,0),(2026,0.182101529310682),(2027,0.355083414788646),(2028,0.522469298069658),(2029,0.685055509180931),(2030,0.844153099358403),(2031,1),(2032,0.958539101313944),(2033,0.920379346476911),(2034,0.885141571293498),(2035,0.852502537325015),(2036,0.822184987450407),(2037,0.793949750481296),(2038,0.767589418609241),(2039,0.742923243889105),(2040,0.719792988083126),(2041,0.698059524365078),(2042,0.677600036630049),(2043,0.658305697294235),(2044,0.64007973085178),(2045,0.622835790441711),(2046,0.606496589945527),(2047,0.590992745890498),(2048,0.576261792551761),(2049,0.562247340768252),(2050,0.548898356588007)),
-  ),
-  (("trans LCFS"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,0.33),(2050,1)),
-  ),
-  (("trans LCFS vehicles"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),  
-  (("trans reduce regulated pollutants","LDVs","CO2"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","VOC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","CO"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","NOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","PM10"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","PM25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","SOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","BC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","OC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","CH4"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","N2O"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","LDVs","F gases"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","CO2"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","VOC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","CO"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","NOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","PM10"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","PM25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","SOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","BC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","OC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","CH4"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","N2O"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","HDVs","F gases"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","CO2"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","VOC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","CO"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","NOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","PM10"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","PM25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","SOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","BC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","OC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","CH4"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","N2O"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","aircraft","F gases"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","CO2"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","VOC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","CO"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","NOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","PM10"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","PM25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","SOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","BC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","OC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","CH4"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","N2O"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","rail","F gases"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","CO2"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","VOC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","CO"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","NOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","PM10"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","PM25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","SOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","BC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","OC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","CH4"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","N2O"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","ships","F gases"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","CO2"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","VOC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","CO"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","NOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","PM10"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","PM25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","SOx"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","BC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","OC"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","CH4"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","N2O"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans reduce regulated pollutants","motorbikes","F gases"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("trans battery subsidy"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,0.3559),(2031,0.5835),(2032,0.798),(2033,1),(2034,1),(2035,1),(2036,1),(2037,1),(2038,1),(2039,1),(2040,1),(2041,1),(2042,1),(2043,1),(2044,1),(2045,1),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.97),(2027,0.9409),(2028,0.912673),(2029,0.88529281),(2030,0.644050519275),(2031,0.4164860024645),(2032,0.201995711195283),(2033,0),(2050,0)),
-  ),
-  (("trans non BAU ZEV minimum","passenger","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","passenger","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","passenger","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","passenger","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","passenger","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","passenger","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","freight","LDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","freight","HDVs"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","freight","aircraft"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","freight","rail"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","freight","ships"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("trans non BAU ZEV minimum","freight","motorbikes"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec renewable portfolio standards"),
-    ("Schedule 1",(2021,0),(2023,0),(2024,0.37),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0.59),(2030,0.825),(2035,1),(2050,1)),
-  ),
-  (("elec ban new power plants","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec ban new power plants","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plants","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec ban new power plant retrofits","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","natural gas natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2032,0),(2033,1),(2050,1)),
-  ),
-  (("elec generation subsidy","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2040,0),(2041,0.25),(2042,0.5),(2043,1),(2050,1)),
-  ),
-  (("elec generation subsidy","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2038,0),(2039,0.25),(2040,0.5),(2041,1),(2050,1)),
-  ),
-  (("elec generation subsidy","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec generation subsidy","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2029,0),(2030,1),(2050,1)),
-  ),
-  (("elec early retirement","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec early retirement","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec demand response"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("elec avoid TND loss"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2031,0),(2032,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2031,0),(2032,1),(2050,1)),
-  ),
-  (("elec reduce plant downtime","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce plant downtime","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change imports","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec change exports"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","hard coal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","natural gas steam turbine es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","natural gas combined cycle es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","nuclear es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","hydro es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","onshore wind es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","solar PV es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","solar thermal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","biomass es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","geothermal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","petroleum es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","natural gas peaker es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","lignite es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","offshore wind es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","crude oil es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","municipal solid waste es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","hard coal w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","biomass w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","lignite w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","small modular reactor es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity construction","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","hard coal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","natural gas steam turbine es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","natural gas combined cycle es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","nuclear es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","hydro es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","onshore wind es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","solar PV es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","solar thermal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","biomass es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","geothermal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","petroleum es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","natural gas peaker es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","lignite es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","offshore wind es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","crude oil es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","municipal solid waste es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","hard coal w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","biomass w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","lignite w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","small modular reactor es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU mandated capacity retrofit","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU RPS qualifying resources"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec non BAU guaranteed dispatch"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec reduce soft costs","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec reduce soft costs","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2040,0),(2041,0.25),(2042,0.5),(2043,1),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2039,0),(2040,0.25),(2041,0.5),(2042,1),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2040,0),(2041,0.25),(2042,0.5),(2043,1),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec capacity construction subsidy","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-    (("elec CCS subsidy","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2035,0),(2036,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2035,1),(2036,0),(2050,0)),
-  ),
-  (("elec CCS subsidy","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2035,0),(2036,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2035,1),(2036,0),(2050,0)),
-  ),
-  (("elec CCS subsidy","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2035,0),(2036,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2035,1),(2036,0),(2050,0)),
-  ),
-  (("elec CCS subsidy","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2035,0),(2036,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2035,1),(2036,0),(2050,0)),
-  ),
-  (("elec CCS subsidy","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec CCS subsidy","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","hard coal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","natural gas steam turbine es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","natural gas combined cycle es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","nuclear es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","hydro es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","onshore wind es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","solar PV es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","solar thermal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","biomass es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","geothermal es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","petroleum es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","natural gas peaker es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","lignite es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","offshore wind es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","crude oil es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","municipal solid waste es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","hard coal w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","biomass w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","lignite w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","small modular reactor es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec non BAU retirement schedule","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec power plant cost of capital","hard coal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","nuclear es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","hydro es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","onshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","solar PV es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","solar thermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","biomass es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","geothermal es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","petroleum es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","lignite es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","offshore wind es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","crude oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec power plant cost of capital","hard coal w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec power plant cost of capital","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec power plant cost of capital","biomass w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec power plant cost of capital","lignite w CCS es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec power plant cost of capital","small modular reactor es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec power plant cost of capital","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec power plant cost of capital","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("elec use EVs for grid balancing"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec battery construction subsidy"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2038,0),(2039,0.25),(2040,0.5),(2041,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2038,1),(2039,0.75),(2040,0.5),(2041,0),(2050,0)),
-  ),
-  (("elec battery subsidy per output"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("elec non BAU RACP"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("elec battery production subsidy"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2029,0),(2030,0.3559),(2031,0.5835),(2032,0.798),(2033,1),(2034,1),(2035,1),(2036,1),(2037,1),(2038,1),(2039,1),(2040,1),(2041,1),(2042,1),(2043,1),(2044,1),(2045,1),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2026,0.97),(2027,0.9409),(2028,0.912673),(2029,0.88529281),(2030,0.644050519275),(2031,0.4164860024645),(2032,0.201995711195283),(2033,0),(2050,0)),
-  ),
-  (("bldgs rebate","heating"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs rebate","cooling and ventilation"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs rebate","envelope"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs rebate","lighting"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs rebate","appliances"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs rebate","other component"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs efficiency standards","heating","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","heating","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","heating","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","cooling and ventilation","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","cooling and ventilation","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","cooling and ventilation","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","envelope","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","envelope","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","envelope","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","lighting","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","lighting","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","lighting","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","appliances","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","appliances","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","appliances","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","other component","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","other component","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs efficiency standards","other component","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs device labeling"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs contractor training"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","heating","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","heating","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","heating","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","cooling and ventilation","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","cooling and ventilation","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","cooling and ventilation","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","envelope","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","envelope","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","envelope","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","lighting","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","lighting","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","lighting","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","appliances","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,.69),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","appliances","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,.69),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","appliances","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,.24),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","other component","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","other component","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("bldgs new component fuel shifting","other component","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("bldgs retrofitting","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs retrofitting","rural residential"),
-    ("Schedule 1",(2021,0),(2030,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs retrofitting","commercial"),
-    ("Schedule 1",(2021,0),(2030,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs distributed solar subsidy","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs distributed solar subsidy","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs distributed solar subsidy","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("bldgs min fraction distributed solar"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs min req rooftop solar","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs min req rooftop solar","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("bldgs min req rooftop solar","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("non BAU dist solar","urban residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU dist solar","rural residential"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU dist solar","commercial"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst methane capture","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","coal mining 05"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","wood products 16"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","chemicals 20"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","other metals 242"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","other machinery 28"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane capture","construction 41T43"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","coal mining 05"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","wood products 16"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","chemicals 20"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","other metals 242"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","other machinery 28"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst methane destruction","construction 41T43"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst f gas substitution"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst f gas destruction"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst f gas recovery"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","coal mining 05"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","wood products 16"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","chemicals 20"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","other metals 242"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","other machinery 28"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst f gas inspct maint retrofit","construction 41T43"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst cropland and rice measures"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst livestock measures"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst tillage"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("indst cement measures"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","cement industry measures"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","ngp production methane capture"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","ngp production methane destruction"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","ngp processing TnD methane capture"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","ngp processing TnD methane destruction"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","chemicals f gas substitution"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","chemicals f gas destruction"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","chemicals f gas recovery"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","chemicals inspct maint retrofit"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","coal mining methane capture"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","coal mining methane destruction"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","waste management methane capture"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","waste management methane destruction"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","agriculture crop and rice measures"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","agriculture livestock measures"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","agriculture tillage"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","chemicals N2O abatement"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("non BAU indst process emissions","other metals inspct maint retrofit"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst early retirement"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst system integration"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CHP"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","agriculture and forestry 01T03","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","coal mining 05","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","oil and gas extraction 06","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other mining and quarrying 07T08","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","food beverage and tobacco 10T12","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","textiles apparel and leather 13T15","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","wood products 16","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","pulp paper and printing 17T18","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","refined petroleum and coke 19","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","chemicals 20","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","rubber and plastic products 22","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","glass and glass products 231","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","cement and other nonmetallic minerals 239","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","iron and steel 241","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other metals 242","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","metal products except machinery and vehicles 25","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","computers and electronics 26","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","appliances and electrical equipment 27","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other machinery 28","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","road vehicles 29","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","nonroad vehicles 30","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","other manufacturing 31T33","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","energy pipelines and gas processing 352T353","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","water and waste 36T39","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst efficiency standards","construction 41T43","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2031,0),(2032,0),(2033,0.0150809403505798),(2034,0.0645741383502241),(2035,0.114662740986661),(2036,0.175545697251105),(2037,0.23149292267333),(2038,0.293221828669327),(2039,0.353793777620074),(2040,0.418640706165485),(2041,0.47884545144979),(2042,0.539798017774478),(2043,0.599557319021592),(2044,0.657404828359853),(2045,0.71704057653413),(2046,0.773089470446261),(2047,0.830639980703072),(2048,0.887693480289435),(2049,0.944163477540943),(2050,1)),   
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2031,0),(2032,0),(2033,0.0150809403505798),(2034,0.0645741383502241),(2035,0.114662740986661),(2036,0.175545697251105),(2037,0.23149292267333),(2038,0.293221828669327),(2039,0.353793777620074),(2040,0.418640706165485),(2041,0.47884545144979),(2042,0.539798017774478),(2043,0.599557319021592),(2044,0.657404828359853),(2045,0.71704057653413),(2046,0.773089470446261),(2047,0.830639980703072),(2048,0.887693480289435),(2049,0.944163477540943),(2050,1)),
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","agriculture and forestry 01T03","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","coal mining 05","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","coal mining 05","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","coal mining 05","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","coal mining 05","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","coal mining 05","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","coal mining 05","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","coal mining 05","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","coal mining 05","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","oil and gas extraction 06","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","other mining and quarrying 07T08","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","food beverage and tobacco 10T12","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","textiles apparel and leather 13T15","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","wood products 16","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-   
-  ),
-  (("indst shift to electricity","wood products 16","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","wood products 16","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","wood products 16","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","wood products 16","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","wood products 16","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","wood products 16","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","wood products 16","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-   
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","pulp paper and printing 17T18","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","refined petroleum and coke 19","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","chemicals 20","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","chemicals 20","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","chemicals 20","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","chemicals 20","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","chemicals 20","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","chemicals 20","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","chemicals 20","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","chemicals 20","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","rubber and plastic products 22","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","glass and glass products 231","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","glass and glass products 231","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","glass and glass products 231","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","glass and glass products 231","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","glass and glass products 231","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","glass and glass products 231","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","glass and glass products 231","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","glass and glass products 231","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","cement and other nonmetallic minerals 239","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","iron and steel 241","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-   
-  ),
-  (("indst shift to electricity","iron and steel 241","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","iron and steel 241","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
+# Incremental Regeneration
+# ------------------------
+# When IncrementalRegeneration is True, the script stores a fingerprint of the data of every policy element in
+# every schedule file, along with a fingerprint of each file it writes, in the FingerprintsFileName.  On the next
+# run, a schedule file's .csv files are only regenerated if the fingerprint of a policy element in that schedule
+# file has changed (or policy elements were added, removed or reordered), or if either .csv file has changed or
+# is missing.  Whether or not IncrementalRegeneration is True, a .csv file is only written if its contents would
+# change, so unchanged files keep their modification times.  If you change the functions below in a way that
+# changes the .csv files, set IncrementalRegeneration to False (or delete the FingerprintsFileName) for one run.
+IncrementalRegeneration = True
+FingerprintsFileName = "FoPITY-Fingerprints.tsv"
+
+
+# Identical Schedule Files
+# ------------------------
+# Schedule files whose policy elements all use the same data (typically because they fall back to each element's
+# first listed schedule) have identical contents.  The script only builds the contents of each distinct schedule
+# file once, and it writes the AliasesFileName, which lists, for each schedule number, the first schedule number
+# with identical contents, so the web app and other tools can load each distinct file once.  DuplicateScheduleFiles
+# determines how the .csv files of the other schedule numbers are written, since Vensim reads each schedule number's
+# .csv file by name:
+# "Copy" writes a separate copy of the contents to each file.
+# "Hardlink" makes each file a hard link to the first file with identical contents, so the contents are only stored
+#   on disk once.  (Git and most sync software store hard links as separate copies.)  If a hard link cannot be
+#   made, a copy is written instead.
+DuplicateScheduleFiles = "Copy"
+AliasesFileName = "FoPITY-schedule-aliases.csv"
+
+
+# Web App JSON Files
+# ------------------
+# When WriteWebAppJSON is True, the script also writes each schedule file in a compact JSON format for use by the
+# web app, named like the web app .csv file but with a .json extension (for example, "FoPITY-1-WebApp.json").  Rather
+# than one pair of columns per year, most of which are empty, it holds only the ordered pairs of each policy element:
+#   {"FirstYear":2021,"FinalYear":2100,"MaxSubscripts":3,"Elements":[
+#   [["trans fuel economy standards","passenger","LDVs"],[[2021,0],[2024,0],[2050,1]]],
+#   ...
+#   ]}
+# Each element lists its policy and subscript names (without unused subscripts), then its ordered pairs, rounded as
+# in the web app .csv file.  After writing, the script rebuilds the web app .csv file from the JSON file and stops
+# with an error if the two differ.
+WriteWebAppJSON = True
 
-  ),
-  (("indst shift to electricity","iron and steel 241","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
 
-
-
-  ),
-  (("indst shift to electricity","iron and steel 241","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","iron and steel 241","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","iron and steel 241","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","iron and steel 241","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other metals 242","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other metals 242","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other metals 242","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other metals 242","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","other metals 242","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","other metals 242","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other metals 242","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","other metals 242","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","metal products except machinery and vehicles 25","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","computers and electronics 26","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","computers and electronics 26","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","computers and electronics 26","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","computers and electronics 26","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","computers and electronics 26","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","computers and electronics 26","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","computers and electronics 26","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","computers and electronics 26","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","appliances and electrical equipment 27","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","other machinery 28","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other machinery 28","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other machinery 28","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other machinery 28","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","other machinery 28","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","other machinery 28","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other machinery 28","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","other machinery 28","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","road vehicles 29","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","road vehicles 29","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","road vehicles 29","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","road vehicles 29","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","road vehicles 29","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","road vehicles 29","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","road vehicles 29","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","road vehicles 29","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","nonroad vehicles 30","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","other manufacturing 31T33","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","energy pipelines and gas processing 352T353","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","water and waste 36T39","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00430860389549994),(2026,0.0245737431507314),(2027,0.051884364063092),(2028,0.0884422867264466),(2029,0.130664719992449),(2030,0.18059984008011),(2031,0.229760147739273),(2032,0.280450008381156),(2033,0.331663290203297),(2034,0.384401087816335),(2035,0.43559807390952),(2036,0.485892846395604),(2037,0.535974130809187),(2038,0.585085409471197),(2039,0.634551389581585),(2040,0.68314171299504),(2041,0.731391745906231),(2042,0.778759275849873),(2043,0.825457765550355),(2044,0.871324839165784),(2045,0.912727804091361),(2046,0.949475822114426),(2047,0.975048466864155),(2048,0.992170312344385),(2049,1),(2050,1)),
-
-  ),
-  (("indst shift to electricity","water and waste 36T39","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00707847866242893),(2026,0.0222385077440901),(2027,0.0422878636346132),(2028,0.0724364109680908),(2029,0.109686800783216),(2030,0.153360083060845),(2031,0.194359932548545),(2032,0.237702110159934),(2033,0.282085646839534),(2034,0.327066434528767),(2035,0.371713583378173),(2036,0.416893380877475),(2037,0.46225978653916),(2038,0.506868848455197),(2039,0.551621719445065),(2040,0.595091805934341),(2041,0.638780435046505),(2042,0.681759668002122),(2043,0.724231537798979),(2044,0.76609132607748),(2045,0.807238478031854),(2046,0.847286066135378),(2047,0.88766135123104),(2048,0.927869735320964),(2049,0.967290808038128),(2050,1)),
-
-  ),
-  (("indst shift to electricity","water and waste 36T39","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","water and waste 36T39","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0),(2032,0.0409227320797794),(2033,0.0597006713809087),(2034,0.105162462169801),(2035,0.145900268158783),(2036,0.195800885449902),(2037,0.243851584218522),(2038,0.296256956706227),(2039,0.37908144760079),(2040,0.436507583383526),(2041,0.49296825876709),(2042,0.550484741841733),(2043,0.606987338882833),(2044,0.662085226756116),(2045,0.720681651787557),(2046,0.776555721192875),(2047,0.833404399808168),(2048,0.889846893247145),(2049,0.945228916217109),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","water and waste 36T39","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,0),(2026,0.0234896207432747),(2027,0.0579451296819941),(2028,0.100192283549472),(2029,0.146300686000893),(2030,0.201189152002435),(2031,0.256192716452157),(2032,0.31192309708473),(2033,0.385612981990524),(2034,0.44340690210574),(2035,0.500515040005399),(2036,0.556827223975486),(2037,0.61271199596125),(2038,0.667722345468388),(2039,0.723713984449465),(2040,0.77894109012468),(2041,0.833428340090281),(2042,0.889362023876599),(2043,0.937319083619702),(2044,0.970457709480617),(2045,0.991111142374896),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("indst shift to electricity","water and waste 36T39","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.0292512881215496),(2026,0.0358545793527588),(2027,0.0409524748989923),(2028,0.0488545589610774),(2029,0.0856691855069269),(2030,0.128777122360419),(2031,0.17445904630445),(2032,0.224093676964755),(2033,0.279537559759549),(2034,0.328555072514543),(2035,0.375588114112081),(2036,0.42071407409664),(2037,0.465137809611965),(2038,0.511983665944396),(2039,0.556148685211824),(2040,0.604005167889987),(2041,0.64999148167807),(2042,0.694804936706822),(2043,0.738074402254279),(2044,0.781051156837666),(2045,0.823526465925372),(2046,0.865500475952867),(2047,0.907384083694114),(2048,0.948414444860884),(2049,0.988543165013093),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","water and waste 36T39","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to electricity","water and waste 36T39","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0),(2026,0.0158064201491289),(2027,0.0425227353599193),(2028,0.0771843971501074),(2029,0.116026296475986),(2030,0.160843925704021),(2031,0.204846078101964),(2032,0.250848396656407),(2033,0.297539428007111),(2034,0.346373519497944),(2035,0.392667838479088),(2036,0.436732427063538),(2037,0.481059159073821),(2038,0.523916541208964),(2039,0.567267664339482),(2040,0.610330323386048),(2041,0.652926061214032),(2042,0.693967142148885),(2043,0.734121345602715),(2044,0.773095356238781),(2045,0.811268770218775),(2046,0.84862863064165),(2047,0.886735034054374),(2048,0.92374022149254),(2049,0.95999732428006),(2050,1)),
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to electricity","construction 41T43","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-     ("Schedule 2",(2021,0),(2030,0),(2031,0.00779073673862805),(2032,0.0223460490682356),(2033,0.0532235207269123),(2034,0.0908889342491251),(2035,0.14561033173413),(2036,0.206002666191334),(2037,0.268482181741064),(2038,0.328912435010686),(2039,0.387236729292853),(2040,0.446755528890567),(2041,0.502513455024607),(2042,0.56027780682145),(2043,0.617962936257416),(2044,0.676099001126412),(2045,0.732129160421889),(2046,0.786930021089283),(2047,0.833229551136511),(2048,0.886761477096314),(2049,0.947192528342484),(2050,1)),
-
-
-
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","agriculture and forestry 01T03","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","coal mining 05","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","oil and gas extraction 06","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other mining and quarrying 07T08","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","food beverage and tobacco 10T12","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","textiles apparel and leather 13T15","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","wood products 16","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","pulp paper and printing 17T18","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","refined petroleum and coke 19","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","chemicals 20","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","rubber and plastic products 22","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","glass and glass products 231","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","cement and other nonmetallic minerals 239","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","iron and steel 241","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other metals 242","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","metal products except machinery and vehicles 25","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","computers and electronics 26","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","appliances and electrical equipment 27","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other machinery 28","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","road vehicles 29","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","nonroad vehicles 30","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","other manufacturing 31T33","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","energy pipelines and gas processing 352T353","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","water and waste 36T39","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","boilers"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","nonboiler low temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","nonboiler med temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","nonboiler high temp"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","cooling"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","machine drive"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","electrochemical"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to hydrogen","construction 41T43","other processes"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","coal mining 05"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","wood products 16"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","chemicals 20"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","other metals 242"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","other machinery 28"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce nonenergy product demand","construction 41T43"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst shift to nonanimal products"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","electricity"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","hard coal"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","natural gas"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","nuclear"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","hydro"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","wind"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","solar"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","biomass"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","petroleum gasoline"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","petroleum diesel"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","biofuel gasoline"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","biofuel diesel"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","jet fuel or kerosene"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","heat"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","geothermal"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","lignite"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","crude oil"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","heavy or residual fuel oil"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","LPG propane or butane"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","municipal solid waste"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst reduce fossil fuel exports","hydrogen"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","agriculture and forestry 01T03","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","coal mining 05","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","oil and gas extraction 06","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other mining and quarrying 07T08","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","food beverage and tobacco 10T12","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","textiles apparel and leather 13T15","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","wood products 16","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","pulp paper and printing 17T18","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","refined petroleum and coke 19","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","chemicals 20","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","rubber and plastic products 22","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","glass and glass products 231","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","cement and other nonmetallic minerals 239","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","iron and steel 241","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other metals 242","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","metal products except machinery and vehicles 25","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","computers and electronics 26","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","appliances and electrical equipment 27","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other machinery 28","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","road vehicles 29","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","nonroad vehicles 30","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","other manufacturing 31T33","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","energy pipelines and gas processing 352T353","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","water and waste 36T39","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","electricity if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","hard coal if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","natural gas if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","biomass if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","petroleum diesel if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","heat if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","crude oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","heavy or residual fuel oil if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","LPG propane or butane if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst feedstock shifting","construction 41T43","hydrogen if"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","agriculture and forestry 01T03","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","agriculture and forestry 01T03","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","coal mining 05","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","coal mining 05","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","oil and gas extraction 06","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","oil and gas extraction 06","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other mining and quarrying 07T08","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other mining and quarrying 07T08","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","food beverage and tobacco 10T12","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","food beverage and tobacco 10T12","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","textiles apparel and leather 13T15","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","textiles apparel and leather 13T15","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","wood products 16","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","wood products 16","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","pulp paper and printing 17T18","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","pulp paper and printing 17T18","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","refined petroleum and coke 19","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","refined petroleum and coke 19","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst CCS","chemicals 20","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst CCS","chemicals 20","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst CCS","rubber and plastic products 22","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","rubber and plastic products 22","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","glass and glass products 231","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","glass and glass products 231","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","cement and other nonmetallic minerals 239","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst CCS","cement and other nonmetallic minerals 239","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst CCS","iron and steel 241","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","iron and steel 241","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other metals 242","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other metals 242","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","metal products except machinery and vehicles 25","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","metal products except machinery and vehicles 25","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","computers and electronics 26","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","computers and electronics 26","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","appliances and electrical equipment 27","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","appliances and electrical equipment 27","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other machinery 28","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other machinery 28","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","road vehicles 29","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","road vehicles 29","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","nonroad vehicles 30","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","nonroad vehicles 30","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other manufacturing 31T33","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","other manufacturing 31T33","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","energy pipelines and gas processing 352T353","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","energy pipelines and gas processing 352T353","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("indst CCS","water and waste 36T39","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","water and waste 36T39","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","construction 41T43","energy related emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst CCS","construction 41T43","process emissions"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("indst non BAU CCS","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","coal mining 05"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","wood products 16"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","chemicals 20"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","other metals 242"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","other machinery 28"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst non BAU CCS","construction 41T43"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","coal mining 05"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","wood products 16"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","chemicals 20"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","other metals 242"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","other machinery 28"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst buy in region outputs","construction 41T43"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("indst N2O abatement"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","electricity","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hard coal","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","natural gas","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","nuclear","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydro","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","wind","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","solar","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biomass","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum gasoline","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","petroleum diesel","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel gasoline","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","biofuel diesel","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","jet fuel or kerosene","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heat","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","geothermal","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","lignite","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","crude oil","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","heavy or residual fuel oil","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","LPG propane or butane","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","municipal solid waste","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydrogen","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2032,0),(2033,0.992),(2034,0.996),(2035,1),(2036,1),(2037,1),(2038,1),(2039,1),(2040,1),(2041,1),(2042,1),(2043,1),(2044,1),(2045,1),(2046,1),(2047,1),(2048,1),(2049,1),(2050,1)),
-  ),
-  (("cross fuel tax","hydrogen","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2032,0),(2033,0.989),(2034,0.989),(2035,0.99),(2036,0.991),(2037,0.991),(2038,0.992),(2039,0.993),(2040,0.993),(2041,0.994),(2042,0.995),(2043,0.995),(2044,0.996),(2045,0.997),(2046,0.997),(2047,0.998),(2048,0.999),(2049,0.999),(2050,1)),
-  ),
-  (("cross fuel tax","hydrogen","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydrogen","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydrogen","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2032,0),(2033,1),(2034,0.995),(2035,0.989),(2036,0.984),(2037,0.978),(2038,0.971),(2039,0.965),(2040,0.958),(2041,0.951),(2042,0.944),(2043,0.936),(2044,0.928),(2045,0.92),(2046,0.911),(2047,0.902),(2048,0.892),(2049,0.882),(2050,0.872)),
-  ),
-  (("cross fuel tax","hydrogen","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydrogen","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel tax","hydrogen","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","transportation sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","electricity sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","residential buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","commercial buildings sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","industry sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","district heat and hydrogen sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","LULUCF sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross carbon tax","geoengineering sector"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","electricity"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","hard coal"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","natural gas"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","nuclear"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","hydro"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","wind"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","solar"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","biomass"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","petroleum gasoline"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","petroleum diesel"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","biofuel gasoline"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","biofuel diesel"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","jet fuel or kerosene"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","heat"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","geothermal"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","lignite"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","crude oil"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","heavy or residual fuel oil"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","LPG propane or butane"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","municipal solid waste"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross reduce BAU subsidies","hydrogen"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","electricity"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","hard coal"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","natural gas"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","nuclear"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","hydro"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","wind"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","solar"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","biomass"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","petroleum gasoline"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","petroleum diesel"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","biofuel gasoline"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","biofuel diesel"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","jet fuel or kerosene"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","heat"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","geothermal"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","lignite"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","crude oil"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","heavy or residual fuel oil"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","LPG propane or butane"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","municipal solid waste"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether policies affect energy prices","hydrogen"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","coal mining 05"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","oil and gas extraction 06"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","wood products 16"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","chemicals 20"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","rubber and plastic products 22"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","glass and glass products 231"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","iron and steel 241"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","other metals 242"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","computers and electronics 26"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","other machinery 28"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","road vehicles 29"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","nonroad vehicles 30"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","other manufacturing 31T33"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","water and waste 36T39"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects process emissions","construction 41T43"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross toggle whether carbon tax affects non CO2 emissions"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-    (("cross toggle carbon tax border adjustment"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross fuel price deregulation","electricity"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","hard coal"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","natural gas"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","nuclear"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","hydro"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","wind"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","solar"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","biomass"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","petroleum gasoline"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","petroleum diesel"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","biofuel gasoline"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","biofuel diesel"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","jet fuel or kerosene"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","heat"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","geothermal"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","lignite"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","crude oil"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","heavy or residual fuel oil"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","LPG propane or butane"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","municipal solid waste"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross fuel price deregulation","hydrogen"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("cross non BAU carbon tax vehicle"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross non BAU carbon tax industry"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("cross non BAU carbon tax border adjustment industry"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("heat convert heat to CHP"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("heat fuel type shifting"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("hydgn shift production pathways"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2030,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("hydgn non BAU shift"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("land forest set asides"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("land afforestation and reforestation"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,1),(2030,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2026,0),(2027,0.02475),(2028,1),(2029,.216),(2030,0),(2050,0)),
-  ),
-  (("land forest management"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 3",(2021,0),(2022,0),(2024,0),(2025,0.795040624895678),(2026,0.965077189931027),(2027,1),(2028,0.805897686844236),(2029,0.577960999620201),(2030,0.456595890343848),(2031,0.313665095520499),(2032,0.219676296683021),(2033,0.125740324315568),(2034,0.055080834112133),(2035,0),(2050,0)),
-  ),
-  (("land avoid deforestation"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-  ),
-  (("land peatland restoration"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("land forest restoration"),
-    ("Schedule 1",(2021,0),(2024,0),(2025,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2024,0),(2025,1),(2050,1)),
-  ),
-  (("RnD transportation capital cost reduction","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation capital cost reduction","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation capital cost reduction","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation capital cost reduction","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation capital cost reduction","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation capital cost reduction","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation capital cost reduction","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","hard coal es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","nuclear es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","hydro es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","onshore wind es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","solar PV es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","solar thermal es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","biomass es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","geothermal es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","petroleum es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","lignite es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","offshore wind es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","crude oil es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity capital cost reduction","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building capital cost reduction","heating"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building capital cost reduction","cooling and ventilation"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building capital cost reduction","envelope"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building capital cost reduction","lighting"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building capital cost reduction","appliances"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building capital cost reduction","other component"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","coal mining 05"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","wood products 16"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","chemicals 20"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","other metals 242"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","other machinery 28"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry capital cost reduction","construction 41T43"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD CCS capital cost reduction"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation fuel use reduction","battery electric vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation fuel use reduction","natural gas vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation fuel use reduction","gasoline vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation fuel use reduction","diesel vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation fuel use reduction","plugin hybrid vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation fuel use reduction","LPG vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD transportation fuel use reduction","hydrogen vehicle"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","hard coal es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","natural gas steam turbine es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","natural gas combined cycle es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","nuclear es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","hydro es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","onshore wind es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","solar PV es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","solar thermal es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","biomass es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","geothermal es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","petroleum es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","natural gas peaker es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","lignite es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","offshore wind es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","crude oil es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","heavy or residual fuel oil es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","municipal solid waste es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","hard coal w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","natural gas combined cycle w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","biomass w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","lignite w CCS es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","small modular reactor es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","hydrogen combustion turbine es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD electricity fuel use reduction","hydrogen combined cycle es"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),  
-  (("RnD building fuel use reduction","heating"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building fuel use reduction","cooling and ventilation"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building fuel use reduction","envelope"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building fuel use reduction","lighting"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building fuel use reduction","appliances"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD building fuel use reduction","other component"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","agriculture and forestry 01T03"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","coal mining 05"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","oil and gas extraction 06"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","other mining and quarrying 07T08"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","food beverage and tobacco 10T12"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","textiles apparel and leather 13T15"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","wood products 16"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","pulp paper and printing 17T18"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","refined petroleum and coke 19"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","chemicals 20"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","rubber and plastic products 22"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","glass and glass products 231"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","cement and other nonmetallic minerals 239"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","iron and steel 241"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","other metals 242"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","metal products except machinery and vehicles 25"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","computers and electronics 26"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","appliances and electrical equipment 27"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","other machinery 28"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","road vehicles 29"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","nonroad vehicles 30"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","other manufacturing 31T33"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","energy pipelines and gas processing 352T353"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","water and waste 36T39"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD industry fuel use reduction","construction 41T43"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("RnD CCS fuel use reduction"),
-    ("Schedule 1",(2021,0),(2022,0),(2023,0),(2024,0),(2025,0.00455),(2026,0.006773),(2027,0.010071),(2028,0.014951),(2029,0.022144),(2030,0.032683),(2031,0.047995),(2032,0.069968),(2033,0.100947),(2034,0.143553),(2035,0.20019),(2036,0.272169),(2037,0.358596),(2038,0.455568),(2039,0.556432),(2040,0.653404),(2041,0.739831),(2042,0.81181),(2043,0.868447),(2044,0.911053),(2045,0.942032),(2046,0.964005),(2047,0.979317),(2048,0.989856),(2049,0.997049),(2050,1)),
-  ),
-  (("geoeng direct air capture"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("geoeng enhanced rock weathering"),
-    ("Schedule 1",(2021,0),(2024,0),(2050,1)),
-    ("Schedule 2",(2021,0),(2030,0),(2050,1)),
-  ),
-  (("settings exogenous GDP adjustment"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA carbon tax revenue","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA carbon tax revenue","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA carbon tax revenue","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA carbon tax revenue","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA carbon tax revenue","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel tax revenue","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel tax revenue","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel tax revenue","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel tax revenue","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel tax revenue","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA EV subsidy","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA EV subsidy","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA EV subsidy","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA EV subsidy","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA EV subsidy","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA battery production subsidy","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-    ("Schedule 2",(2021,0),(2032,0),(2033,1),(2050,1)),
-  ),
-  (("GRA battery production subsidy","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA battery production subsidy","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA battery production subsidy","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA battery production subsidy","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec gen subsidy","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec gen subsidy","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec gen subsidy","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec gen subsidy","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec gen subsidy","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec cap const subsidy","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec cap const subsidy","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec cap const subsidy","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec cap const subsidy","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA elec cap const subsidy","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA dist solar subsidy","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA dist solar subsidy","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA dist solar subsidy","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA dist solar subsidy","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA dist solar subsidy","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel subsidy","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel subsidy","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel subsidy","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel subsidy","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA fuel subsidy","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA CCS subsidy","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA CCS subsidy","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA CCS subsidy","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA CCS subsidy","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA CCS subsidy","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),  
-  (("GRA national debt interest","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA national debt interest","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA national debt interest","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA national debt interest","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA national debt interest","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA remaining cash flow changes","regular spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA remaining cash flow changes","deficit spending"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA remaining cash flow changes","household taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA remaining cash flow changes","payroll taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  ),
-  (("GRA remaining cash flow changes","corporate taxes"),
-    ("Schedule 1",(2021,1),(2050,1)),
-  )
-)
+# Policy Implementation Schedules
+# -------------------------------
+# The schedules are read from the ScheduleDataFileName, which holds one row per ordered pair (see PolicyScheduleData.py).
+# Use EditScheduleTool.py to copy or delete schedules, or edit the file directly.
+ScheduleDataFileName = "PolicyImplementationSchedules.csv"
+ValidationReportFileName = "FoPITY-Validation-Report.json" # Written if errors are found in the schedules
 
 
 # Functions
 # ---------
 
-# Write Policy and Subscript Headers
-def WritePolicyAndSubscriptHeaders():
-  f.write("Policy,")
-  for Subscript in range(1,MaxSubscripts+1):
-    f.write("Subscript "+str(Subscript)+",")
-
-# Write policy and subscript names, adding commas for unused subscripts
-def WritePolicyAndSubscriptNames(PolicyElement):
-  for PolicyProperty in range(MaxSubscripts+1):
-    # If the policy has no subscripts, just write the policy name plus commas.
-    if type(PolicyElement[0]) is str:
-      # Only write the name and commas on our first pass through the loop.
-      if PolicyProperty == 0:
-        f.write(PolicyElement[0]+",,,,")
-    elif len(PolicyElement[0])-1 >= PolicyProperty:
-      f.write(PolicyElement[0][PolicyProperty]+",")
-    else:
-      f.write(",")
-
-# Returns the schedule (a list of ordered pairs) to use when writing data for a policy element
-def SetActiveSchedule(PolicyElement):
-  for ItemIndex in range(len(PolicyElement)):
-    # Do not check the policy and subscript names (the first item in PolicyElement)
-    if ItemIndex == 0:
-      continue
-    # Filter non-numerical characters out of the "Schedule X" string in the schedule row.
-    ItemScheduleNum = int(list(filter(str.isdigit, PolicyElement[ItemIndex][0]))[0])
-    # Check if that number matches the number of the current schedule file we are writing.
-    if Schedule == ItemScheduleNum:
-      # If we have a match, return all the ordered pairs (all elements after the first) for the matching schedule.
-      return PolicyElement[ItemIndex][1:]
-  # If we do not have a match, return all the ordered pairs (all elements after the first) for the first listed
-  # schedule for that policy element, which is the default schedule.
-  return PolicyElement[1][1:]
-
-# Write a .csv file formatted for use by Vensim
-def WriteVensimFile():
-
-  # Write header row
-  WritePolicyAndSubscriptHeaders()
-  for Year in range(FirstYear,FinalYear):
-    f.write(str(Year)+",")
-  f.write(str(FinalYear)+"\n")
-  
-  # Write policy element rows
-  for PolicyElement in PolicyElements:
-  
-    WritePolicyAndSubscriptNames(PolicyElement)
-
-    ActiveSchedule = SetActiveSchedule(PolicyElement)
-    
-    # Write policy implementation percentages for each year
-    for Year in range(FirstYear,FinalYear+1):
-      # Find the ordered pairs most closely enclosing the active year
-      PairBelow = ActiveSchedule[0]
-      PairAbove = ActiveSchedule[len(ActiveSchedule)-1]
-      for OrderedPair in ActiveSchedule:
-        if OrderedPair[0] <= Year:
-          PairBelow = OrderedPair
-        if OrderedPair[0] >= Year:
-          PairAbove = OrderedPair
-          break
-
-      # If the enclosing pairs match each other, they also match the active year, so we
-      # simply write the implementation percentage from one of the pairs.
-      if PairAbove == PairBelow:
-        ImplementationPerc = PairBelow[1]
-      # Otherwise, we linearly interpolate between the enclosing pairs
-      else:
-        FractionBetweenYears = (Year-PairBelow[0])/(PairAbove[0]-PairBelow[0])
-        ImplementationPerc = PairBelow[1]+FractionBetweenYears*(PairAbove[1]-PairBelow[1])
-
-      # We round the implementation percentage to the correct number of digits and write it
-      ImplementationPerc = round(ImplementationPerc, RoundingDigits)
-
-      # Python sometimes writes 1 as "1.0" and 0 as "0.0" when it is a calculated value.
-      # It is cleaner to see it as "1" or "0" in the output, so if the value is 1 or 0,
-      # we convert the float to an integer.  This doesn't change the value.
-      if ImplementationPerc == 1 or ImplementationPerc == 0:
-        ImplementationPerc = int(ImplementationPerc)
-      
-      f.write(str(ImplementationPerc))
-      # If this was not the last year, we add a comma
-      if Year < FinalYear:
-        f.write(",")
-        
-    # New line for next policy element
-    f.write("\n")
+import hashlib
+import json
+import os
+import sys
+
+try:
+  import numpy as np
+except ImportError:
+  sys.exit("Error: This script requires NumPy.  Install it (for example, with \"pip install numpy\") and run the script again.")
+
+import PolicyScheduleData
+import ScheduleValidation
+from PolicyScheduleData import FirstYear, FinalYear, ScheduleNumber, PolicyElementSubscript
+
+# Returns the policy and subscript headers
+def PolicyAndSubscriptHeaders():
+  return "Policy,"+"".join("Subscript "+str(Subscript)+"," for Subscript in range(1,MaxSubscripts+1))
+
+# Returns the policy and subscript names, adding commas for unused subscripts
+def PolicyAndSubscriptNames(PolicyElement):
+  # If the policy has no subscripts, just write the policy name plus commas.
+  if type(PolicyElement[0]) is str:
+    return PolicyElement[0]+","*(MaxSubscripts+1)
+  return "".join(PolicyElement[0][PolicyProperty]+"," if len(PolicyElement[0])-1 >= PolicyProperty else "," for PolicyProperty in range(MaxSubscripts+1))
+
+# Returns a dictionary of the schedule (a list of ordered pairs) to use for a policy element in each schedule file,
+# by schedule number.  Each schedule row holds a "Schedule X" label followed by the ordered pairs.  If a schedule
+# number is listed more than once, the first listing is used.  Schedule files with no matching schedule use the
+# ordered pairs of the first listed schedule for that policy element, which is the default schedule.
+def ResolveSchedules(PolicyElement):
+  DefinedSchedules = {}
+  for ScheduleRow in PolicyElement[1:]:
+    DefinedSchedules.setdefault(ScheduleNumber(ScheduleRow[0]), ScheduleRow[1:])
+  DefaultSchedule = PolicyElement[1][1:]
+  return {Schedule: DefinedSchedules.get(Schedule, DefaultSchedule) for Schedule in range(1,MaxSchedules+1)}
+
+# Calculate the implementation fraction in each year of each schedule in Schedules (a list of schedules, each a
+# list of ordered pairs), returning an array with one row per schedule and one column per year.  Rather than
+# searching each schedule for the ordered pairs most closely enclosing each year, we pad all the schedules to
+# the same number of ordered pairs (using years that are never reached) and count the pairs before each year
+# in every schedule at once.  The pair below a year is the last pair at or before it, and the pair above is the
+# first pair at or after it.  Years before the first pair or after the last pair use the first or last pair.
+def InterpolateSchedules(Schedules):
+  Years = np.arange(FirstYear,FinalYear+1)
+  PairCounts = np.array([len(ActiveSchedule) for ActiveSchedule in Schedules])
+  PairYears = np.full((len(Schedules),PairCounts.max()), np.inf)
+  PairFractions = np.zeros((len(Schedules),PairCounts.max()))
+  for ScheduleNum, ActiveSchedule in enumerate(Schedules):
+    PairYears[ScheduleNum,:len(ActiveSchedule)] = [OrderedPair[0] for OrderedPair in ActiveSchedule]
+    PairFractions[ScheduleNum,:len(ActiveSchedule)] = [OrderedPair[1] for OrderedPair in ActiveSchedule]
+
+  PairBelow = np.maximum((PairYears[:,:,np.newaxis] <= Years).sum(axis=1)-1, 0)
+  PairAbove = np.minimum((PairYears[:,:,np.newaxis] < Years).sum(axis=1), PairCounts[:,np.newaxis]-1)
+  YearBelow = np.take_along_axis(PairYears, PairBelow, axis=1)
+  YearAbove = np.take_along_axis(PairYears, PairAbove, axis=1)
+  FractionBelow = np.take_along_axis(PairFractions, PairBelow, axis=1)
+  FractionAbove = np.take_along_axis(PairFractions, PairAbove, axis=1)
+
+  # If the enclosing pairs match each other, they also match the active year, so we simply use the implementation
+  # percentage from one of the pairs.  Otherwise, we linearly interpolate between the enclosing pairs.
+  with np.errstate(divide='ignore', invalid='ignore'):
+    FractionBetweenYears = (Years-YearBelow)/(YearAbove-YearBelow)
+    return np.where(PairBelow == PairAbove, FractionBelow, FractionBelow+FractionBetweenYears*(FractionAbove-FractionBelow))
+
+# Calculate the implementation fractions of every policy element in each schedule file in Schedules, returning an
+# array with one entry per schedule file, policy element and year.  ScheduleIndex holds the schedules of each
+# policy element from ResolveSchedules().  Many policy elements use the same schedule in several schedule files,
+# so each distinct schedule is only interpolated once.
+def CalculateImplementationFractions(ScheduleIndex, Schedules):
+  DistinctSchedules = {}
+  ScheduleRows = [[DistinctSchedules.setdefault(ElementSchedules[Schedule], len(DistinctSchedules)) for ElementSchedules in ScheduleIndex] for Schedule in Schedules]
+  return InterpolateSchedules(list(DistinctSchedules))[np.array(ScheduleRows)]
+
+# Convert an array of implementation fractions to text.  We round each implementation percentage to the correct
+# number of digits.  Python sometimes writes 1 as "1.0" and 0 as "0.0" when it is a calculated value.  It is
+# cleaner to see it as "1" or "0" in the output, so if the value is 1 or 0, we convert the float to an integer.
+# This doesn't change the value.  The schedules share relatively few distinct values, so we convert each distinct
+# value once and then look up the text for every entry in the array.
+def FormatImplementationFractions(ImplementationFractions):
+  DistinctFractions, Positions = np.unique(ImplementationFractions, return_inverse=True)
+  FractionText = []
+  for ImplementationPerc in DistinctFractions.tolist():
+    ImplementationPerc = round(ImplementationPerc, RoundingDigits)
+    if ImplementationPerc == 1 or ImplementationPerc == 0:
+      ImplementationPerc = int(ImplementationPerc)
+    FractionText.append(str(ImplementationPerc))
+  return np.array(FractionText, dtype=object)[Positions.reshape(ImplementationFractions.shape)]
 
 # define rounding
 
@@ -7769,91 +174,168 @@ def round_to_three_decimal_places(x):
         return round(x, 3)
     return x
 
-# Write a .csv file formatted for use by the web app
-def WriteWebAppFile():
-
-  # Write header row
-  WritePolicyAndSubscriptHeaders()
-  for Year in range(FirstYear,FinalYear):
-    f.write("Year,Imp %,")
-  f.write("Year,Imp %\n")
-
-  # Write policy element rows
-  for PolicyElement in PolicyElements:
-  
-    WritePolicyAndSubscriptNames(PolicyElement)
-    
-    ActiveSchedule = SetActiveSchedule(PolicyElement)
-
-# Write schedule data
-    for Year in range(FirstYear, FinalYear + 1):
-        if Year - FirstYear < len(ActiveSchedule):
-         # Round numerical components to 3 decimal places
-            first_element = round_to_three_decimal_places(ActiveSchedule[Year - FirstYear][0])
-            second_element = round_to_three_decimal_places(ActiveSchedule[Year - FirstYear][1])
-
-            f.write(str(first_element) + ",")
-            f.write(str(second_element) + ",")
-        elif Year < FinalYear:
-            f.write(",,")
-    f.write(",\n")
-    
-
-def WritePolicyElementsFile():
-  f.write("Policy Element Subscript\n")
-  for PolicyElement in PolicyElements:
-    # If the policy has no subscripts, just write the policy name followed by " X".
+# Returns the schedule data for a row of a .csv file formatted for use by the web app: the ordered pairs of the
+# schedule, rounded to 3 decimal places, followed by empty columns for the remaining years
+def WebAppScheduleData(ActiveSchedule):
+  ScheduleData = "".join(str(round_to_three_decimal_places(OrderedPair[0]))+","+str(round_to_three_decimal_places(OrderedPair[1]))+"," for OrderedPair in ActiveSchedule[:FinalYear-FirstYear+1])
+  return ScheduleData+",,"*max(FinalYear-FirstYear-len(ActiveSchedule), 0)+",\n"
+
+# Returns the header row of a .csv file formatted for use by the web app
+def WebAppHeader():
+  return PolicyAndSubscriptHeaders()+"Year,Imp %,"*(FinalYear-FirstYear)+"Year,Imp %\n"
+
+# Returns the ordered pairs of a schedule as written to a web app JSON file, in JSON
+def WebAppJSONPoints(ActiveSchedule):
+  return json.dumps([[round_to_three_decimal_places(OrderedPair[0]),round_to_three_decimal_places(OrderedPair[1])] for OrderedPair in ActiveSchedule[:FinalYear-FirstYear+1]], separators=(",",":"))
+
+# Returns the first and last lines of a web app JSON file
+def WebAppJSONHeader():
+  return '{"FirstYear":'+str(FirstYear)+',"FinalYear":'+str(FinalYear)+',"MaxSubscripts":'+str(MaxSubscripts)+',"Elements":[\n'
+
+def WebAppJSONFooter():
+  return "\n]}\n"
+
+# Returns the contents of a .csv file formatted for use by the web app, rebuilt from the contents of a web app JSON file
+def WebAppFileFromJSON(JSONText):
+  WebAppRows = [WebAppHeader()]
+  for Names, Points in json.loads(JSONText)["Elements"]:
+    WebAppRows.append("".join(Name+"," for Name in Names)+","*(MaxSubscripts+1-len(Names))+WebAppScheduleData([tuple(Point) for Point in Points]))
+  return "".join(WebAppRows)
+
+# Returns the rows of the .csv files formatted for use by Vensim and by the web app, and of the web app JSON files,
+# for each schedule file in Schedules, as three dictionaries of lists of rows by schedule number.  (Each JSON row
+# holds one policy element, and the rows are separated by commas when the file is written.)  We go through the policy
+# elements once, adding each element's row to every schedule file, using the text of the implementation fractions in
+# FractionText (one entry per schedule file in Schedules, policy element and year).  The web app rows only depend on
+# the ordered pairs, so each distinct schedule is converted to text once.
+def ScheduleFileRows(ScheduleIndex, FractionText, Schedules):
+  VensimRows = {}
+  WebAppRows = {}
+  WebAppJSONRows = {}
+  for Schedule in Schedules:
+    VensimRows[Schedule] = [PolicyAndSubscriptHeaders()+",".join(str(Year) for Year in range(FirstYear,FinalYear+1))+"\n"]
+    WebAppRows[Schedule] = [WebAppHeader()]
+    WebAppJSONRows[Schedule] = []
+
+  WebAppData = {}
+  WebAppJSONData = {}
+  for ElementNum, PolicyElement in enumerate(PolicyElements):
+    PolicyAndSubscripts = PolicyAndSubscriptNames(PolicyElement)
     if type(PolicyElement[0]) is str:
-      f.write(PolicyElement[0]+" X\n")
-    # Otherwise, write the policy name and subscripts with " X " as delimiter (and no trailing " X")
+      JSONNames = json.dumps([PolicyElement[0]], separators=(",",":"))
     else:
-      f.write(" X ".join(PolicyElement[0])+"\n")
+      JSONNames = json.dumps(list(PolicyElement[0]), separators=(",",":"))
+    for ScheduleNum, Schedule in enumerate(Schedules):
+      ActiveSchedule = ScheduleIndex[ElementNum][Schedule]
+      VensimRows[Schedule].append(PolicyAndSubscripts+",".join(FractionText[ScheduleNum,ElementNum])+"\n")
+      if ActiveSchedule not in WebAppData:
+        WebAppData[ActiveSchedule] = WebAppScheduleData(ActiveSchedule)
+        WebAppJSONData[ActiveSchedule] = WebAppJSONPoints(ActiveSchedule)
+      WebAppRows[Schedule].append(PolicyAndSubscripts+WebAppData[ActiveSchedule])
+      WebAppJSONRows[Schedule].append("["+JSONNames+","+WebAppJSONData[ActiveSchedule]+"]")
+  return VensimRows, WebAppRows, WebAppJSONRows
+
+# Returns the contents of the Policy Elements file
+def PolicyElementsFileText():
+  return "Policy Element Subscript\n"+"".join(PolicyElementSubscript(PolicyElement[0])+"\n" for PolicyElement in PolicyElements)
+
+# Returns a short fingerprint of some text.  Texts with the same fingerprint are treated as identical.
+def TextFingerprint(Text):
+  return hashlib.sha256(Text.encode("utf-8")).hexdigest()[:16]
+
+# Returns the fingerprint of the contents of a file, or an empty string if the file does not exist
+def FileFingerprint(FileName):
+  if not os.path.exists(FileName):
+    return ""
+  ExistingFile = open(FileName, 'r')
+  Fingerprint = TextFingerprint(ExistingFile.read())
+  ExistingFile.close()
+  return Fingerprint
+
+# Writes Text to a file, unless the file already contains exactly that text.  Returns True if the file was written.
+# If the file is a hard link shared with other files, it is removed first, so the other files are not changed.
+def WriteFileIfChanged(FileName, Text):
+  if os.path.exists(FileName):
+    ExistingFile = open(FileName, 'r')
+    ExistingText = ExistingFile.read()
+    ExistingFile.close()
+    if ExistingText == Text:
+      return False
+    if os.stat(FileName).st_nlink > 1:
+      os.remove(FileName)
+  NewFile = open(FileName, 'w')
+  NewFile.write(Text)
+  NewFile.close()
+  return True
+
+# Makes FileName a hard link to SourceFileName, unless it already is one.  Returns True if the link was made.  If
+# the link cannot be made (for example, on a file system without hard links), Text is written to the file instead.
+def LinkFileIfChanged(FileName, SourceFileName, Text):
+  if os.path.exists(FileName):
+    if os.path.samefile(FileName, SourceFileName):
+      return False
+    os.remove(FileName)
+  try:
+    os.link(SourceFileName, FileName)
+  except OSError:
+    return WriteFileIfChanged(FileName, Text)
+  return True
+
+# Returns the names of the files of a schedule file: the .csv files for Vensim and for the web app, and the web app
+# JSON file if WriteWebAppJSON is True
+def ScheduleFileNames(Schedule):
+  if WriteWebAppJSON:
+    return "FoPITY-"+str(Schedule)+".csv", "FoPITY-"+str(Schedule)+"-WebApp.csv", "FoPITY-"+str(Schedule)+"-WebApp.json"
+  return "FoPITY-"+str(Schedule)+".csv", "FoPITY-"+str(Schedule)+"-WebApp.csv"
+
+# Returns a dictionary of the fingerprints of a policy element's data (its names and its schedule) in each schedule
+# file, by schedule number.  Most policy elements use their default schedule in several schedule files, so each
+# distinct schedule is only fingerprinted once.
+def ElementFingerprints(PolicyElement, ElementSchedules):
+  DistinctFingerprints = {}
+  for ActiveSchedule in ElementSchedules.values():
+    if id(ActiveSchedule) not in DistinctFingerprints:
+      DistinctFingerprints[id(ActiveSchedule)] = TextFingerprint(repr((PolicyElement[0], ActiveSchedule)))
+  return {Schedule: DistinctFingerprints[id(ActiveSchedule)] for Schedule, ActiveSchedule in ElementSchedules.items()}
+
+# Returns the fingerprints of a schedule file, as a list of (name, fingerprint) pairs: one for the global constants
+# that affect the .csv files or how they are written, one for each policy element (from ElementFingerprints()), and
+# one for each of the schedule file's files (see ScheduleFileNames()) as they are now.
+def ScheduleFingerprints(FingerprintIndex, Schedule):
+  Fingerprints = [("Global Constants", TextFingerprint(repr((FirstYear, FinalYear, MaxSubscripts, RoundingDigits, DuplicateScheduleFiles))))]
+  for ElementNum, PolicyElement in enumerate(PolicyElements):
+    Fingerprints.append((PolicyElementSubscript(PolicyElement[0]), FingerprintIndex[ElementNum][Schedule]))
+  for FileName in ScheduleFileNames(Schedule):
+    Fingerprints.append((FileName, FileFingerprint(FileName)))
+  return Fingerprints
+
+# Returns the fingerprints stored in the FingerprintsFileName, as a dictionary of lists of (name, fingerprint) pairs
+# by schedule number.  Each line holds a schedule number, a name and a fingerprint, separated by tabs.
+def ReadFingerprintsFile():
+  StoredFingerprints = {}
+  if os.path.exists(FingerprintsFileName):
+    FingerprintsFile = open(FingerprintsFileName, 'r')
+    for Line in FingerprintsFile:
+      Schedule, Name, Fingerprint = Line.rstrip("\n").split("\t")
+      StoredFingerprints.setdefault(int(Schedule), []).append((Name, Fingerprint))
+    FingerprintsFile.close()
+  return StoredFingerprints
  
+# Check the schedules file for errors (see ScheduleValidation.py).  If any are found, they are written to the error
+# log, with the line numbers of the rows involved, and to a JSON report.  Returns 1 if any errors were found.
 def CheckForScheduleErrors():
-  ErrorFound = 0
+  Problems = ScheduleValidation.ValidateSchedules(ScheduleDataFileName, FirstYear, FinalYear)
+  if not Problems:
+    if os.path.exists(ValidationReportFileName):
+      os.remove(ValidationReportFileName)
+    return(0)
 
   f = open("FoPITY-Error-Log.txt", 'w')
-
-  for PolicyElement in PolicyElements:
-    for ScheduleNum in range(1,len(PolicyElement)):
-      # Extract the ordered pairs (all elements after the first) for the schedule we are checking.
-      ScheduleToCheck = PolicyElement[ScheduleNum][1:]
-
-      # Create lists of all years and implementation fractions used in the schedule we are checking.
-      Years = []
-      ImplementationFractions = []
-      for OrderedPair in ScheduleToCheck:
-        Years.append(OrderedPair[0])
-        ImplementationFractions.append(OrderedPair[1])
-
-      # A set eliminates duplicate values, so we compare the length of the list to its length after
-      # converting it to a set.  The lengths are unequal if there are duplicate values in the list.
-      if len(set(Years)) != len(Years):
-        f.write("Duplicate year(s) found in Schedule "+str(ScheduleNum)+" of Policy Element: "+str(PolicyElement[0])+"\n") 
-        ErrorFound = 1
-      
-      # Ensure all years are between FirstYear and FinalYear inclusive.
-      if any(Year < FirstYear or Year > FinalYear for Year in Years):
-        f.write("Year(s) prior to FirstYear or after FinalYear found in Schedule "+str(ScheduleNum)+" of Policy Element: "+str(PolicyElement[0])+"\n")
-        ErrorFound = 1
-
-      # Ensure all years are in ascending order.
-      if (Years != sorted(Years)):
-        f.write("Year(s) are not in ascending order in Schedule "+str(ScheduleNum)+" of Policy Element: "+str(PolicyElement[0])+"\n")
-        ErrorFound = 1
-      
-      # Ensure all years are integers.
-      if any(not isinstance(Year, int) for Year in Years):
-        f.write("Non-integer year(s) found in Schedule "+str(ScheduleNum)+" of Policy Element: "+str(PolicyElement[0])+"\n")
-        ErrorFound = 1
-      
-      # Ensure all implementation fractions are between 0 and 1 inclusive.
-      if any(ImplementationFraction < 0 or ImplementationFraction > 1 for ImplementationFraction in ImplementationFractions):
-        f.write("Out-of-bounds implementation fraction(s) found in Schedule "+str(ScheduleNum)+" of Policy Element: "+str(PolicyElement[0])+"\n")
-        ErrorFound = 1   
-
+  for Problem in Problems:
+    f.write(Problem["Message"]+" (line(s) "+", ".join(str(Line) for Line in Problem["Lines"])+" of "+ScheduleDataFileName+")\n")
   f.close()
-  return(ErrorFound)
+  ScheduleValidation.WriteValidationReport(ValidationReportFileName, ScheduleDataFileName, Problems)
+  return(1)
 
 
 # Main Program
@@ -7861,32 +343,61 @@ def CheckForScheduleErrors():
 
 if CheckForScheduleErrors() == 0:
 
-  import os
   if os.path.exists("FoPITY-Error-Log.txt"):
     os.remove("FoPITY-Error-Log.txt")
 
+  PolicyElements = PolicyScheduleData.ReadPolicyElements(ScheduleDataFileName)
+
+  # Find the schedule each policy element uses in each schedule file, and find the schedule files that need to be
+  # regenerated (every schedule file, unless IncrementalRegeneration is True)
+  ScheduleIndex = [ResolveSchedules(PolicyElement) for PolicyElement in PolicyElements]
+  FingerprintIndex = [ElementFingerprints(PolicyElement, ElementSchedules) for PolicyElement, ElementSchedules in zip(PolicyElements, ScheduleIndex)]
+  Fingerprints = {Schedule: ScheduleFingerprints(FingerprintIndex, Schedule) for Schedule in range(1,MaxSchedules+1)}
+  if IncrementalRegeneration:
+    StoredFingerprints = ReadFingerprintsFile()
+  else:
+    StoredFingerprints = {}
+  ChangedSchedules = [Schedule for Schedule in range(1,MaxSchedules+1) if Fingerprints[Schedule] != StoredFingerprints.get(Schedule)]
+
+  # Find the first schedule file with the same policy element data as each schedule file (which may be itself)
+  FileCount = len(ScheduleFileNames(1))
+  DistinctScheduleData = {}
+  SourceSchedules = {}
   for Schedule in range(1,MaxSchedules+1):
-
-    # Begin writing the .csv file for Vensim
-    f = open("FoPITY-"+str(Schedule)+".csv", 'w')
-
-    WriteVensimFile()
-
-    # Done writing the .csv file for Vensim
-    f.close()
-
-    # Begin writing the .csv file for the web app
-    f = open("FoPITY-"+str(Schedule)+"-WebApp.csv", 'w')
-    
-    WriteWebAppFile()
-
-    # Done writing the .csv file for the web app
-    f.close()
+    ScheduleData = tuple(Fingerprint for Name, Fingerprint in Fingerprints[Schedule][:-FileCount])
+    SourceSchedules[Schedule] = DistinctScheduleData.setdefault(ScheduleData, Schedule)
+
+  # Calculate and convert to text the implementation fractions for the distinct schedule files among the changed
+  # schedule files at once, then write each .csv file whose contents have changed, updating its fingerprint
+  FilesWritten = 0
+  if ChangedSchedules:
+    DistinctSchedules = sorted(set(SourceSchedules[Schedule] for Schedule in ChangedSchedules))
+    FractionText = FormatImplementationFractions(CalculateImplementationFractions(ScheduleIndex, DistinctSchedules))
+    VensimRows, WebAppRows, WebAppJSONRows = ScheduleFileRows(ScheduleIndex, FractionText, DistinctSchedules)
+    FileTexts = {}
+    for Schedule in DistinctSchedules:
+      FileTexts[Schedule] = ("".join(VensimRows[Schedule]), "".join(WebAppRows[Schedule]), WebAppJSONHeader()+",\n".join(WebAppJSONRows[Schedule])+WebAppJSONFooter())[:FileCount]
+      # Ensure the web app JSON file holds exactly the data of the web app .csv file
+      if WriteWebAppJSON and WebAppFileFromJSON(FileTexts[Schedule][2]) != FileTexts[Schedule][1]:
+        sys.exit("Error: The web app .csv file rebuilt from "+ScheduleFileNames(Schedule)[2]+" does not match "+ScheduleFileNames(Schedule)[1]+".")
+
+    for Schedule in ChangedSchedules:
+      SourceSchedule = SourceSchedules[Schedule]
+      for FileName, SourceFileName, Text in zip(ScheduleFileNames(Schedule), ScheduleFileNames(SourceSchedule), FileTexts[SourceSchedule]):
+        if DuplicateScheduleFiles == "Hardlink" and SourceSchedule != Schedule:
+          FileChanged = LinkFileIfChanged(FileName, SourceFileName, Text)
+        else:
+          FileChanged = WriteFileIfChanged(FileName, Text)
+        if FileChanged:
+          FilesWritten += 1
+      Fingerprints[Schedule] = Fingerprints[Schedule][:-FileCount]+[(FileName, FileFingerprint(FileName)) for FileName in ScheduleFileNames(Schedule)]
+  print("Regenerated "+str(len(ChangedSchedules))+" of "+str(MaxSchedules)+" schedule files and wrote "+str(FilesWritten)+" files")
+
+  if IncrementalRegeneration:
+    WriteFileIfChanged(FingerprintsFileName, "".join(str(Schedule)+"\t"+Name+"\t"+Fingerprint+"\n" for Schedule in Fingerprints for Name, Fingerprint in Fingerprints[Schedule]))
+
+  # Write schedule aliases file
+  WriteFileIfChanged(AliasesFileName, "Schedule,Same Contents As Schedule\n"+"".join(str(Schedule)+","+str(SourceSchedule)+"\n" for Schedule, SourceSchedule in SourceSchedules.items()))
 
   # Write policy elements file
-  f = open("FoPITY-policy-elements.csv",'w')
-
-  WritePolicyElementsFile()
-
-  # Done writing the policy elements file
-  f.close()
+  WriteFileIfChanged("FoPITY-policy-elements.csv", PolicyElementsFileText())
@@ -0,0 +1,126 @@
+# PolicyScheduleData.py
+#
+# This is a Python module used by FractionOfPolicyImplementedThisYear.py, EditScheduleTool.py,
+# ScheduleValidation.py and DiffSchedules.py to read and write the policy implementation schedules
+# file, and it sets the years covered by the schedule files.  It is not meant to be run on its own.
+#
+# The schedules file is a .csv file with one row per ordered pair.  Each row holds the policy name,
+# its subscripts (one column per subscript, left empty if unused), the schedule label (such as
+# "Schedule 1"), the year and the implementation fraction.  For example:
+#
+#   Policy,Subscript 1,Subscript 2,Subscript 3,Schedule,Year,Implementation Fraction
+#   trans fuel economy standards,passenger,LDVs,,Schedule 1,2021,0
+#   trans fuel economy standards,passenger,LDVs,,Schedule 1,2024,0
+#   trans fuel economy standards,passenger,LDVs,,Schedule 1,2050,1
+#
+# The rows of a policy element must be kept together, as must the rows of each of its schedules.
+# The order of the policy elements, the order of each element's schedules (the first listed schedule
+# is its default schedule), and the order of the ordered pairs are kept as they appear in the file.
+# Years and implementation fractions are kept as written (apart from any spaces around them): a value
+# written without a decimal point is read as an integer.
+#
+# The module also holds the functions that read schedule labels and name policy elements, which the
+# other scripts share so that they all read the schedules the same way.
+#
+# The schedules are returned in the structure used by FractionOfPolicyImplementedThisYear.py: a tuple
+# of policy elements, each a tuple holding the policy and subscript names (a tuple, or just the policy
+# name if it has no subscripts) followed by one tuple per schedule, holding the schedule label followed
+# by the ordered pairs.
+
+import csv
+import io
+
+
+# The years covered by the schedule files.  FractionOfPolicyImplementedThisYear.py, ValidateSchedules.py and
+# DiffSchedules.py all use these years, so they only need to be changed here.
+FirstYear = 2021 # Update this based on the first simulated year of the model run.
+FinalYear = 2100 # This should be the final year supported by EPS.mdl (i.e., 2100), not the final year actually used in a given region.
+
+ScheduleColumns = ("Schedule","Year","Implementation Fraction")
+
+
+# Returns a number written in the schedules file, as an integer if it has no decimal point or exponent.  Raises
+# ValueError if the text is not a number.
+def ReadNumber(Text):
+  Text = Text.strip()
+  if Text.lstrip("-").isdigit():
+    return int(Text)
+  return float(Text)
+
+# Returns the schedule number in a "Schedule X" label, using all of its digits (so "Schedule 12" is schedule 12), or
+# 0 if the label has no digits
+def ScheduleNumber(ScheduleLabel):
+  Digits = "".join(filter(str.isdigit, ScheduleLabel))
+  if not Digits:
+    return 0
+  return int(Digits)
+
+# Returns the name of a policy element as used in the Vensim subscript, from its policy and subscript names (a
+# tuple, or just the policy name if it has no subscripts)
+def PolicyElementSubscript(Names):
+  # If the policy has no subscripts, just write the policy name followed by " X".
+  if type(Names) is str:
+    return Names+" X"
+  # Otherwise, write the policy name and subscripts with " X " as delimiter (and no trailing " X")
+  return " X ".join(Names)
+
+# Returns the policy elements in the rows of a schedules file (read with csv.reader)
+def PolicyElementsFromRows(Rows):
+  NameColumns = len(next(Rows))-len(ScheduleColumns)
+
+  PolicyElements = []
+  Names = None
+  Label = None
+  for Row in Rows:
+    # Skip blank rows
+    if not any(Row):
+      continue
+    if Row[:NameColumns] != Names:
+      Names = Row[:NameColumns]
+      Label = None
+      ElementNames = tuple(Name for Name in Names if Name)
+      PolicyElements.append([ElementNames[0] if len(ElementNames) == 1 else ElementNames])
+    if Row[NameColumns] != Label:
+      Label = Row[NameColumns]
+      PolicyElements[-1].append([Label])
+    PolicyElements[-1][-1].append((ReadNumber(Row[NameColumns+1]),ReadNumber(Row[NameColumns+2])))
+
+  return tuple((PolicyElement[0],)+tuple(tuple(Schedule) for Schedule in PolicyElement[1:]) for PolicyElement in PolicyElements)
+
+# Reads the schedules file, returning the policy elements
+def ReadPolicyElements(FileName):
+  ScheduleFile = open(FileName, 'r', newline='')
+  PolicyElements = PolicyElementsFromRows(csv.reader(ScheduleFile))
+  ScheduleFile.close()
+  return PolicyElements
+
+# Returns the policy elements in the text of a schedules file (for example, an older version of the file read from git)
+def ReadPolicyElementsText(Text):
+  return PolicyElementsFromRows(csv.reader(io.StringIO(Text, newline='')))
+
+# Writes the policy elements to an open schedules file, with MaxSubscripts subscript columns
+def WritePolicyElementsTo(ScheduleFile, PolicyElements, MaxSubscripts):
+  Rows = csv.writer(ScheduleFile, lineterminator='\n')
+  Rows.writerow(("Policy",)+tuple("Subscript "+str(Subscript) for Subscript in range(1,MaxSubscripts+1))+ScheduleColumns)
+  for PolicyElement in PolicyElements:
+    # If the policy has no subscripts, the policy name is a string rather than a tuple
+    if type(PolicyElement[0]) is str:
+      Names = (PolicyElement[0],)
+    else:
+      Names = tuple(PolicyElement[0])
+    Names = Names+("",)*(MaxSubscripts+1-len(Names))
+    for Schedule in PolicyElement[1:]:
+      for OrderedPair in Schedule[1:]:
+        Rows.writerow(Names+(Schedule[0],repr(OrderedPair[0]),repr(OrderedPair[1])))
+
+# Writes the policy elements to the schedules file, with MaxSubscripts subscript columns
+def WritePolicyElements(FileName, PolicyElements, MaxSubscripts):
+  ScheduleFile = open(FileName, 'w', newline='')
+  WritePolicyElementsTo(ScheduleFile, PolicyElements, MaxSubscripts)
+  ScheduleFile.close()
+
+# Returns the text of the schedules file that would hold the policy elements, with MaxSubscripts subscript columns
+def PolicyElementsText(PolicyElements, MaxSubscripts):
+  ScheduleFile = io.StringIO(newline='')
+  WritePolicyElementsTo(ScheduleFile, PolicyElements, MaxSubscripts)
+  return ScheduleFile.getvalue()
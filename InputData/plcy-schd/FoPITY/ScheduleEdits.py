@@ -0,0 +1,179 @@
+# ScheduleEdits.py
+#
+# This is a Python module used by EditScheduleTool.py to edit the policy implementation schedules.
+# It is not meant to be run on its own, but its ApplyEdits() function may be imported by other
+# scripts to make many edits to the schedules at once.
+#
+# Each edit is a tuple of (Operation, Schedule, Value, Year, Element), where the last items may be
+# left out if they are not needed:
+# - ("delete", Schedule) removes the schedule.
+# - ("copy", Schedule, NewSchedule) copies the schedule to a new schedule number, unless a schedule
+#   already uses that number.  ("copy overwrite", Schedule, NewSchedule) replaces any schedule using
+#   that number.
+# - ("rename", Schedule, NewSchedule) changes the number of the schedule.
+# - ("scale", Schedule, Factor) multiplies every implementation fraction of the schedule by Factor.
+# - ("shift years", Schedule, Years) adds Years (which may be negative) to every year of the schedule.
+# - ("set point", Schedule, Fraction, Year) sets the implementation fraction of the schedule in Year,
+#   adding an ordered pair if the schedule does not have one for that year.  A policy element that
+#   does not define the schedule is given a copy of its default (first listed) schedule first.
+# Each edit applies to every policy element, unless Element is given, in which case it applies only
+# to the policy element with that Vensim subscript name (such as "trans fuel economy standards X
+# passenger X LDVs") and to those whose names begin with it followed by " X " (so "trans fuel economy
+# standards" applies to all of that policy's elements).  A policy element without subscripts may be
+# given with or without its trailing " X" (such as "trans LDVs feebate").  Schedules that do not define the schedule
+# number being edited are left unchanged (except by "set point"), since they fall back to their
+# default schedule.
+#
+# The edits are applied in order to a copy of the schedules.  If any edit cannot be made, or if the
+# edited schedules are not valid (by the same checks as FractionOfPolicyImplementedThisYear.py makes, see
+# ScheduleValidation.py), ApplyEdits() returns the errors found and no edits are kept.
+
+import csv
+
+import PolicyScheduleData
+import ScheduleValidation
+from PolicyScheduleData import ScheduleNumber, PolicyElementSubscript
+
+
+Operations = ("delete","copy","copy overwrite","rename","scale","shift years","set point")
+
+
+# Returns True if an edit with the given Element applies to the policy element with the given names.  A policy
+# element without subscripts (such as "trans LDVs feebate X") may be selected with or without its trailing " X".
+def ElementSelected(Names, Element):
+  if Element is None:
+    return True
+  Subscript = PolicyElementSubscript(Names)
+  return Subscript == Element or Subscript == Element+" X" or Subscript.startswith(Element+" X ")
+
+# Returns a number rounded to remove the small errors of floating-point arithmetic, as an integer if it is a whole
+# number and the original values were integers
+def CleanNumber(Number, OriginalNumber):
+  if type(OriginalNumber) is int and Number == int(Number):
+    return int(Number)
+  return round(Number, 10)
+
+# Applies one edit to the schedules of one policy element (a list of [label, list of ordered pairs] items), adding
+# a description of any problem to Errors.  Returns True if the element defines the schedule being edited.
+def EditElementSchedules(Names, Schedules, Operation, Schedule, Value, Year, Errors):
+  Numbers = [ScheduleNumber(Label) for Label, OrderedPairs in Schedules]
+  if 0 in Numbers:
+    Errors.append("Schedule label without a schedule number (\""+Schedules[Numbers.index(0)][0]+"\") found in Policy Element: "+PolicyElementSubscript(Names))
+    return True
+  if Operation == "set point" and Schedule not in Numbers:
+    Schedules.append(["Schedule "+str(Schedule), list(Schedules[0][1])])
+    Numbers.append(Schedule)
+  if Schedule not in Numbers:
+    if Operation == "copy overwrite" and Value in Numbers:
+      del Schedules[Numbers.index(Value)]
+    return False
+  Position = Numbers.index(Schedule)
+  Label, OrderedPairs = Schedules[Position]
+
+  if Operation == "delete":
+    del Schedules[Position]
+  elif Operation in ("copy","copy overwrite","rename"):
+    if Value in Numbers and Value != Schedule:
+      if Operation != "copy overwrite":
+        Errors.append("Schedule "+str(Value)+" already exists in Policy Element: "+PolicyElementSubscript(Names))
+        return True
+      del Schedules[Numbers.index(Value)]
+      if Numbers.index(Value) < Position:
+        Position -= 1
+    if Operation == "rename":
+      Schedules[Position] = ["Schedule "+str(Value), OrderedPairs]
+    elif Value != Schedule:
+      Schedules.insert(Position+1, ["Schedule "+str(Value), list(OrderedPairs)])
+  elif Operation == "scale":
+    Schedules[Position] = [Label, [(PairYear, CleanNumber(Fraction*Value, Fraction)) for PairYear, Fraction in OrderedPairs]]
+  elif Operation == "shift years":
+    Schedules[Position] = [Label, [(PairYear+Value, Fraction) for PairYear, Fraction in OrderedPairs]]
+  elif Operation == "set point":
+    NewPairs = [(PairYear, Fraction) for PairYear, Fraction in OrderedPairs if PairYear != Year]+[(Year, Value)]
+    Schedules[Position] = [Label, sorted(NewPairs, key=lambda OrderedPair: OrderedPair[0])]
+  return True
+
+# Returns a list of problems with an edit's settings, before it is applied
+def CheckEdit(Operation, Schedule, Value, Year):
+  Errors = []
+  if Operation not in Operations:
+    Errors.append("Unknown operation \""+str(Operation)+"\".  The operation must be one of: "+", ".join(Operations)+".")
+    return Errors
+  if type(Schedule) is not int or Schedule < 1:
+    Errors.append("The schedule number must be a positive integer.")
+  if Operation in ("copy","copy overwrite","rename") and (type(Value) is not int or Value < 1):
+    Errors.append("The new schedule number must be a positive integer.")
+  if Operation in ("scale","set point") and type(Value) not in (int, float):
+    Errors.append("The "+("factor" if Operation == "scale" else "implementation fraction")+" must be a number.")
+  if Operation == "shift years" and type(Value) is not int:
+    Errors.append("The number of years must be an integer.")
+  if Operation == "set point" and type(Year) is not int:
+    Errors.append("The year must be an integer.")
+  return Errors
+
+# Returns a list of problems with the edited schedules that would prevent them from being used.  A policy element
+# or schedule left empty would disappear from the schedules file, so it is reported here.  The edited schedules are
+# then checked exactly as FractionOfPolicyImplementedThisYear.py checks the schedules file (see
+# ScheduleValidation.py), using the years set in PolicyScheduleData.py, so an edit that moves a year out of range
+# or after FirstYear, repeats or reorders years, or sets a fraction outside 0 to 1 is rejected here.
+def CheckEditedElements(EditedElements):
+  Errors = []
+  for Names, Schedules in EditedElements:
+    if not Schedules:
+      Errors.append("No schedules remain in Policy Element: "+PolicyElementSubscript(Names))
+    for Label, OrderedPairs in Schedules:
+      if not OrderedPairs:
+        Errors.append(Label+" has no ordered pairs in Policy Element: "+PolicyElementSubscript(Names))
+  if Errors:
+    return Errors
+
+  MaxSubscripts = max([1]+[len(Names)-1 for Names, Schedules in EditedElements if type(Names) is not str])
+  EditedText = PolicyScheduleData.PolicyElementsText([(Names,)+tuple((Label,)+tuple(OrderedPairs) for Label, OrderedPairs in Schedules) for Names, Schedules in EditedElements], MaxSubscripts)
+  for Problem in ScheduleValidation.ValidateSchedulesText(EditedText, PolicyScheduleData.FirstYear, PolicyScheduleData.FinalYear):
+    Errors.append(Problem["Message"]+" (after the edits)")
+  return Errors
+
+# Applies a list of edits to the policy elements (as returned by PolicyScheduleData.ReadPolicyElements()).  Returns
+# the edited policy elements and a list of errors.  If there are any errors, the edited policy elements are None.
+def ApplyEdits(PolicyElements, Edits):
+  EditedElements = [[PolicyElement[0], [[Schedule[0], list(Schedule[1:])] for Schedule in PolicyElement[1:]]] for PolicyElement in PolicyElements]
+  Errors = []
+
+  for EditNum, Edit in enumerate(Edits, 1):
+    Operation, Schedule, Value, Year, Element = (tuple(Edit)+(None,)*5)[:5]
+    EditErrors = CheckEdit(Operation, Schedule, Value, Year)
+    if not EditErrors:
+      ElementFound = False
+      ScheduleFound = False
+      for Names, Schedules in EditedElements:
+        if ElementSelected(Names, Element):
+          ElementFound = True
+          if EditElementSchedules(Names, Schedules, Operation, Schedule, Value, Year, EditErrors):
+            ScheduleFound = True
+      if Element is not None and not ElementFound:
+        EditErrors.append("No policy element matches \""+Element+"\".")
+      elif not ScheduleFound:
+        EditErrors.append("Schedule "+str(Schedule)+" not found.")
+    Errors += ["Edit "+str(EditNum)+" "+repr(tuple(Edit))+": "+EditError for EditError in EditErrors]
+
+  if not Errors:
+    Errors = CheckEditedElements(EditedElements)
+  if Errors:
+    return None, Errors
+  return tuple((Names,)+tuple((Label,)+tuple(OrderedPairs) for Label, OrderedPairs in Schedules) for Names, Schedules in EditedElements), []
+
+# Reads a list of edits from a .csv file with the columns Operation, Schedule, Value, Year and Element (with a
+# header row).  Empty cells are left out of the edit.
+def ReadEditsFile(FileName):
+  EditsFile = open(FileName, 'r', newline='')
+  Rows = csv.reader(EditsFile)
+  next(Rows)
+  Edits = []
+  for Row in Rows:
+    if not any(Row):
+      continue
+    Row = (Row+[""]*5)[:5]
+    Edit = [Row[0].strip()]+[PolicyScheduleData.ReadNumber(Cell.strip()) if Cell.strip() else None for Cell in Row[1:4]]+[Row[4].strip() or None]
+    Edits.append(tuple(Edit))
+  EditsFile.close()
+  return Edits
@@ -0,0 +1,132 @@
+# ScheduleValidation.py
+#
+# This is a Python module used by FractionOfPolicyImplementedThisYear.py, ValidateSchedules.py and
+# ScheduleEdits.py to check the policy implementation schedules file (see PolicyScheduleData.py) for
+# errors.  It is not meant to be run on its own.
+#
+# Rather than checking one schedule at a time, we read every row of the schedules file into arrays
+# (one entry per ordered pair, holding its policy element, schedule, year, implementation fraction
+# and line number) and check all of them at once.  Each problem found is described by a dictionary
+# holding the kind of check that failed, the policy element (by its Vensim subscript name), the
+# schedule label, the line numbers of the rows involved, and a message, so the problems can be
+# written to a JSON report for other tools as well as to an error log.
+#
+# This module requires NumPy.
+
+import csv
+import io
+import json
+
+import numpy as np
+
+from PolicyScheduleData import ReadNumber, ScheduleNumber
+
+
+# Returns a number written in the schedules file, read as PolicyScheduleData.py reads it, or NaN if the text is not
+# a number
+def ReadNumberOrNaN(Text):
+  try:
+    return ReadNumber(Text)
+  except ValueError:
+    return np.nan
+
+# Checks the rows of a schedules file (read with csv.reader), returning a list of problems (an empty list if there
+# are none)
+def ValidateScheduleRows(Rows, FirstYear, FinalYear):
+  NameColumns = len(next(Rows))-3
+  Elements, Labels, YearTexts, FractionTexts, Lines = [], [], [], [], []
+  for Row in Rows:
+    # Skip blank rows
+    if not any(Row):
+      continue
+    Row = Row+[""]*(NameColumns+3-len(Row))
+    Elements.append(" X ".join(Name for Name in Row[:NameColumns] if Name)+(" X" if not Row[1] else ""))
+    Labels.append(Row[NameColumns])
+    YearTexts.append(Row[NameColumns+1])
+    FractionTexts.append(Row[NameColumns+2])
+    Lines.append(Rows.line_num)
+
+  Elements = np.array(Elements, dtype=object)
+  Labels = np.array(Labels, dtype=object)
+  Lines = np.array(Lines)
+  YearNumbers = [ReadNumberOrNaN(Text) for Text in YearTexts]
+  Years = np.array(YearNumbers, dtype=float)
+  Fractions = np.array([ReadNumberOrNaN(Text) for Text in FractionTexts], dtype=float)
+  # A year must be read as an integer, or the schedule files would list it with a decimal point
+  YearIsInteger = np.array([type(Year) is int for Year in YearNumbers])
+  DistinctLabelNumbers = {Label: ScheduleNumber(Label) for Label in set(Labels)}
+  LabelNumbers = np.array([DistinctLabelNumbers[Label] for Label in Labels], dtype=int)
+
+  # The rows of each policy element, and of each of its schedules, are kept together, so a new element or schedule
+  # begins wherever the names or label differ from those of the row before
+  NewElement = np.ones(len(Lines), dtype=bool)
+  NewElement[1:] = Elements[1:] != Elements[:-1]
+  NewSchedule = NewElement.copy()
+  NewSchedule[1:] |= Labels[1:] != Labels[:-1]
+  ElementIds = np.cumsum(NewElement)-1
+  ScheduleIds = np.cumsum(NewSchedule)-1
+  SameScheduleAsPrevious = ~NewSchedule[1:]
+  with np.errstate(invalid='ignore'):
+    YearSteps = Years[1:]-Years[:-1]
+
+  Problems = []
+
+  # Adds one problem for each schedule with rows flagged in Flags, listing the lines of all its flagged rows
+  def AddProblems(Check, Flags, Message):
+    for Position in np.flatnonzero(Flags):
+      if Problems and Problems[-1]["Check"] == Check and Problems[-1].get("ScheduleId") == ScheduleIds[Position]:
+        Problems[-1]["Lines"].append(int(Lines[Position]))
+        continue
+      Problems.append({"Check": Check, "Element": Elements[Position], "Schedule": Labels[Position], "Lines": [int(Lines[Position])], "Message": Message.replace("SCHEDULE", Labels[Position])+" of Policy Element: "+Elements[Position], "ScheduleId": ScheduleIds[Position]})
+
+  with np.errstate(invalid='ignore'):
+    AddProblems("Invalid Schedule Label", NewSchedule & (LabelNumbers == 0), "Schedule label without a schedule number found in SCHEDULE")
+    AddProblems("Not a Number", np.isnan(Years) | np.isnan(Fractions), "Year(s) or implementation fraction(s) that are not numbers found in SCHEDULE")
+    AddProblems("Duplicate Year", np.concatenate(([False], SameScheduleAsPrevious & (YearSteps == 0))), "Duplicate year(s) found in SCHEDULE")
+    AddProblems("Year Out of Range", (Years < FirstYear) | (Years > FinalYear), "Year(s) prior to FirstYear or after FinalYear found in SCHEDULE")
+    AddProblems("Year Out of Order", np.concatenate(([False], SameScheduleAsPrevious & (YearSteps < 0))), "Year(s) are not in ascending order in SCHEDULE")
+    AddProblems("Non-Integer Year", ~np.isnan(Years) & ~YearIsInteger, "Non-integer year(s) found in SCHEDULE")
+    AddProblems("Fraction Out of Bounds", (Fractions < 0) | (Fractions > 1), "Out-of-bounds implementation fraction(s) found in SCHEDULE")
+    AddProblems("First Year After FirstYear", NewSchedule & (Years > FirstYear), "First year after FirstYear found in SCHEDULE")
+
+  # Every policy element must have a Schedule 1
+  HasScheduleOne = np.bincount(ElementIds, weights=(LabelNumbers == 1)) > 0
+  for Position in np.flatnonzero(NewElement)[~HasScheduleOne]:
+    Problems.append({"Check": "Missing Schedule 1", "Element": Elements[Position], "Schedule": None, "Lines": [int(Lines[Position])], "Message": "No Schedule 1 found for Policy Element: "+Elements[Position]})
+
+  # Each policy element, and each schedule number within it, may only be listed once
+  ElementStarts = {}
+  ScheduleStarts = {}
+  for Position in np.flatnonzero(NewSchedule):
+    Element = Elements[Position]
+    if NewElement[Position]:
+      if Element in ElementStarts:
+        Problems.append({"Check": "Duplicate Policy Element", "Element": Element, "Schedule": None, "Lines": [int(Lines[ElementStarts[Element]]), int(Lines[Position])], "Message": "Policy Element listed more than once (the rows of each policy element must be kept together): "+Element})
+      ElementStarts.setdefault(Element, Position)
+    ScheduleKey = (ElementIds[Position], LabelNumbers[Position])
+    if ScheduleKey in ScheduleStarts:
+      Problems.append({"Check": "Duplicate Schedule", "Element": Element, "Schedule": Labels[Position], "Lines": [int(Lines[ScheduleStarts[ScheduleKey]]), int(Lines[Position])], "Message": "Schedule "+str(LabelNumbers[Position])+" listed more than once (the rows of each schedule must be kept together) in Policy Element: "+Element})
+    ScheduleStarts.setdefault(ScheduleKey, Position)
+
+  Problems.sort(key=lambda Problem: Problem["Lines"][0])
+  for Problem in Problems:
+    Problem.pop("ScheduleId", None)
+  return Problems
+
+# Checks the schedules file, returning a list of problems (an empty list if there are none)
+def ValidateSchedules(FileName, FirstYear, FinalYear):
+  ScheduleFile = open(FileName, 'r', newline='')
+  Problems = ValidateScheduleRows(csv.reader(ScheduleFile), FirstYear, FinalYear)
+  ScheduleFile.close()
+  return Problems
+
+# Checks the text of a schedules file (for example, edited schedules not yet written), returning a list of problems
+def ValidateSchedulesText(Text, FirstYear, FinalYear):
+  return ValidateScheduleRows(csv.reader(io.StringIO(Text, newline='')), FirstYear, FinalYear)
+
+# Writes the problems found to a JSON report
+def WriteValidationReport(ReportFileName, FileName, Problems):
+  ReportFile = open(ReportFileName, 'w')
+  json.dump({"File": FileName, "ProblemCount": len(Problems), "Problems": Problems}, ReportFile, indent="\t")
+  ReportFile.write("\n")
+  ReportFile.close()
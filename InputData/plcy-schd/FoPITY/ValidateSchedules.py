@@ -0,0 +1,29 @@
+# ValidateSchedules.py
+#
+# This script checks the policy implementation schedules file for errors (see ScheduleValidation.py)
+# without generating any schedule files, for example as part of an automated check of a change to
+# the schedules.  It writes a JSON report of the problems found (which is empty if there are none),
+# and it exits with an error if any problems are found.
+
+
+# File Names
+# ----------
+# The schedules are checked against the years set in PolicyScheduleData.py.
+ScheduleDataFileName = "PolicyImplementationSchedules.csv"
+ValidationReportFileName = "FoPITY-Validation-Report.json"
+
+
+# Main Program
+# ------------
+
+import sys
+
+import ScheduleValidation
+from PolicyScheduleData import FirstYear, FinalYear
+
+Problems = ScheduleValidation.ValidateSchedules(ScheduleDataFileName, FirstYear, FinalYear)
+ScheduleValidation.WriteValidationReport(ValidationReportFileName, ScheduleDataFileName, Problems)
+
+if Problems:
+  sys.exit(str(len(Problems))+" problem(s) found in "+ScheduleDataFileName+".  See "+ValidationReportFileName+".")
+print("No problems found in "+ScheduleDataFileName)
@@ -0,0 +1,320 @@
+# ModelGraph.py
+#
+# This is a Python module used by scripts that need to know how the variables in EPS.mdl depend on
+# each other.  It is not meant to be run on its own, but its LoadModelGraph() function may be
+# imported by other scripts to read the model.
+#
+# LoadModelGraph() reads the equations of a Vensim model (.mdl) file and returns a model graph, a
+# dictionary holding:
+# - "ModelHash", the SHA-256 hash of the model file.
+# - "Variables", a dictionary with an entry for each variable, by name (as first written in the
+#   model), holding the variable's "Kind" (see below), "Units", "UnitsRange" (the range written after
+#   the units, such as "[0,1]", or ""), "Comment", "Group" (the model section holding the variable),
+#   "Supplementary" (True if the variable is marked :SUPPLEMENTARY), "Equations", and "Dependencies"
+#   (the names of the variables used by any of its equations, sorted).  Each equation is a dictionary
+#   holding its "Subscripts" and "Except" subscripts (lists of the subscript names written on the
+#   left side of the equation), "Kind", "Formula" (the text after the equals sign), "Dependencies",
+#   "Functions" (the Vensim functions it calls, such as "INTEG" or "VECTOR ELM MAP") and "Files" (the
+#   files read by any GET DIRECT function).
+# - "Dependents", a dictionary listing the variables whose equations use each variable, by name.
+# - "SubscriptRanges", a dictionary with an entry for each subscript range, by name, holding its
+#   "Elements" (None if they are read from a file), "File" (the file read by GET DIRECT SUBSCRIPT, or
+#   None), "MapsTo" (the ranges it is mapped to) and "EquivalentTo" (the range it is equivalent to, or
+#   None).
+# - "NormalNames", a dictionary of the name of every variable by its normal name (see NormalName()),
+#   so FindVariable() can find a variable however its name is written.
+#
+# The kind of each equation is one of:
+# "Level" (INTEG), "Delay" (a DELAY or SMOOTH function, which keeps its own stocks), "Data" (a data
+# equation, written with ":=" or GET DIRECT DATA), "Lookup" (a lookup table, or GET DIRECT LOOKUPS),
+# "Constant" (only numbers, or GET DIRECT CONSTANTS), "Initial" (INITIAL, calculated once), or
+# "Auxiliary" (everything else).  A variable with equations of several kinds takes the first of its
+# kinds in that order.
+#
+# Parsing EPS.mdl takes a few seconds, so the graph is saved to a cache file (a pickle) next to the
+# model file, along with the hash of the model file.  LoadModelGraph() reads the cache instead of the
+# model whenever the hash of the model file matches, which takes a small fraction of a second.
+#
+# This is a reading of the model's equations, not a full Vensim parser.  Each equation is separated
+# from the next by the "|" that ends its comment, lines ending with "\" are joined to the next line,
+# and the variables an equation uses are found by splitting its formula at operators and brackets
+# and keeping the pieces that are names of variables in the model.  Subscript names and elements
+# written in square brackets are not counted as dependencies.
+
+import hashlib
+import os
+import pickle
+import re
+
+
+# Settings
+# --------
+CacheFileSuffix = "-Graph.pickle" # The cache of EPS.mdl is EPS-Graph.pickle
+ParserVersion = 1 # Increase this when changing how the graph is built, so graphs in existing caches are rebuilt
+
+# The kinds of equations, in the order used to choose the kind of a variable with several equations
+Kinds = ("Level","Delay","Data","Lookup","Constant","Initial","Auxiliary")
+
+# The functions that mark an equation as a delay
+DelayFunctions = ("DELAY1","DELAY1I","DELAY3","DELAY3I","DELAY FIXED","DELAY N","DELAY CONVEYOR","SMOOTH","SMOOTHI","SMOOTH3","SMOOTH3I","SMOOTH N","TREND","FORECAST","NPV")
+
+# The end of the equations in a .mdl file, after which Vensim stores the sketches of the model
+SketchMarker = "\\\\\\---///"
+
+
+# Reading Equations
+# -----------------
+
+# Returns a variable name as Vensim compares names: without quotes, ignoring case, and treating
+# underscores and runs of spaces as single spaces
+def NormalName(Name):
+	return " ".join(Name.replace('"', "").replace("_", " ").split()).lower()
+
+# Returns the subscript names written in square brackets, such as "[Sectors,electricity]", as a list
+def SubscriptList(BracketText):
+	return [Subscript.strip().rstrip("!").strip() for Subscript in BracketText.strip("[]").split(",") if Subscript.strip()]
+
+# Returns the text of each equation of a .mdl file, with "\"-continued lines joined, as a list of
+# (definition, units, comment, flags) tuples
+def ReadEquationTexts(ModelText):
+	ModelText = ModelText.split(SketchMarker)[0].replace("{UTF-8}", "", 1)
+	ModelText = re.sub(r"\\\n[ \t]*", "", ModelText)
+	EquationTexts = []
+	for EquationText in ModelText.split("|"):
+		if not EquationText.strip():
+			continue
+		# Equations for some elements of a subscripted variable end with "~~", leaving out the units and comment
+		Sections = EquationText.split("~")
+		Sections += [""]*(4-len(Sections))
+		EquationTexts.append((Sections[0].strip(), Sections[1].strip(), Sections[2].strip(), "~".join(Sections[3:]).strip()))
+	return EquationTexts
+
+# Pieces of a formula: a quoted name, a subscript in square brackets, a comment in braces, a Vensim keyword such as
+# :NA: or :AND:, or a run of text between operators (a name, a function name, or a number)
+FormulaPieces = re.compile(r'"[^"]*"|\[[^\]]*\]|\{[^}]*\}|:[A-Z ]+:|[^()\[\]{},+\-*/^=<>;!:"\t\n]+')
+GetDirectCalls = re.compile(r"(GET DIRECT [A-Z]+)\s*\(([^)]*)\)")
+NumberPiece = re.compile(r"\s*[0-9.]+([eE][0-9]*)?\s*\Z")
+
+# Returns the variables used by a formula (as normal names), the functions it calls and the files read by any GET
+# DIRECT function.  Variables is the dictionary of all variables in the model, by normal name, used to tell
+# variables apart from function names.  A name followed by "(" that is not a variable is a function.
+def FormulaReferences(Formula, Variables):
+	Files = []
+	for Match in GetDirectCalls.finditer(Formula):
+		Arguments = re.findall(r"'([^']*)'", Match.group(2))
+		if Arguments:
+			Files.append(Arguments[0])
+	# The quoted arguments of GET DIRECT functions are not names, so they are removed before splitting the formula
+	Formula = GetDirectCalls.sub(r"\1()", Formula)
+
+	Dependencies = []
+	Functions = []
+	for Match in FormulaPieces.finditer(Formula):
+		Piece = Match.group(0)
+		if Piece[0] in "[{:" or not Piece.strip() or NumberPiece.match(Piece):
+			continue
+		Name = NormalName(Piece)
+		if Name in Variables:
+			if Name not in Dependencies:
+				Dependencies.append(Name)
+		elif Formula[Match.end():].lstrip().startswith("("):
+			Function = " ".join(Piece.split()).upper()
+			if Function not in Functions:
+				Functions.append(Function)
+	return Dependencies, Functions, Files
+
+# Returns the kind of an equation (see Kinds) from its operator, formula and the functions it calls
+def EquationKind(Operator, Formula, Functions):
+	if "INTEG" in Functions:
+		return "Level"
+	if any(Function in DelayFunctions for Function in Functions):
+		return "Delay"
+	if Operator == ":=" or "GET DIRECT DATA" in Functions or not Operator and not Formula:
+		return "Data"
+	if Operator == "(" or "GET DIRECT LOOKUPS" in Functions:
+		return "Lookup"
+	if "GET DIRECT CONSTANTS" in Functions or not re.search(r"[A-Za-z]", re.sub(r"\{[^}]*\}|[0-9.][eE][-+]?[0-9]", "", Formula)):
+		return "Constant"
+	if "INITIAL" in Functions:
+		return "Initial"
+	return "Auxiliary"
+
+# Splits the definition of an equation (the text before its units) into the variable name, the subscripts, the
+# :EXCEPT: subscripts, the operator ("=", ":=", "==", "(" for a lookup table, ":" for a subscript range, "<->" for
+# an equivalent subscript range, or "" for a variable with no equation) and the formula
+NameAndRest = re.compile(r'\s*("[^"]*"|[^\[\]=(:<~]+)(.*)\Z', re.S)
+def SplitDefinition(Definition):
+	Match = NameAndRest.match(Definition)
+	if not Match:
+		return None
+	Name = " ".join(Match.group(1).replace('"', "").split()) if Match.group(1).startswith('"') else " ".join(Match.group(1).split())
+	Rest = Match.group(2).strip()
+	Subscripts = []
+	Except = []
+	if Rest.startswith("["):
+		Subscripts = SubscriptList(Rest[:Rest.index("]")+1])
+		Rest = Rest[Rest.index("]")+1:].strip()
+	# Keywords such as :INTERPOLATE: or :EXCEPT: come between the subscripts and the operator
+	Keyword = re.match(r":([A-Z ]+):\s*", Rest)
+	while Keyword:
+		Rest = Rest[Keyword.end():]
+		if Keyword.group(1) == "EXCEPT":
+			ExceptMatch = re.match(r"(\[[^\]]*\]\s*,?\s*)+", Rest)
+			Except = [SubscriptList(BracketText) for BracketText in re.findall(r"\[[^\]]*\]", ExceptMatch.group(0))]
+			Rest = Rest[ExceptMatch.end():]
+		Keyword = re.match(r":([A-Z ]+):\s*", Rest)
+	for Operator in ("<->",":=","==","=",":","("):
+		if Rest.startswith(Operator):
+			Formula = Rest[len(Operator):] if Operator != "(" else Rest
+			return Name, Subscripts, Except, Operator, Formula.strip()
+	return Name, Subscripts, Except, "", Rest
+
+# Returns a subscript range, as an entry in the model graph's "SubscriptRanges", from the formula of its definition
+def SubscriptRange(Operator, Formula):
+	SubscriptRange = {"Elements": None, "File": None, "MapsTo": [], "EquivalentTo": None}
+	if Operator == "<->":
+		SubscriptRange["EquivalentTo"] = " ".join(Formula.split())
+		return SubscriptRange
+	Formula, Separator, MapsTo = Formula.partition("->")
+	if Separator:
+		SubscriptRange["MapsTo"] = [" ".join(Target.split()) for Target in re.sub(r"[()]", "", MapsTo.split(":")[-1]).split(",") if Target.strip()]
+	GetDirect = GetDirectCalls.search(Formula)
+	if GetDirect:
+		SubscriptRange["File"] = re.findall(r"'([^']*)'", GetDirect.group(2))[0]
+		return SubscriptRange
+	Elements = []
+	for Element in Formula.split(","):
+		Element = " ".join(Element.split())
+		# A numbered sequence of elements, such as (age1-age5)
+		Sequence = re.match(r"\((.*?)(\d+)\s*-\s*(.*?)(\d+)\)\Z", Element)
+		if Sequence:
+			Elements += [Sequence.group(1)+str(Number) for Number in range(int(Sequence.group(2)), int(Sequence.group(4))+1)]
+		elif Element:
+			Elements.append(Element)
+	SubscriptRange["Elements"] = Elements
+	return SubscriptRange
+
+# Splits the units of a variable into the units and the range written after them, such as "Dmnl [0,1]"
+def SplitUnits(Units):
+	Match = re.match(r"(.*?)\s*(\[[^\]]*\])?\s*\Z", Units, re.S)
+	return Match.group(1), Match.group(2) or ""
+
+
+# Building the Graph
+# ------------------
+
+# Returns the model graph of the text of a .mdl file
+def ParseModel(ModelText):
+	Definitions = []
+	SubscriptRanges = {}
+	Group = ""
+	for Definition, Units, Comment, Flags in ReadEquationTexts(ModelText):
+		# A group (a section of the model) is marked by a row of asterisks around its name
+		if Definition.startswith("*"):
+			Group = Definition.strip("*").strip().lstrip(".")
+			continue
+		Parts = SplitDefinition(Definition)
+		if Parts is None:
+			continue
+		Name, Subscripts, Except, Operator, Formula = Parts
+		if Operator in (":","<->"):
+			SubscriptRanges[Name] = SubscriptRange(Operator, Formula)
+			continue
+		Definitions.append((Name, Subscripts, Except, Operator, Formula, Units, Comment, Flags, Group))
+
+	# Every variable must be known before the formulas are split, so names can be told apart from functions
+	NormalNames = {}
+	for Definition in Definitions:
+		NormalNames.setdefault(NormalName(Definition[0]), Definition[0])
+
+	Variables = {}
+	for Name, Subscripts, Except, Operator, Formula, Units, Comment, Flags, Group in Definitions:
+		Name = NormalNames[NormalName(Name)]
+		Variable = Variables.setdefault(Name, {"Kind": None, "Units": "", "UnitsRange": "", "Comment": "", "Group": Group, "Supplementary": False, "Equations": [], "Dependencies": []})
+		Dependencies, Functions, Files = FormulaReferences(Formula, NormalNames)
+		Dependencies = [NormalNames[Dependency] for Dependency in Dependencies if NormalNames[Dependency] != Name]
+		Variable["Equations"].append({"Subscripts": Subscripts, "Except": Except, "Kind": EquationKind(Operator, Formula, Functions), "Formula": Formula, "Dependencies": Dependencies, "Functions": Functions, "Files": Files})
+		# Only the last equation of a subscripted variable usually has units and a comment
+		if Units:
+			Variable["Units"], Variable["UnitsRange"] = SplitUnits(Units)
+		if Comment:
+			Variable["Comment"] = Comment
+		if ":SUPPLEMENTARY" in Flags:
+			Variable["Supplementary"] = True
+
+	Dependents = {Name: [] for Name in Variables}
+	for Name, Variable in Variables.items():
+		Variable["Kind"] = min((Equation["Kind"] for Equation in Variable["Equations"]), key=Kinds.index)
+		Variable["Dependencies"] = sorted(set(Dependency for Equation in Variable["Equations"] for Dependency in Equation["Dependencies"]))
+		for Dependency in Variable["Dependencies"]:
+			Dependents[Dependency].append(Name)
+
+	return {"Variables": Variables, "Dependents": Dependents, "SubscriptRanges": SubscriptRanges, "NormalNames": {NormalName(Name): Name for Name in Variables}}
+
+# Returns the name of the cache file of a model file
+def CacheFileName(ModelFile):
+	return os.path.splitext(ModelFile)[0] + CacheFileSuffix
+
+# Returns the model graph of a .mdl file, reading it from the cache file if the model has not changed since the
+# cache was written, or parsing the model and writing the cache file otherwise.  Use a CacheFile of "" to parse the
+# model without reading or writing a cache.
+def LoadModelGraph(ModelFile, CacheFile = None):
+	ModelFileHandle = open(ModelFile, 'rb')
+	ModelBytes = ModelFileHandle.read()
+	ModelFileHandle.close()
+	ModelHash = hashlib.sha256(ModelBytes).hexdigest()
+	if CacheFile is None:
+		CacheFile = CacheFileName(ModelFile)
+
+	if CacheFile and os.path.exists(CacheFile):
+		try:
+			CacheFileHandle = open(CacheFile, 'rb')
+			Cached = pickle.load(CacheFileHandle)
+			CacheFileHandle.close()
+			if Cached.get("ParserVersion") == ParserVersion and Cached["Graph"]["ModelHash"] == ModelHash:
+				return Cached["Graph"]
+		except (OSError, EOFError, pickle.UnpicklingError, AttributeError, KeyError, TypeError):
+			pass
+
+	Graph = ParseModel(ModelBytes.decode("utf-8"))
+	Graph["ModelHash"] = ModelHash
+	if CacheFile:
+		# The cache is written to a temporary file first, so a script reading the cache never sees a partial file
+		CacheFileHandle = open(CacheFile + ".tmp", 'wb')
+		pickle.dump({"ParserVersion": ParserVersion, "Graph": Graph}, CacheFileHandle, protocol=pickle.HIGHEST_PROTOCOL)
+		CacheFileHandle.close()
+		os.replace(CacheFile + ".tmp", CacheFile)
+	return Graph
+
+
+# Using the Graph
+# ---------------
+
+# Returns the name of a variable as used in the model graph, however its name is written (for example, with different
+# capitalization or with subscripts), or None if there is no such variable
+def FindVariable(Graph, Name):
+	return Graph["NormalNames"].get(NormalName(Name.split("[")[0]))
+
+# Returns the set of variables that the variables in Names depend on, directly or through other variables, including
+# the variables in Names themselves
+def UpstreamVariables(Graph, Names):
+	Found = set(Names)
+	ToVisit = list(Found)
+	while ToVisit:
+		for Dependency in Graph["Variables"][ToVisit.pop()]["Dependencies"]:
+			if Dependency not in Found:
+				Found.add(Dependency)
+				ToVisit.append(Dependency)
+	return Found
+
+# Returns the set of variables that depend on the variables in Names, directly or through other variables, including
+# the variables in Names themselves
+def DownstreamVariables(Graph, Names):
+	Found = set(Names)
+	ToVisit = list(Found)
+	while ToVisit:
+		for Dependent in Graph["Dependents"][ToVisit.pop()]:
+			if Dependent not in Found:
+				Found.add(Dependent)
+				ToVisit.append(Dependent)
+	return Found
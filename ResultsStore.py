@@ -0,0 +1,97 @@
+# ResultsStore.py
+#
+# This is a Python module used by CreateDataLoggingScript.py.  It is not meant to be run on its own,
+# but its OpenResultsStore() function may be imported by other scripts to read a results store.
+#
+# A results store holds the results of many scenarios in a single array on disk, with one entry per
+# scenario, variable and year, so that results can be compared across scenarios without reading every
+# scenario's TSV file.  It is a folder containing two files:
+# - Results.npy, a NumPy array file, which can be opened as a memory map so that only the parts of the
+#   array that are used are read from disk.
+# - Index.json, which lists the scenarios, variables and years in the order of the array's dimensions,
+#   so that (for example) Index["Variables"].index("Output Total CO2e Emissions") gives the position of
+#   that variable.
+# Results that are missing from a scenario's TSV file (or that Vensim could not calculate) are NaN.
+#
+# This module requires NumPy.
+
+import json
+import os
+
+import numpy as np
+
+
+ResultsArrayFile = "Results.npy"
+ResultsIndexFile = "Index.json"
+
+
+# Returns the variable names in a TSV file written by VDF2TAB, and the years in its "Time" row.  Each
+# row holds a variable name, the run label columns, and one value per year.
+def ReadVariablesAndYears(ResultsFile):
+	Results = open(ResultsFile, 'r')
+	Years = []
+	VariableNames = []
+	for Line in Results:
+		Columns = Line.rstrip("\n").split("\t")
+		if Columns[0] == "Time":
+			if not Years:
+				Years = [Column for Column in Columns[1:] if Column.isdigit()]
+			continue
+		VariableNames.append(Columns[0])
+	Results.close()
+	return VariableNames, Years
+
+def ReadValue(Text):
+	try:
+		return float(Text)
+	except ValueError:
+		return np.nan
+
+# Writes the results store in StoreFolder from the TSV files of the scenarios listed in ResultsFiles (a
+# dictionary of {scenario name: TSV file name}).  We read the TSV files twice: once to list the variables
+# of every scenario, so the size of the array is known before it is created, and once to fill the array,
+# one scenario at a time, so only one scenario's results are held in memory.
+def WriteResultsStore(StoreFolder, ResultsFiles, FirstYear, FinalYear):
+	Years = [str(Year) for Year in range(int(FirstYear), int(FinalYear) + 1)]
+	VariableNumbers = {}
+	for ResultsFile in ResultsFiles.values():
+		for VariableName in ReadVariablesAndYears(ResultsFile)[0]:
+			VariableNumbers.setdefault(VariableName, len(VariableNumbers))
+
+	if not os.path.isdir(StoreFolder):
+		os.makedirs(StoreFolder)
+	Store = np.lib.format.open_memmap(os.path.join(StoreFolder, ResultsArrayFile), mode = 'w+', dtype = np.float64, shape = (len(ResultsFiles), len(VariableNumbers), len(Years)))
+	Store[:] = np.nan
+
+	for ScenarioNumber, ResultsFile in enumerate(ResultsFiles.values()):
+		FileYears = ReadVariablesAndYears(ResultsFile)[1]
+		YearColumns = [(Years.index(Year), FileYears.index(Year)) for Year in FileYears if Year in Years]
+		ArrayYears = [ArrayYear for ArrayYear, FileYear in YearColumns]
+		Results = open(ResultsFile, 'r')
+		for Line in Results:
+			Columns = Line.rstrip("\n").split("\t")
+			if Columns[0] == "Time":
+				continue
+			Values = Columns[-len(FileYears):]
+			Store[ScenarioNumber, VariableNumbers[Columns[0]], ArrayYears] = [ReadValue(Values[FileYear]) for ArrayYear, FileYear in YearColumns]
+		Results.close()
+	Store.flush()
+	del Store
+
+	Index = {
+		"Scenarios": list(ResultsFiles),
+		"ResultsFiles": list(ResultsFiles.values()),
+		"Variables": list(VariableNumbers),
+		"Years": [int(Year) for Year in Years]
+	}
+	IndexFile = open(os.path.join(StoreFolder, ResultsIndexFile), 'w')
+	json.dump(Index, IndexFile, indent = "\t")
+	IndexFile.close()
+	return Index
+
+# Returns the index of the results store in StoreFolder and its array, opened as a read-only memory map
+def OpenResultsStore(StoreFolder):
+	IndexFile = open(os.path.join(StoreFolder, ResultsIndexFile), 'r')
+	Index = json.load(IndexFile)
+	IndexFile.close()
+	return Index, np.load(os.path.join(StoreFolder, ResultsArrayFile), mmap_mode = 'r')
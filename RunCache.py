@@ -0,0 +1,182 @@
+# RunCache.py
+#
+# This is a Python module used by the scripts that generate Vensim command scripts.  It is not
+# meant to be run on its own.
+#
+# Many batches of runs repeat runs that were already performed in earlier batches, because
+# the same policy settings appear in several batches (and because a disabled policy and a
+# policy with a setting of zero produce identical results).  The run cache stores the results
+# of each run in a folder, under a key calculated from everything that determines those results:
+# the model file, the contents of the InputData files Vensim reads, the output variables and years being
+# logged, the policy implementation schedule, and the non-zero policy settings.  A command script
+# generator can then leave out every run whose key is already in the cache.
+#
+# Using the run cache takes two steps:
+# 1. When generating a command script, the generator calls RecordRun() for every run, marking it
+#    as a "Hit" (its results are already cached, so it is left out of the command script) or a
+#    "Miss" (it is written to the command script as usual).  These records are written to a
+#    run cache list file.
+# 2. After Vensim has finished the command script, UpdateRunResultsFromCache() copies the
+#    results of each "Miss" from the RunResultsFile into the cache, then adds the cached results
+#    of each "Hit" to the RunResultsFile, so it contains every run in the batch.
+
+import hashlib
+import os
+
+
+# Calculating Keys
+# ----------------
+
+# Adds the contents of a file to a hash, reading a block at a time so large files are not held in memory
+def HashFile(Hash, FileName):
+	InputFile = open(FileName, 'rb')
+	Block = InputFile.read(1048576)
+	while Block:
+		Hash.update(Block)
+		Block = InputFile.read(1048576)
+	InputFile.close()
+
+# Returns True if a file in the InputData folder is one that Vensim may read.  EPS.mdl only reads CSV files
+# from the InputData folder, so the scripts, spreadsheets and Python caches in it are skipped.  So are the
+# CSV files that the policy implementation schedule tools read and write for people to use, since Vensim
+# only reads the FoPITY-*.csv files generated from them.  Otherwise, running those tools (for example, to
+# validate or compare the schedules) would change the hash, and every run would miss the cache.
+ScheduleToolFiles = ["PolicyImplementationSchedules.csv", "PolicyImplementationSchedules-Modified.csv", "FoPITY-schedule-aliases.csv"]
+def IsModelInputFile(FileName):
+	return FileName.endswith(".csv") and not FileName.endswith("-WebApp.csv") and FileName not in ScheduleToolFiles
+
+# Returns a hash of everything that is shared by all runs in a batch.  It only needs to be calculated
+# once per batch.  We include the name of each file read from the InputData folder as well as its contents,
+# so that renaming or moving a file changes the hash.
+def HashModelEnvironment(ModelFile, InputDataFolder, OutputVarsFile, FirstYear, FinalYear):
+	Hash = hashlib.sha256()
+	HashFile(Hash, ModelFile)
+	for Folder, SubFolders, FileNames in os.walk(InputDataFolder):
+		SubFolders.sort()
+		if "__pycache__" in SubFolders:
+			SubFolders.remove("__pycache__")
+		for FileName in sorted(filter(IsModelInputFile, FileNames)):
+			Hash.update(os.path.relpath(os.path.join(Folder, FileName), InputDataFolder).replace(os.sep, "/").encode("utf-8"))
+			HashFile(Hash, os.path.join(Folder, FileName))
+	HashFile(Hash, OutputVarsFile)
+	Hash.update(("|" + str(FirstYear) + "|" + str(FinalYear)).encode("utf-8"))
+	return Hash.hexdigest()
+
+# Returns the key of a single run.  PolicySettings is a list of (variable name, setting value) pairs
+# for the policies set by the run.  Policies with a setting of zero are left out, since they produce
+# the same results as policies that are not set at all, and the remaining policies are sorted by name,
+# so the key does not depend on the order in which the policies were set.  Setting values are written
+# as floating point numbers, so that (for example) 1 and 1.0 produce the same key.  PolicySchedule
+# may be None if the run does not select a policy implementation schedule.
+def RunKey(EnvironmentHash, PolicySchedule, PolicySettings):
+	CanonicalSettings = sorted((VariableName, repr(float(Value))) for VariableName, Value in PolicySettings if float(Value) != 0)
+	Hash = hashlib.sha256()
+	Hash.update(EnvironmentHash.encode("utf-8"))
+	Hash.update(("|Policy Implementation Schedule Selector=" + str(PolicySchedule)).encode("utf-8"))
+	for VariableName, Value in CanonicalSettings:
+		Hash.update(("|" + VariableName + "=" + Value).encode("utf-8"))
+	return Hash.hexdigest()
+
+
+# Looking Up and Recording Runs
+# -----------------------------
+
+def CacheFileName(RunCacheFolder, Key):
+	return os.path.join(RunCacheFolder, Key + ".tsv")
+
+def IsCached(RunCacheFolder, Key):
+	return os.path.exists(CacheFileName(RunCacheFolder, Key))
+
+# Writes one line to an open run cache list file.  Status is "Hit" or "Miss".  RunLabel is the text
+# the command script passes to VDF2TAB after the ":", which Vensim places in the columns between the
+# variable name and the results in each row of the RunResultsFile.  RunLabel is written last because
+# it may itself contain tabs.
+def RecordRun(RunCacheList, Status, Key, RunLabel):
+	RunCacheList.write(Status + "\t" + Key + "\t" + RunLabel + "\n")
+
+
+# Updating Results
+# ----------------
+
+# Copies the results of every "Miss" in the RunCacheListFile from the RunResultsFile into the run
+# cache, then appends the cached results of every "Hit" to the RunResultsFile, labeled with that run's
+# RunLabel.  Each row of the RunResultsFile holds a variable name, the run label columns, and one
+# value per year, so we find the run label by removing the first column and the year columns.  The
+# rows of each run are written by Vensim together, so we write each run's cache file as its rows are
+# read, and we give the file its final name only once all its rows are written, so an interrupted
+# update never leaves a partial result in the cache.  If there were no "Miss" runs, Vensim did not
+# write any results for this batch, so any RunResultsFile found was left by an earlier batch, and we
+# replace it rather than adding to it.  Once the update is complete, the RunCacheListFile is removed,
+# so the cached results cannot be added to the RunResultsFile twice.
+# Returns the numbers of runs that were stored in and filled from the cache.
+def UpdateRunResultsFromCache(RunResultsFile, RunCacheListFile, RunCacheFolder, FirstYear, FinalYear):
+
+	if not os.path.isdir(RunCacheFolder):
+		os.makedirs(RunCacheFolder)
+	YearCount = int(FinalYear) - int(FirstYear) + 1
+
+	# Read the keys of the runs to be stored.  Runs to be filled are read again at the end,
+	# so we do not need to hold them in memory.
+	MissKeys = {}
+	RunCacheList = open(RunCacheListFile, 'r')
+	for Line in RunCacheList:
+		Status, Key, RunLabel = Line.rstrip("\n").split("\t", 2)
+		if Status == "Miss":
+			MissKeys[RunLabel] = Key
+	RunCacheList.close()
+
+	# Store the results of each "Miss" that is not already in the cache
+	RunsStored = 0
+	if MissKeys and os.path.exists(RunResultsFile):
+		StoredKeys = set()
+		CurrentKey = None
+		CacheFile = None
+		Results = open(RunResultsFile, 'r')
+		for Line in Results:
+			if Line.startswith("Time\t"):
+				continue
+			Columns = Line.rstrip("\n").split("\t")
+			Key = MissKeys.get("\t".join(Columns[1:-YearCount]))
+			if Key != CurrentKey:
+				if CacheFile is not None:
+					CacheFile.close()
+					os.replace(CacheFileName(RunCacheFolder, CurrentKey) + ".part", CacheFileName(RunCacheFolder, CurrentKey))
+					StoredKeys.add(CurrentKey)
+					RunsStored += 1
+					CacheFile = None
+				CurrentKey = Key
+				if Key is not None and Key not in StoredKeys and not IsCached(RunCacheFolder, Key):
+					CacheFile = open(CacheFileName(RunCacheFolder, Key) + ".part", 'w')
+			if CacheFile is not None:
+				CacheFile.write(Columns[0] + "\t" + "\t".join(Columns[-YearCount:]) + "\n")
+		if CacheFile is not None:
+			CacheFile.close()
+			os.replace(CacheFileName(RunCacheFolder, CurrentKey) + ".part", CacheFileName(RunCacheFolder, CurrentKey))
+			RunsStored += 1
+		Results.close()
+
+	# Append the cached results of each "Hit".  If Vensim did not perform any runs (because every run
+	# was a "Hit"), we begin a new RunResultsFile with a "Time" row, as Vensim would.  (A RunResultsFile
+	# merged from shards that performed no runs is empty, so it needs a "Time" row as well.)
+	RunsFilled = 0
+	TimeRowNeeded = not MissKeys or not os.path.exists(RunResultsFile) or os.path.getsize(RunResultsFile) == 0
+	Results = open(RunResultsFile, 'a' if MissKeys else 'w')
+	RunCacheList = open(RunCacheListFile, 'r')
+	for Line in RunCacheList:
+		Status, Key, RunLabel = Line.rstrip("\n").split("\t", 2)
+		if Status != "Hit" or not IsCached(RunCacheFolder, Key):
+			continue
+		if TimeRowNeeded:
+			Results.write("Time\t" + RunLabel + "\t" + "\t".join(str(Year) for Year in range(int(FirstYear), int(FinalYear) + 1)) + "\n")
+			TimeRowNeeded = False
+		CacheFile = open(CacheFileName(RunCacheFolder, Key), 'r')
+		for CachedLine in CacheFile:
+			VariableName, Values = CachedLine.rstrip("\n").split("\t", 1)
+			Results.write(VariableName + "\t" + RunLabel + "\t" + Values + "\n")
+		CacheFile.close()
+		RunsFilled += 1
+	RunCacheList.close()
+	Results.close()
+
+	os.remove(RunCacheListFile)
+	return RunsStored, RunsFilled
@@ -0,0 +1,129 @@
+# SimulatorBackends.py
+#
+# This is a Python module used by the scripts that drive Vensim directly, rather than only
+# generating a Vensim command script for the user to perform.  It is not meant to be run on its own.
+#
+# A simulator backend is a function that performs a Vensim command script and returns once the
+# results it requests have been written.  Scripts choose a backend by name from the Backends
+# dictionary at the bottom of this file, so another way of performing command scripts (such as a
+# remote server) can be added by writing a function with the same argument and adding it there.
+#
+# Two backends are provided:
+# - "Vensim" runs a copy of Vensim installed on this computer.  Vensim performs the command script
+#   given on its command line, and the script must end with MENU>EXIT so that Vensim closes when it
+#   is done.
+# - "Stub" performs the command script without Vensim, using a simple made-up model of emissions.
+#   Its results are not meaningful.  It is used to check that a script driving Vensim works (for
+#   example, on a computer without Vensim) before performing a long series of real runs.
+
+import math
+import os
+import subprocess
+
+
+# Settings
+# --------
+VensimExecutable = r"C:\Program Files\Vensim\vendss64.exe" # The Vensim program used by the "Vensim" backend
+
+# The made-up model used by the "Stub" backend.  Each sector's emissions start at StubBaseEmissions in
+# StubBaseYear and decline by StubAnnualDecline each year.  A carbon tax on the sector reduces its
+# emissions in each year by a fraction that rises with the average tax over that year and the
+# StubResponseYears - 1 years before it, approaching StubMaxReduction.  An average tax of
+# StubPriceResponse reduces emissions by about 63% of StubMaxReduction.
+StubBaseEmissions = 100
+StubBaseYear = 2020
+StubAnnualDecline = 0.01
+StubMaxReduction = 0.8
+StubPriceResponse = 100
+StubResponseYears = 3
+
+
+# Vensim Backend
+# --------------
+def RunWithVensim(CommandScript):
+	subprocess.run([VensimExecutable, CommandScript], check = True)
+
+
+# Stub Backend
+# ------------
+# We read the command script one line at a time, keeping the carbon tax rate set for each sector by
+# SETVAL instructions and by the changes files named in READCIN instructions.  The tax in each year is
+# the rate multiplied by the sector's policy implementation schedule, but the stub only knows a sector's
+# schedule if a changes file gives a lookup for it (as "FoPITY Fraction of Policy Implemented This
+# Year[Schedule1,cross carbon tax X electricity sector]((2021,0),(2030,1))", for example), and otherwise
+# uses the full rate in every year.  For each VDF2TAB instruction, we write the emissions of every sector
+# with a carbon tax setting to the TSV file it names, in the layout Vensim uses: a "Time" row (unless the
+# instruction appends to the file), then one row per variable with the run label and one value per year.
+# As in Vensim, SETVAL values and changes files are cleared after each run.
+
+# Returns the value of a lookup (a list of (x, y) points in order of x) at X.  As in Vensim, the value
+# is interpolated between points and held constant beyond the first and last points.
+def LookupValue(Points, X):
+	if X <= Points[0][0]:
+		return Points[0][1]
+	for (X1, Y1), (X2, Y2) in zip(Points, Points[1:]):
+		if X <= X2:
+			return Y1 + (Y2 - Y1) * (X - X1) / (X2 - X1)
+	return Points[-1][1]
+
+def StubEmissions(Prices, Year):
+	BaseEmissions = StubBaseEmissions * (1 - StubAnnualDecline) ** (Year - StubBaseYear)
+	Price = sum(Prices(PastYear) for PastYear in range(Year - StubResponseYears + 1, Year + 1)) / StubResponseYears
+	return BaseEmissions * (1 - StubMaxReduction * (1 - math.exp(-max(Price, 0) / StubPriceResponse)))
+
+def ReadStubChangesFile(ChangesFile, CarbonTaxRates, CarbonTaxSchedules):
+	if not ChangesFile or not os.path.exists(ChangesFile):
+		return
+	Changes = open(ChangesFile, 'r')
+	for Line in Changes:
+		Line = Line.strip()
+		if Line.startswith("Additional Carbon Tax Rate["):
+			Sector, Value = Line[len("Additional Carbon Tax Rate["):].split("]", 1)
+			CarbonTaxRates[Sector] = float(Value.strip().lstrip("=").strip())
+		elif Line.startswith("FoPITY Fraction of Policy Implemented This Year[") and "cross carbon tax X " in Line:
+			Sector = Line.split("cross carbon tax X ", 1)[1].split("]", 1)[0]
+			Points = Line.split("]", 1)[1].strip()[1:-1]
+			CarbonTaxSchedules[Sector] = [tuple(float(Number) for Number in Point.split(",")) for Point in Points.strip("()").split("),(")]
+	Changes.close()
+
+def RunWithStub(CommandScript):
+	CarbonTaxRates = {}
+	CarbonTaxSchedules = {}
+	RunCarbonTaxRates = {}
+	RunCarbonTaxSchedules = {}
+	Script = open(CommandScript, 'r')
+	for Line in Script:
+		Line = Line.rstrip("\n")
+		if Line.startswith("SIMULATE>SETVAL|Additional Carbon Tax Rate["):
+			Sector, Value = Line[len("SIMULATE>SETVAL|Additional Carbon Tax Rate["):].split("]=")
+			CarbonTaxRates[Sector] = float(Value)
+		elif Line.startswith("SIMULATE>READCIN|"):
+			ReadStubChangesFile(Line[len("SIMULATE>READCIN|"):], CarbonTaxRates, CarbonTaxSchedules)
+		elif Line.startswith("MENU>RUN|"):
+			RunCarbonTaxRates, RunCarbonTaxSchedules = CarbonTaxRates, CarbonTaxSchedules
+			CarbonTaxRates, CarbonTaxSchedules = {}, {}
+		elif Line.startswith("MENU>VDF2TAB|"):
+			Instruction, RunLabel = Line.split("|:", 1)
+			Arguments = Instruction.split("|")
+			ResultsFile, Options, FirstYear, FinalYear = Arguments[2], Arguments[4], int(Arguments[6]), int(Arguments[7])
+			if Options.startswith("+"):
+				Results = open(ResultsFile, 'a')
+			else:
+				Results = open(ResultsFile, 'w')
+				Results.write("Time\t" + RunLabel + "\t" + "\t".join(str(Year) for Year in range(FirstYear, FinalYear + 1)) + "\n")
+			for Sector, Rate in RunCarbonTaxRates.items():
+				if Sector in RunCarbonTaxSchedules:
+					Prices = lambda Year, Rate = Rate, Points = RunCarbonTaxSchedules[Sector]: Rate * LookupValue(Points, Year)
+				else:
+					Prices = lambda Year, Rate = Rate: Rate
+				Results.write("Output Total CO2e Emissions by Sector[" + Sector + "]\t" + RunLabel + "\t" + "\t".join(str(StubEmissions(Prices, Year)) for Year in range(FirstYear, FinalYear + 1)) + "\n")
+			Results.close()
+	Script.close()
+
+
+# Choosing a Backend
+# ------------------
+Backends = {
+	"Vensim": RunWithVensim,
+	"Stub": RunWithStub
+}
@@ -0,0 +1,115 @@
+# SliceModel.py
+#
+# This is a Python script that reads the output variables listed in an OutputVarsFile (such as
+# OutputVarsToExport.lst) and finds the part of the model each of them depends on, using the
+# model's dependency graph (see ModelGraph.py).  It writes two files:
+# - A SAVELIST for Vensim, listing the variables Vensim should save in each .vdfx file.  The
+#   scripts that generate Vensim command scripts can use it with a SIMULATE>SAVELIST instruction,
+#   so each .vdfx file holds only those variables rather than every variable in the model, which
+#   makes the .vdfx files smaller and quicker to write in large batches.
+# - A report (a TSV file) listing, for each output variable, how many of the model's variables and
+#   equations it depends on (directly or through other variables), the share of the model they make
+#   up, how many of them are stocks (levels and delays) and how many input data files they read.  The
+#   last row describes all the output variables together.
+#
+# Vensim calculates every variable in the model in every run, whatever is saved, so a SAVELIST does
+# not make runs faster to calculate.  For VDF2TAB to export the output variables, only the output
+# variables themselves need to be saved, so the smallest SAVELIST ("Outputs" below) lists just the
+# output variables, checked against the model and with repeated variables removed.  The SAVELIST may
+# instead list every variable the output variables depend on ("Slice" below), so the .vdfx files can
+# be used to trace why an output variable changed.
+#
+# Any output variable that is not in the model is listed in the report as an error, and no SAVELIST
+# is written, since Vensim would not export it.  The same is true if the OutputVarsFile is missing or
+# lists no output variables.
+
+
+# File Names
+# ----------
+ModelFile = "EPS.mdl" # The name of the Vensim model file
+OutputVarsFile = "OutputVarsToExport.lst" # The name of the file containing the list of output variables
+SaveListFile = "SaveList.lst" # The desired filename of the SAVELIST to be written
+SliceReportFile = "SliceReport.tsv" # The desired filename of the report to be written
+
+# Settings
+# --------
+SaveListContents = "Outputs" # "Outputs" lists only the output variables in the SAVELIST.
+							 # "Slice" lists every variable the output variables depend on, including themselves.
+
+
+# Main Program
+# ------------
+
+import re
+import sys
+
+import BatchPlanner
+import ModelGraph
+
+Graph = ModelGraph.LoadModelGraph(ModelFile)
+Variables = Graph["Variables"]
+OutputVars = BatchPlanner.ReadOutputVars(OutputVarsFile)
+
+# Give error and exit if there are no output variables or any output variable is not in the model
+MissingOutputVars = [OutputVar for OutputVar in OutputVars if ModelGraph.FindVariable(Graph, OutputVar) is None]
+if not OutputVars or MissingOutputVars or SaveListContents not in ("Outputs","Slice"):
+	f = open(SliceReportFile, 'w')
+	if SaveListContents not in ("Outputs","Slice"):
+		ErrorMessage = "Error: SaveListContents must be \"Outputs\" or \"Slice\"."
+	elif not OutputVars:
+		ErrorMessage = "Error: " + OutputVarsFile + " is missing or lists no output variables."
+	else:
+		ErrorMessage = "Error: The following output variables in " + OutputVarsFile + " are not in " + ModelFile + ": " + "; ".join(MissingOutputVars)
+	f.write(ErrorMessage)
+	f.close()
+	sys.exit(ErrorMessage)
+
+# Returns the columns of the report describing a set of variables (an output variable and the variables it depends on)
+ModelEquationCount = sum(len(Variable["Equations"]) for Variable in Variables.values())
+def SliceColumns(Slice):
+	EquationCount = sum(len(Variables[Name]["Equations"]) for Name in Slice)
+	StockCount = sum(1 for Name in Slice if Variables[Name]["Kind"] in ("Level","Delay"))
+	InputFiles = set(InputFile for Name in Slice for Equation in Variables[Name]["Equations"] for InputFile in Equation["Files"])
+	return [str(len(Slice)), "{:.1%}".format(len(Slice) / len(Variables)), str(EquationCount), "{:.1%}".format(EquationCount / ModelEquationCount), str(StockCount), str(len(InputFiles))]
+
+# Each output variable is listed in the SAVELIST once, as first written in the OutputVarsFile.  An output variable
+# listed with subscripts (such as "Direct Change in Energy Expenditures by Entity[labor and consumers]") is left out
+# if the whole variable is also listed.
+WholeOutputVars = set(ModelGraph.FindVariable(Graph, OutputVar) for OutputVar in OutputVars if "[" not in OutputVar)
+f = open(SliceReportFile, 'w')
+f.write("Output Variable\tModel Variable\tKind\tVariables Needed\tShare of Variables\tEquations Needed\tShare of Equations\tStocks Needed\tInput Files Read\n")
+SaveListVars = []
+SavedVars = set()
+AllOutputsSlice = set()
+for OutputVar in OutputVars:
+	ModelVar = ModelGraph.FindVariable(Graph, OutputVar)
+	Slice = ModelGraph.UpstreamVariables(Graph, [ModelVar])
+	AllOutputsSlice |= Slice
+	f.write("\t".join([OutputVar, ModelVar, Variables[ModelVar]["Kind"]] + SliceColumns(Slice)) + "\n")
+	if "[" in OutputVar:
+		SavedVar = ModelVar + OutputVar[OutputVar.index("["):].replace(" ", "")
+		if ModelVar in WholeOutputVars:
+			continue
+	else:
+		SavedVar = ModelVar
+	if SavedVar not in SavedVars:
+		SaveListVars.append(OutputVar)
+		SavedVars.add(SavedVar)
+f.write("\t".join(["All Output Variables", "", ""] + SliceColumns(AllOutputsSlice)) + "\n")
+f.close()
+
+# The model graph holds variable names without the quotation marks written around them in the model.  Vensim
+# needs names with characters other than letters, numbers, spaces, underscores, dollar signs and apostrophes
+# (such as "New Components Potential Energy Use after Standards and R&D") to be quoted, as they are in the model.
+def QuotedName(Name):
+	return '"' + Name + '"' if re.search(r"[^A-Za-z0-9 _$']", Name) else Name
+
+if SaveListContents == "Slice":
+	SaveListVars = [QuotedName(Name) for Name in sorted(AllOutputsSlice, key=ModelGraph.NormalName)]
+
+f = open(SaveListFile, 'w')
+for SaveListVar in SaveListVars:
+	f.write(SaveListVar + "\n")
+f.close()
+
+print("Wrote " + SaveListFile + " (" + str(len(SaveListVars)) + " variables) and " + SliceReportFile + ".  The output variables depend on " + str(len(AllOutputsSlice)) + " of the " + str(len(Variables)) + " variables in " + ModelFile + ".")